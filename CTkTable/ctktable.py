@@ -3,7 +3,104 @@
 # Author: Akash Bora
 
 import customtkinter
+import tkinter
+import tkinter.font
 import copy
+import sys
+from bisect import bisect_right
+
+
+class CTkTableCell:
+    """ Lightweight stand-in for the cell widget of a virtual table, it only holds the state of the cell """
+
+    __slots__ = ("table", "row", "column", "text", "fg_color", "hover_color", "text_color", "width", "height")
+
+    def __init__(self, table, row, column, text, fg_color, text_color, width, height):
+        self.table = table
+        self.row = row
+        self.column = column
+        self.text = str(text)
+        self.fg_color = fg_color
+        self.hover_color = None
+        self.text_color = text_color
+        self.width = width
+        self.height = height
+
+    def configure(self, require_redraw=False, **kwargs):
+        """ change the cell, options that only a real widget has are ignored """
+        relayout = False
+        if "text" in kwargs and str(kwargs["text"]) != self.text:
+            self.text = str(kwargs["text"])
+            relayout = True
+        for key in ("width", "height"):
+            if key in kwargs and kwargs[key] != getattr(self, key):
+                setattr(self, key, kwargs[key])
+                relayout = True
+        for key in ("fg_color", "hover_color", "text_color"):
+            if key in kwargs:
+                setattr(self, key, kwargs[key])
+        self.table.invalidate_cell(self.row, self.column, relayout)
+
+    config = configure
+
+    def cget(self, param):
+        if param == "hover_color":
+            return self.table.hover_color if self.hover_color is None else self.hover_color
+        if param in ("text", "fg_color", "text_color", "width", "height"):
+            return getattr(self, param)
+        return self.table.cget(param)
+
+    def get(self):
+        return self.text
+
+    def bind(self, sequence=None, command=None, add=True):
+        """ events are hit-tested on the table canvas and forwarded to the cell bindings """
+        self.table.bind_cell(self.row, self.column, sequence, command)
+
+    def unbind(self, sequence=None, funcid=None):
+        bindings = self.table.cell_bindings.get((self.row, self.column))
+        if bindings:
+            self.table.cell_bindings[(self.row, self.column)] = [
+                (seq, func) for seq, func in bindings if sequence is not None and seq != sequence]
+
+    def destroy(self):
+        pass
+
+    def winfo_exists(self):
+        canvas = self.table.canvas
+        return canvas is not None and bool(canvas.winfo_exists())
+
+    def winfo_ismapped(self):
+        return self.winfo_exists() and bool(self.table.canvas.winfo_ismapped())
+
+    def winfo_rootx(self):
+        return self.table.canvas.winfo_rootx() + self.table.cell_bbox(self.row, self.column)[0]
+
+    def winfo_rooty(self):
+        return self.table.canvas.winfo_rooty() + self.table.cell_bbox(self.row, self.column)[1]
+
+    def winfo_width(self):
+        x0, _, x1, _ = self.table.cell_bbox(self.row, self.column)
+        return x1 - x0
+
+    def winfo_height(self):
+        _, y0, _, y1 = self.table.cell_bbox(self.row, self.column)
+        return y1 - y0
+
+    winfo_reqwidth = winfo_width
+    winfo_reqheight = winfo_height
+
+    def winfo_pointerxy(self):
+        return self.table.winfo_pointerxy()
+
+    def winfo_toplevel(self):
+        return self.table.winfo_toplevel()
+
+    def winfo_name(self):
+        return f"cell{self.row}_{self.column}"
+
+    def _apply_appearance_mode(self, color):
+        return self.table._apply_appearance_mode(color)
 
 
 class CTkTable(customtkinter.CTkFrame):
@@ -12,7 +109,15 @@ class CTkTable(customtkinter.CTkFrame):
     __slots__ = ("master", "rows", "columns", "padx", "pady", "width", "height", "values", "colors", "orientation",
                 "color_phase", "border_width", "text_color", "border_color", "font", "header_color", "corner_radius",
                 "write", "command", "anchor", "hover_color", "hover", "justify", "wraplength", "data", "frame", 
-                "corner_buttons", "cell_bindings", "phase", "corner", "orient", "fg_color", "fg_color2", "inside_frame")
+                "corner_buttons", "cell_bindings", "phase", "corner", "orient", "fg_color", "fg_color2", "inside_frame",
+                "virtual", "canvas", "viewport", "column_offsets", "column_widths", "row_offsets", "row_heights",
+                "cell_items", "rendered_rows", "hover_cell", "pressed_cell", "canvas_sequences", "text_sizes",
+                "measure_font", "layout_pending", "render_pending")
+
+    # rows drawn above and below the visible area of a virtual table, so that small scrolls don't flicker
+    VIRTUAL_OVERSCAN = 200
+    # cell events a virtual table synthesizes itself from pointer motion
+    SYNTHESIZED_SEQUENCES = ("<Enter>", "<Leave>", "<Motion>", "<B1-Motion>", "<Destroy>")
 
     def __init__(
             self,
@@ -40,6 +145,7 @@ class CTkTable(customtkinter.CTkFrame):
             hover: bool = False,
             justify: str = "center",
             wraplength: int = 1000,
+            virtual: bool = False,
             **kwargs):
 
         super().__init__(master, fg_color="transparent")
@@ -101,155 +207,456 @@ class CTkTable(customtkinter.CTkFrame):
         self.frame = {}
         self.corner_buttons = {}
         self.cell_bindings = {}
+
+        # a virtual table draws every cell on one canvas and only renders the rows that are scrolled into view
+        self.virtual = virtual and not self.write
+        self.canvas = None
+        self.viewport = None
+        if self.virtual:
+            self.column_offsets = []
+            self.column_widths = []
+            self.row_offsets = []
+            self.row_heights = []
+            self.cell_items = {}
+            self.rendered_rows = set()
+            self.hover_cell = None
+            self.pressed_cell = None
+            self.text_sizes = {}
+            self.measure_font = None
+            self.layout_pending = False
+            self.render_pending = False
+            self.canvas = tkinter.Canvas(self.inside_frame, highlightthickness=0, borderwidth=0,
+                                         bg=self.virtual_background())
+            self.canvas.pack(expand=True, fill="both")
+            if self.command is not None and sys.platform.startswith("win"):
+                self.canvas.configure(cursor="hand2")
+            elif self.command is not None and sys.platform == "darwin":
+                self.canvas.configure(cursor="pointinghand")
+            self.canvas.bind("<Motion>", self.on_virtual_motion)
+            self.canvas.bind("<Leave>", self.on_virtual_leave)
+            self.canvas.bind("<Button-1>", self.on_virtual_click)
+            self.canvas.bind("<Map>", lambda e: self.schedule_virtual_render())
+            self.canvas.bind("<Configure>", lambda e: self.schedule_virtual_render())
+            self.canvas_sequences = set(self.SYNTHESIZED_SEQUENCES + ("<Button-1>",))
+            widget = self.master
+            while widget is not None:
+                if hasattr(widget, "add_scroll_listener"):
+                    self.viewport = widget
+                    self.viewport.add_scroll_listener(self.schedule_virtual_render)
+                    break
+                widget = widget.master
+
         self.draw_table(**kwargs)
 
+    def default_color(self, i, j):
+        """ internal function to get the color a cell starts with """
+        if self.header_color and (
+                (self.orient == "horizontal" and i == 0) or (self.orient != "horizontal" and j == 0)):
+            return self.header_color
+        if self.phase == "horizontal":
+            return self.fg_color if i % 2 == 0 else self.fg_color2
+        return self.fg_color if j % 2 == 0 else self.fg_color2
+
+    def default_value(self, i, j):
+        """ internal function to get the text a cell starts with """
+        if not self.values:
+            return " "
+        try:
+            if self.orient == "horizontal":
+                value = self.values[i][j]
+            else:
+                value = self.values[j][i]
+        except IndexError:
+            return " "
+        return " " if value == "" or value is None else value
+
     def draw_table(self, **kwargs):
         """ draw the table """
 
+        if self.virtual:
+            self.draw_virtual_table(**kwargs)
+            return
+
         for i in range(self.rows):
             self.inside_frame.grid_rowconfigure(i, weight=1)
         for j in range(self.columns):
             self.inside_frame.grid_columnconfigure(j, weight=1)
 
-        row_colors = [self.fg_color if i % 2 == 0 else self.fg_color2 for i in range(self.rows)]
-        column_colors = [self.fg_color if j % 2 == 0 else self.fg_color2 for j in range(self.columns)]
-
         for i in range(self.rows):
             for j in range(self.columns):
-                fg = row_colors[i] if self.phase == "horizontal" else column_colors[j]
+                self.draw_cell(i, j, **kwargs)
+        self.update_idletasks()
 
-                if self.header_color and (
-                        (self.orient == "horizontal" and i == 0) or (self.orient != "horizontal" and j == 0)):
-                    fg = self.header_color
+    def cell_style(self, i, j, fg):
+        """ internal function to get the corners and grid padding of a cell from its position """
+        corner_radius = self.corner
+        if (self.border_width >= 5) and (self.corner >= 5):
+            tr = self.border_color
+        else:
+            tr = ""
+        if i == 0 and j == 0:
+            corners = [tr, fg, fg, fg]
+            hover_modify = self.hover
 
-                corner_radius = self.corner
-                if (self.border_width >= 5) and (self.corner >= 5):
-                    tr = self.border_color
-                else:
-                    tr = ""
-                if i == 0 and j == 0:
-                    corners = [tr, fg, fg, fg]
-                    hover_modify = self.hover
+        elif i == self.rows - 1 and j == self.columns - 1:
+            corners = [fg, fg, tr, fg]
+            hover_modify = self.hover
 
-                elif i == self.rows - 1 and j == self.columns - 1:
-                    corners = [fg, fg, tr, fg]
-                    hover_modify = self.hover
+        elif i == self.rows - 1 and j == 0:
+            corners = [fg, fg, fg, tr]
+            hover_modify = self.hover
 
-                elif i == self.rows - 1 and j == 0:
-                    corners = [fg, fg, fg, tr]
-                    hover_modify = self.hover
+        elif i == 0 and j == self.columns - 1:
+            corners = [fg, tr, fg, fg]
+            hover_modify = self.hover
 
-                elif i == 0 and j == self.columns - 1:
-                    corners = [fg, tr, fg, fg]
-                    hover_modify = self.hover
+        else:
+            corners = [fg, fg, fg, fg]
+            corner_radius = 0
+            hover_modify = False
 
-                else:
-                    corners = [fg, fg, fg, fg]
-                    corner_radius = 0
-                    hover_modify = False
+        if i == 0:
+            pady = (0, self.pady)
+        else:
+            pady = self.pady
+
+        if j == 0:
+            padx = (0, self.padx)
+        else:
+            padx = self.padx
+
+        if i == self.rows - 1:
+            pady = (self.pady, 0)
+
+        if j == self.columns - 1:
+            padx = (self.padx, 0)
+
+        return corners, corner_radius, hover_modify, padx, pady
+
+    def draw_cell(self, i, j, **kwargs):
+        """ internal function to create the widget of a single cell """
+        fg = self.default_color(i, j)
+
+        corners, corner_radius, hover_modify, padx, pady = self.cell_style(i, j, fg)
+
+        value = self.default_value(i, j)
+
+        args = copy.deepcopy(kwargs)
+        args.setdefault("text_color", self.text_color)
+        args.setdefault("height", self.height)
+        args.setdefault("width", self.width)
+        args["fg_color"] = fg  # Ensure fg_color is set correctly
+
+        for key in ["corner_radius", "border_color", "border_width", "color_phase", "orientation", "write"]:
+            args.pop(key, None)
 
+        if self.write:
+            for key in ["anchor", "hover_color", "hover"]:
+                args.pop(key, None)
+            args.setdefault("justify", self.justify)
+
+            self.frame[i, j] = customtkinter.CTkEntry(
+                self.inside_frame,
+                font=self.font,
+                corner_radius=0,
+                **args
+            )
+            if value is None:
+                value = " "
+            self.frame[i, j].insert(0, str(value))
+            self.frame[i, j].bind("<Key>", lambda e, row=i, column=j:
+                                  self.after(100, lambda: self.manipulate_data(row, column)))
+            self.frame[i, j].grid(column=j, row=i, padx=padx, pady=pady, sticky="nsew")
+
+            if self.header_color:
                 if i == 0:
-                    pady = (0, self.pady)
-                else:
-                    pady = self.pady
+                    self.frame[i, j].configure(state="readonly")
 
-                if j == 0:
-                    padx = (0, self.padx)
-                else:
-                    padx = self.padx
+        else:
+            args.setdefault("anchor", self.anchor)
+            args.setdefault("hover_color", self.hover_color)
+            args.setdefault("hover", self.hover)
+            if "justify" in args:
+                anchor = args["justify"]
+                if anchor == "center":
+                    anchor = "c"
+                elif anchor == "left":
+                    anchor = "w"
+                elif anchor == "right":
+                    anchor = "e"
+                args.update({"anchor": anchor})
+                del args["justify"]
+            if value is None:
+                value = " "
+            self.frame[i, j] = customtkinter.CTkButton(
+                self.inside_frame,
+                background_corner_colors=corners,
+                font=self.font,
+                corner_radius=corner_radius,
+                text=value,
+                border_width=0,
+                command=(lambda row=i, col=j: self.command(
+                    row, col)) if self.command else None,
+                **args
+            )
+            self.frame[i, j].grid(column=j, row=i, padx=padx, pady=pady, sticky="nsew")
+            if self.frame[i, j]._text_label is not None:
+                self.frame[i, j]._text_label.config(wraplength=self.wraplength)
+
+            if hover_modify:
+                self.dynamic_hover(self.frame[i, j], i, j)
+
+        if (i, j) in self.cell_bindings:
+            for sequence, func in self.cell_bindings[(i, j)]:
+                self.frame[i, j].bind(sequence, func)
+
+        self.rowconfigure(i, weight=1)
+        self.columnconfigure(j, weight=1)
+
+    def draw_virtual_table(self, **kwargs):
+        """ internal function to create the cells of a virtual table, nothing is drawn until it is visible """
+        for i in range(self.rows):
+            for j in range(self.columns):
+                self.frame[i, j] = self.virtual_cell(i, j, **kwargs)
+        self.hover_cell = None
+        self.layout_virtual_table(force=True)
+        self.schedule_virtual_render()
+
+    def virtual_cell(self, i, j, **kwargs):
+        """ internal function to create the stand-in of a single cell of a virtual table """
+        return CTkTableCell(self, i, j, self.default_value(i, j), self.default_color(i, j),
+                            kwargs.get("text_color", self.text_color), kwargs.get("width", self.width),
+                            kwargs.get("height", self.height))
+
+    def virtual_background(self):
+        """ internal function to get the color shown between the cells of a virtual table """
+        color = self.inside_frame.cget("fg_color")
+        if color == "transparent":
+            color = self.inside_frame.cget("bg_color")
+        return self._apply_appearance_mode(color)
+
+    def measure_text(self, text):
+        """ internal function to get the pixel size of a cell text, sizes are cached per table """
+        size = self.text_sizes.get(text)
+        if size is None:
+            if self.measure_font is None:
+                font = self.font if self.font is not None else customtkinter.CTkFont()
+                self.measure_font = tkinter.font.Font(root=self, font=self._apply_font_scaling(font))
+            lines = text.split("\n")
+            wraplength = self._apply_widget_scaling(self.wraplength)
+            width = max(self.measure_font.measure(line) for line in lines)
+            line_count = len(lines) + (width // wraplength if width > wraplength else 0)
+            size = (min(width, wraplength), self.measure_font.metrics("linespace") * line_count)
+            self.text_sizes[text] = size
+        return size
+
+    def cell_corners(self, i, j):
+        """ internal function to get the rounded corners (nw, ne, se, sw) of a cell """
+        radius = self._apply_widget_scaling(self.corner)
+        last_row = i == self.rows - 1
+        last_column = j == self.columns - 1
+        return (radius if i == 0 and j == 0 else 0, radius if i == 0 and last_column else 0,
+                radius if last_row and last_column else 0, radius if last_row and j == 0 else 0)
+
+    def layout_virtual_table(self, force=False):
+        """ internal function to size the columns and rows of a virtual table """
+        self.layout_pending = False
+        column_widths = [0] * self.columns
+        row_heights = [0] * self.rows
+        padding = self._apply_widget_scaling(2)
+        for (i, j), cell in self.frame.items():
+            text_width, text_height = self.measure_text(cell.text)
+            padding_x = max(max(self.cell_corners(i, j)), padding)
+            column_widths[j] = max(column_widths[j], self._apply_widget_scaling(cell.width),
+                                   text_width + 2 * padding_x)
+            row_heights[i] = max(row_heights[i], self._apply_widget_scaling(cell.height), text_height + 2 * padding)
+
+        if not force and column_widths == self.column_widths and row_heights == self.row_heights:
+            for (i, j) in self.cell_items:
+                self.draw_virtual_cell(i, j)
+            return
 
-                if i == self.rows - 1:
-                    pady = (self.pady, 0)
+        gap_x = 2 * self._apply_widget_scaling(self.padx)
+        gap_y = 2 * self._apply_widget_scaling(self.pady)
+        self.column_widths = column_widths
+        self.row_heights = row_heights
+        self.column_offsets = [0]
+        for width in column_widths:
+            self.column_offsets.append(self.column_offsets[-1] + width + gap_x)
+        self.row_offsets = [0]
+        for height in row_heights:
+            self.row_offsets.append(self.row_offsets[-1] + height + gap_y)
+        self.canvas.delete("all")
+        self.cell_items.clear()
+        self.rendered_rows.clear()
+        self.canvas.configure(width=max(self.column_offsets[-1] - gap_x, 1),
+                              height=max(self.row_offsets[-1] - gap_y, 1))
+
+    def cell_bbox(self, i, j):
+        """ (x0, y0, x1, y1) of a cell on the canvas of a virtual table """
+        x0 = self.column_offsets[j]
+        y0 = self.row_offsets[i]
+        return x0, y0, x0 + self.column_widths[j], y0 + self.row_heights[i]
+
+    def cell_at(self, x, y):
+        """ internal function to hit-test a point of the canvas, returns (row, column) or None """
+        j = bisect_right(self.column_offsets, x) - 1
+        i = bisect_right(self.row_offsets, y) - 1
+        if not (0 <= i < self.rows and 0 <= j < self.columns) or (i, j) not in self.frame:
+            return None
+        x0, y0, x1, y1 = self.cell_bbox(i, j)
+        if x > x1 or y > y1:
+            return None
+        return i, j
+
+    def schedule_virtual_render(self):
+        """ internal function to coalesce redraws of a virtual table into one idle callback """
+        if self.canvas is not None and not self.render_pending:
+            self.render_pending = True
+            self.after_idle(self.render_virtual_rows)
+
+    def invalidate_cell(self, i, j, relayout=False):
+        """ internal function called by the cells of a virtual table when they change """
+        if relayout:
+            self.layout_pending = True
+            self.schedule_virtual_render()
+        elif (i, j) in self.cell_items:
+            self.draw_virtual_cell(i, j)
+
+    def render_virtual_rows(self):
+        """ internal function to draw the rows in view and drop the ones that scrolled out of it """
+        self.render_pending = False
+        if self.canvas is None or not self.canvas.winfo_exists():
+            return
+        if self.layout_pending:
+            self.layout_virtual_table()
+        if not self.canvas.winfo_ismapped() or not self.rows:
+            return
 
-                if j == self.columns - 1:
-                    padx = (self.padx, 0)
+        top, bottom = 0, self.row_offsets[-1]
+        if self.viewport is not None:
+            top, bottom = self.viewport.visible_bounds(self.canvas)
+        overscan = self._apply_widget_scaling(self.VIRTUAL_OVERSCAN)
+        first = max(bisect_right(self.row_offsets, top - overscan) - 1, 0)
+        last = min(bisect_right(self.row_offsets, bottom + overscan), self.rows)
 
-                if self.values:
-                    try:
-                        if self.orient == "horizontal":
-                            value = self.values[i][j]
-                        else:
-                            value = self.values[j][i]
-                    except IndexError:
-                        value = " "
-                else:
-                    value = " "
-
-                if value == "":
-                    value = " "
-
-                args = copy.deepcopy(kwargs)
-                args.setdefault("text_color", self.text_color)
-                args.setdefault("height", self.height)
-                args.setdefault("width", self.width)
-                args["fg_color"] = fg  # Ensure fg_color is set correctly
-
-                for key in ["corner_radius", "border_color", "border_width", "color_phase", "orientation", "write"]:
-                    args.pop(key, None)
-
-                if self.write:
-                    for key in ["anchor", "hover_color", "hover"]:
-                        args.pop(key, None)
-                    args.setdefault("justify", self.justify)
-
-                    self.frame[i, j] = customtkinter.CTkEntry(
-                        self.inside_frame,
-                        font=self.font,
-                        corner_radius=0,
-                        **args
-                    )
-                    if value is None:
-                        value = " "
-                    self.frame[i, j].insert(0, str(value))
-                    self.frame[i, j].bind("<Key>", lambda e, row=i, column=j:
-                                          self.after(100, lambda: self.manipulate_data(row, column)))
-                    self.frame[i, j].grid(column=j, row=i, padx=padx, pady=pady, sticky="nsew")
-
-                    if self.header_color:
-                        if i == 0:
-                            self.frame[i, j].configure(state="readonly")
+        for i in [row for row in self.rendered_rows if row < first or row >= last]:
+            self.canvas.delete(f"row{i}")
+            for j in range(self.columns):
+                self.cell_items.pop((i, j), None)
+            self.rendered_rows.discard(i)
+        for i in range(first, last):
+            if i not in self.rendered_rows:
+                for j in range(self.columns):
+                    if (i, j) in self.frame:
+                        self.draw_virtual_cell(i, j)
+                self.rendered_rows.add(i)
+
+    def draw_virtual_cell(self, i, j):
+        """ internal function to draw a cell of a virtual table, or update it if it is already drawn """
+        cell = self.frame[i, j]
+        if (i, j) == self.hover_cell and self.hover and (i, j) != self.pressed_cell:
+            fill = self._apply_appearance_mode(cell.cget("hover_color"))
+        else:
+            fill = self._apply_appearance_mode(cell.fg_color)
+        text_color = self._apply_appearance_mode(cell.text_color)
 
-                else:
-                    args.setdefault("anchor", self.anchor)
-                    args.setdefault("hover_color", self.hover_color)
-                    args.setdefault("hover", self.hover)
-                    if "justify" in args:
-                        anchor = args["justify"]
-                        if anchor == "center":
-                            anchor = "c"
-                        elif anchor == "left":
-                            anchor = "w"
-                        elif anchor == "right":
-                            anchor = "e"
-                        args.update({"anchor": anchor})
-                        del args["justify"]
-                    if value is None:
-                        value = " "
-                    self.frame[i, j] = customtkinter.CTkButton(
-                        self.inside_frame,
-                        background_corner_colors=corners,
-                        font=self.font,
-                        corner_radius=corner_radius,
-                        text=value,
-                        border_width=0,
-                        command=(lambda row=i, col=j: self.command(
-                            row, col)) if self.command else None,
-                        **args
-                    )
-                    self.frame[i, j].grid(column=j, row=i, padx=padx, pady=pady, sticky="nsew")
-                    if self.frame[i, j]._text_label is not None:
-                        self.frame[i, j]._text_label.config(wraplength=self.wraplength)
-
-                    if hover_modify:
-                        self.dynamic_hover(self.frame[i, j], i, j)
-
-                if (i, j) in self.cell_bindings:
-                    for sequence, func in self.cell_bindings[(i, j)]:
-                        self.frame[i, j].bind(sequence, func)
-
-                self.rowconfigure(i, weight=1)
-                self.columnconfigure(j, weight=1)
-        self.update_idletasks()
+        items = self.cell_items.get((i, j))
+        if items is not None:
+            self.canvas.itemconfigure(items[0], fill=fill, outline=fill)
+            self.canvas.itemconfigure(items[1], text=cell.text, fill=text_color)
+            return
+
+        x0, y0, x1, y1 = self.cell_bbox(i, j)
+        tag = f"row{i}"
+        corners = self.cell_corners(i, j)
+        if any(corners):
+            nw, ne, se, sw = corners
+            points = (x0 + nw, y0, x0 + nw, y0, x1 - ne, y0, x1 - ne, y0, x1, y0, x1, y0 + ne, x1, y0 + ne,
+                      x1, y1 - se, x1, y1 - se, x1, y1, x1 - se, y1, x1 - se, y1, x0 + sw, y1, x0 + sw, y1,
+                      x0, y1, x0, y1 - sw, x0, y1 - sw, x0, y0 + nw, x0, y0 + nw, x0, y0)
+            shape = self.canvas.create_polygon(points, smooth=True, fill=fill, outline=fill, tags=tag)
+        else:
+            shape = self.canvas.create_rectangle(x0, y0, x1, y1, fill=fill, outline=fill, width=0, tags=tag)
+
+        anchor = "center" if self.anchor in ("c", "center") else self.anchor
+        padding = max(max(corners), self._apply_widget_scaling(2))
+        x = x0 + padding if "w" in anchor else x1 - padding if "e" in anchor else (x0 + x1) / 2
+        y = y0 + padding if "n" in anchor else y1 - padding if "s" in anchor else (y0 + y1) / 2
+        text = self.canvas.create_text(x, y, text=cell.text, fill=text_color, anchor=anchor, justify="center",
+                                       width=self._apply_widget_scaling(self.wraplength),
+                                       font=self.measure_font, tags=tag)
+        self.cell_items[i, j] = (shape, text)
+
+    def fire_cell_event(self, cell, sequence, event):
+        """ internal function to call the bindings of a virtual cell """
+        for seq, func in list(self.cell_bindings.get(cell, ())):
+            if seq == sequence:
+                func(event)
+
+    def on_virtual_motion(self, event):
+        """ internal function to track hover, <Enter> and <Leave> of the cells of a virtual table """
+        cell = self.cell_at(event.x, event.y)
+        if cell != self.hover_cell:
+            previous = self.hover_cell
+            self.hover_cell = cell
+            if previous is not None:
+                if previous in self.cell_items:
+                    self.draw_virtual_cell(*previous)
+                self.fire_cell_event(previous, "<Leave>", event)
+            if cell is not None:
+                if cell in self.cell_items:
+                    self.draw_virtual_cell(*cell)
+                self.fire_cell_event(cell, "<Enter>", event)
+        if cell is not None:
+            self.fire_cell_event(cell, "<Motion>", event)
+            if event.state & 0x0100:
+                self.fire_cell_event(cell, "<B1-Motion>", event)
+
+    def on_virtual_leave(self, event):
+        """ internal function called when the pointer leaves the canvas of a virtual table """
+        previous = self.hover_cell
+        self.hover_cell = None
+        if previous is not None:
+            if previous in self.cell_items:
+                self.draw_virtual_cell(*previous)
+            self.fire_cell_event(previous, "<Leave>", event)
+
+    def on_virtual_click(self, event):
+        """ internal function to run the command of the clicked cell of a virtual table """
+        cell = self.cell_at(event.x, event.y)
+        if cell is None:
+            return
+        self.fire_cell_event(cell, "<Button-1>", event)
+        if self.command:
+            # click animation: the cell loses its hover color for 100ms like a button does
+            self.pressed_cell = cell
+            if cell in self.cell_items:
+                self.draw_virtual_cell(*cell)
+            self.after(100, self.release_virtual_cell, cell)
+            self.command(*cell)
+
+    def release_virtual_cell(self, cell):
+        """ internal function to end the click animation of a virtual cell """
+        if self.pressed_cell == cell:
+            self.pressed_cell = None
+            if self.canvas is not None and cell in self.cell_items:
+                self.draw_virtual_cell(*cell)
+
+    def _set_appearance_mode(self, mode_string):
+        super()._set_appearance_mode(mode_string)
+        if self.canvas is not None:
+            self.canvas.configure(bg=self.virtual_background())
+            for (i, j) in self.cell_items:
+                self.draw_virtual_cell(i, j)
+
+    def _set_scaling(self, new_widget_scaling, new_window_scaling):
+        super()._set_scaling(new_widget_scaling, new_window_scaling)
+        if self.canvas is not None:
+            self.measure_font = None
+            self.text_sizes.clear()
+            self.layout_virtual_table(force=True)
+            self.schedule_virtual_render()
 
     def dynamic_hover(self, frame, i, j):
         """ internal function to change corner cell colors """
@@ -279,13 +686,24 @@ class CTkTable(customtkinter.CTkFrame):
             return
 
         frame.configure(background_corner_colors=corners, fg_color=fg)
-        frame.bind("<Enter>", lambda e, x=i, y=j, color=hover_corners, fg_color=hv: self.frame[x, y].configure(
-            background_corner_colors=color, fg_color=fg_color))
-        frame.bind("<Leave>", lambda e, x=i, y=j, color=corners, fg_color=fg: self.frame[x, y].configure(
-            background_corner_colors=color, fg_color=fg_color))
+        frame.bind("<Enter>", lambda e, x=i, y=j, color=hover_corners, fg_color=hv: self.corner_hover(
+            frame, x, y, color, fg_color))
+        frame.bind("<Leave>", lambda e, x=i, y=j, color=corners, fg_color=fg: self.corner_hover(
+            frame, x, y, color, fg_color))
+
+    def corner_hover(self, frame, i, j, corners, fg_color):
+        """ internal function to recolor a corner cell, skipped once the cell stopped being a corner """
+        if self.corner_buttons.get((i, j)) is frame:
+            frame.configure(background_corner_colors=corners, fg_color=fg_color)
     
     def unhover_cell(self, row, column):
         """ Remove the hover effect from a specified cell """
+        if self.virtual:
+            if self.hover_cell == (row, column):
+                self.hover_cell = None
+                if (row, column) in self.cell_items:
+                    self.draw_virtual_cell(row, column)
+            return
         if 0 <= row < self.rows and 0 <= column < self.columns:
             cell = self.frame.get((row, column))
             if cell:
@@ -360,15 +778,70 @@ class CTkTable(customtkinter.CTkFrame):
         new_columns = len(new_values[0]) if new_values else 0
 
         if new_rows != self.rows or new_columns != self.columns:
-            for i in self.frame.values():
-                i.destroy()
-            self.frame = {}
-            self.rows = new_rows
-            self.columns = new_columns
             self.values = new_values
-            self.draw_table()
-        else:
-            self.update_values(new_values)
+            self.reconcile_table(new_rows, new_columns)
+        self.update_values(new_values)
+
+    def reconcile_table(self, new_rows, new_columns, **kwargs):
+        """
+        Resize the table to new_rows x new_columns in place.
+        Only the cells outside the new size are destroyed and only the missing ones are created, the cells that
+        are kept keep their widget and bindings and are just restyled if they moved on or off the table's edge.
+        """
+        old_rows, old_columns = self.rows, self.columns
+        for key in [key for key in self.frame if key[0] >= new_rows or key[1] >= new_columns]:
+            self.corner_buttons.pop(key, None)
+            self.cell_bindings.pop(key, None)
+            self.frame.pop(key).destroy()
+        if not self.virtual:
+            for i in range(new_rows, old_rows):
+                self.inside_frame.grid_rowconfigure(i, weight=0)
+            for j in range(new_columns, old_columns):
+                self.inside_frame.grid_columnconfigure(j, weight=0)
+        self.rows = new_rows
+        self.columns = new_columns
+
+        if self.virtual:
+            for i in range(new_rows):
+                for j in range(new_columns):
+                    if (i, j) not in self.frame:
+                        self.frame[i, j] = self.virtual_cell(i, j, **kwargs)
+            if self.hover_cell not in self.frame:
+                self.hover_cell = None
+            # the corners are drawn from the table size, so the visible rows are redrawn anyway
+            self.layout_virtual_table(force=True)
+            self.schedule_virtual_render()
+            return
+
+        # only the added cells and the kept ones whose corners move with the last row or column are touched
+        kept_rows, kept_columns = min(old_rows, new_rows), min(old_columns, new_columns)
+        edge_rows = {old_rows - 1, new_rows - 1} if old_rows != new_rows else set()
+        edge_columns = {old_columns - 1, new_columns - 1} if old_columns != new_columns else set()
+        changed_columns = sorted(j for j in edge_columns.union(range(kept_columns, new_columns))
+                                 if 0 <= j < new_columns)
+        for i in range(kept_rows, new_rows):
+            self.inside_frame.grid_rowconfigure(i, weight=1)
+        for j in range(kept_columns, new_columns):
+            self.inside_frame.grid_columnconfigure(j, weight=1)
+        for i in range(new_rows):
+            for j in range(new_columns) if i >= kept_rows or i in edge_rows else changed_columns:
+                if (i, j) not in self.frame:
+                    self.draw_cell(i, j, **kwargs)
+                else:
+                    self.restyle_cell(i, j)
+
+    def restyle_cell(self, i, j):
+        """ internal function to update the corners and grid padding of an existing cell after a resize """
+        cell = self.frame[i, j]
+        fg = cell.cget("fg_color")
+        corners, corner_radius, hover_modify, padx, pady = self.cell_style(i, j, fg)
+        cell.grid(column=j, row=i, padx=padx, pady=pady, sticky="nsew")
+        if self.write:
+            return
+        self.corner_buttons.pop((i, j), None)
+        cell.configure(background_corner_colors=corners, corner_radius=corner_radius)
+        if hover_modify:
+            self.dynamic_hover(cell, i, j)
 
     def add_row(self, values, index=None, **kwargs):
         """ add a new row """
@@ -686,6 +1159,11 @@ class CTkTable(customtkinter.CTkFrame):
         if "height" in kwargs:
             self.height = kwargs.pop("height")
 
+        if self.canvas is not None:
+            self.canvas.configure(bg=self.virtual_background())
+            self.layout_pending = True
+            self.schedule_virtual_render()
+
         self.update_values(self.values, **kwargs)
 
     def cget(self, param):
@@ -747,6 +1225,12 @@ class CTkTable(customtkinter.CTkFrame):
         if (row, column) not in self.cell_bindings:
             self.cell_bindings[(row, column)] = []
         self.cell_bindings[(row, column)].append((sequence, func))
+        if self.virtual:
+            if sequence not in self.canvas_sequences:
+                self.canvas_sequences.add(sequence)
+                self.canvas.bind(sequence, lambda e, seq=sequence: self.fire_cell_event(
+                    self.cell_at(e.x, e.y), seq, e), add="+")
+            return
         cell = self.get_cell(row, column)
         if cell:
             cell.bind(sequence, func)
@@ -774,6 +1258,10 @@ class CTkTable(customtkinter.CTkFrame):
             cell.destroy()
         self.frame.clear()
         self.cell_bindings.clear()
+        if self.viewport is not None:
+            self.viewport.remove_scroll_listener(self.schedule_virtual_render)
+            self.viewport = None
+        self.canvas = None
         if self.inside_frame:
             self.inside_frame.destroy()
             self.inside_frame = None
@@ -0,0 +1,157 @@
+import argparse
+import os
+import random
+import re
+import sqlite3
+import statistics
+import sys
+import time
+import unicodedata
+from colorama import init, Fore, Style
+from difflib import SequenceMatcher
+from TeraTermUI import CourseSearchIndex
+
+DEFAULT_ROWS = 30000
+DEFAULT_BASELINE = 5
+CAMPUSES = ("BAYAMON", "RIO PIEDRAS", "MAYAGUEZ", "HUMACAO", "CAYEY", "ARECIBO", "PONCE", "CAROLINA", "UTUADO",
+            "AGUADILLA", "CIENCIAS MEDICAS")
+QUERIES = ("matematica", "contabilidad elemental", "estadistica", "biologia general", "programacion",
+           "quimica organica", "mate3001", "metodos cuant", "contabildad", "práctica docente", "ingles basico",
+           "microbiologia lab")
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="TeraTermUI CourseSearchIndex keystroke replay benchmark")
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS,
+                        help=f"Courses in the grown catalog (default: {DEFAULT_ROWS})")
+    parser.add_argument("--baseline", type=int, default=DEFAULT_BASELINE,
+                        help=f"Keystrokes also replayed through the old full scan (default: {DEFAULT_BASELINE})")
+    parser.add_argument("--database", type=str,
+                        default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "dist", "database.db"),
+                        help="Database with the courses to grow the catalog from (default: dist/database.db)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the grown catalog (default: 0)")
+    return parser.parse_args()
+
+
+# Repeats the real catalog once per campus until it has the wanted rows, every copy gets its own codes, the campus
+# name and a word borrowed from another course so the vocabulary grows with it like a multi campus catalog would
+def grow_catalog(courses, rows, rng):
+    words = [word for name, _ in courses for word in name.split()]
+    catalog = list(courses)
+    copy = 1
+    while len(catalog) < rows:
+        for name, code in courses:
+            if len(catalog) == rows:
+                break
+            code = code.strip()
+            catalog.append((f"{name} {rng.choice(words)} {CAMPUSES[copy % len(CAMPUSES)]}",
+                            f"{code[:4]}{(int(code[4:8]) + 37 * copy) % 10000:04d}"))
+        copy += 1
+    return catalog
+
+
+def normalize_string(s):
+    s = unicodedata.normalize("NFD", s)
+    s = s.encode("ascii", "ignore").decode("utf-8")
+    return s.lower()
+
+
+def tokenize(s):
+    return re.findall(r"\w+", normalize_string(s))
+
+
+# The scoring search_classes did before the index, every row and every token scored for each search word, pruned
+# leaves out the far fuzzy matches the index skips on purpose, tokens not sharing a bigram with the word
+def full_scan_search(normalized_courses_cache, search_term, pruned=False):
+    def shares_gram(words, target):
+        size = min(len(words), CourseSearchIndex.MAX_GRAM)
+        return any(words[start:start + size] in target for start in range(len(words) - size + 1))
+
+    def match_score(words, target):
+        if words == target:
+            return 2.0
+        elif target.startswith(words):
+            return 1.5
+        elif words in target:
+            return 1.2
+        elif (not pruned or shares_gram(words, target)) and SequenceMatcher(None, words, target).ratio() >= 0.7:
+            return 1.0
+        return 0.0
+
+    search_words = tokenize(search_term)
+    results = []
+    for name, code, tokens_name, tokens_code in normalized_courses_cache:
+        total_score = 0
+        for word in search_words:
+            scores = [match_score(word, token) for token in tokens_name + tokens_code]
+            total_score += max(scores, default=0)
+        if total_score >= len(search_words):
+            results.append((total_score, name, code))
+
+    results = sorted(results, key=lambda x: -x[0])
+    return [(name, code) for _, name, code in results]
+
+
+def keystrokes():
+    return [query[:length] for query in QUERIES for length in range(1, len(query) + 1) if query[:length].strip()]
+
+
+def main():
+    init()
+    args = parse_arguments()
+    if not os.path.isfile(args.database):
+        print(Fore.RED + f"Database not found: {args.database}\n" + Style.RESET_ALL)
+        sys.exit(1)
+    with sqlite3.connect(args.database) as connection:
+        courses = connection.execute("SELECT name, code FROM courses").fetchall()
+    catalog = grow_catalog(courses, args.rows, random.Random(args.seed))
+    typed = keystrokes()
+
+    start = time.perf_counter()
+    index = CourseSearchIndex(catalog)
+    build_time = time.perf_counter() - start
+
+    latencies = []
+    for search_term in typed:
+        start = time.perf_counter()
+        index.search(search_term)
+        latencies.append(((time.perf_counter() - start) * 1000, search_term))
+    latencies.sort()
+    median = statistics.median(latency for latency, _ in latencies)
+
+    # Only a sample of the keystrokes goes through the full scan, on a catalog this size each one takes a while
+    normalized_courses_cache = [(name, code, tokenize(name), tokenize(code)) for name, code in catalog]
+    sample = random.Random(args.seed).sample(typed, min(args.baseline, len(typed)))
+    mismatches = []
+    scan_time = 0.0
+    skipped = found = 0
+    for search_term in sample:
+        start = time.perf_counter()
+        unpruned = full_scan_search(normalized_courses_cache, search_term)
+        scan_time += (time.perf_counter() - start) * 1000 / len(sample)
+        expected = full_scan_search(normalized_courses_cache, search_term, pruned=True)
+        if index.search(search_term) != expected[:CourseSearchIndex.MAX_RESULTS]:
+            mismatches.append(search_term)
+        skipped += len(unpruned) - len(expected)
+        found += len(unpruned)
+
+    print(Fore.BLUE + f"{len(typed)} keystrokes of {len(QUERIES)} typed queries over {len(catalog)} courses, "
+                      f"{len(index.tokens)} distinct tokens\n" + Style.RESET_ALL)
+    print(f"  index build:        {build_time * 1000:9.2f} ms, once per session")
+    print(f"  CourseSearchIndex:  {median:9.3f} ms median, {latencies[int(len(latencies) * 0.99)][0]:.3f} ms p99, "
+          f"{latencies[-1][0]:.3f} ms max per keystroke")
+    print(f"  old full scan:      {scan_time:9.3f} ms per keystroke ({len(sample)} sampled), "
+          f"{skipped} of its {found} matches were far fuzzy ones the index skips")
+    print(f"  slowest keystrokes: {', '.join(repr(term) for _, term in latencies[:-4:-1])}\n")
+
+    if mismatches:
+        print(Fore.RED + f"Results differ from the full scan for: {', '.join(map(repr, mismatches))}\n"
+              + Style.RESET_ALL)
+        sys.exit(1)
+    print(Fore.GREEN + "The index returns the same results as the full scan, far fuzzy matches aside\n"
+          + Style.RESET_ALL)
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import argparse
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from colorama import init, Fore, Style
+from TeraTermUI import DatabasePool
+
+DEFAULT_THREADS = 16
+DEFAULT_ROUNDS = 200
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="TeraTermUI DatabasePool concurrency stress test")
+    parser.add_argument("--threads", type=int, default=DEFAULT_THREADS,
+                        help=f"Number of threads sharing the pool (default: {DEFAULT_THREADS})")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS,
+                        help=f"Insert, commit and select rounds per thread (default: {DEFAULT_ROUNDS})")
+    parser.add_argument("--database", type=str,
+                        default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "dist", "database.db"),
+                        help="Database to copy for the run (default: dist/database.db)")
+    return parser.parse_args()
+
+
+# Every thread gets its connection from db_pool.connection() and writes its own rows, a round fails if the
+# thread can't see a row it just committed, and any "database is locked" error fails the whole run
+def worker(db_pool, barrier, thread_id, rounds, errors):
+    barrier.wait()
+    connection = None
+    for round_id in range(rounds):
+        try:
+            connection = db_pool.connection()
+            connection.execute("INSERT INTO stress_test (thread, round) VALUES (?, ?)", (thread_id, round_id))
+            connection.commit()
+            count = connection.execute("SELECT COUNT(*) FROM stress_test WHERE thread = ?",
+                                       (thread_id,)).fetchone()[0]
+            if count != round_id + 1:
+                errors.append(f"Thread {thread_id} saw {count} rows after round {round_id}")
+        except sqlite3.Error as err:
+            errors.append(f"Thread {thread_id}, round {round_id}: {err}")
+            if connection is not None:
+                connection.rollback()
+
+
+def run(database, threads, rounds):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, "database.db")
+        shutil.copy2(database, db_path)
+        db_pool = DatabasePool(db_path)
+        setup = db_pool.connection()
+        setup.execute("CREATE TABLE stress_test (thread INTEGER NOT NULL, round INTEGER NOT NULL)")
+        setup.commit()
+
+        errors = []
+        barrier = threading.Barrier(threads)
+        workers = [threading.Thread(target=worker, args=(db_pool, barrier, thread_id, rounds, errors))
+                   for thread_id in range(threads)]
+        start = time.perf_counter()
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        rows = setup.execute("SELECT COUNT(*) FROM stress_test").fetchone()[0]
+        per_thread = dict(setup.execute("SELECT thread, COUNT(*) FROM stress_test GROUP BY thread").fetchall())
+        db_pool.close_all()
+
+    missing = [thread_id for thread_id in range(threads) if per_thread.get(thread_id) != rounds]
+    if missing:
+        errors.append(f"Threads with missing rows: {missing}")
+    if rows != threads * rounds:
+        errors.append(f"Expected {threads * rounds} rows, found {rows}")
+    locked = [error for error in errors if "database is locked" in error]
+    return elapsed, rows, errors, locked
+
+
+def main():
+    init()
+    args = parse_arguments()
+    if not os.path.isfile(args.database):
+        print(Fore.RED + f"Database not found: {args.database}\n" + Style.RESET_ALL)
+        sys.exit(1)
+
+    elapsed, rows, errors, locked = run(args.database, args.threads, args.rounds)
+    print(Fore.BLUE + f"{args.threads} threads x {args.rounds} rounds finished in {elapsed:.2f} s, "
+                      f"{rows} rows written\n" + Style.RESET_ALL)
+    if locked:
+        print(Fore.RED + f"{len(locked)} \"database is locked\" errors, first: {locked[0]}\n" + Style.RESET_ALL)
+    if errors:
+        for error in errors[:10]:
+            print(Fore.RED + error + Style.RESET_ALL)
+        sys.exit(1)
+    print(Fore.GREEN + "No lock errors and all rows present\n" + Style.RESET_ALL)
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+import argparse
+import random
+import sys
+import time
+from colorama import init, Fore, Style
+from TeraTermUI import TeraTermUI
+
+DEFAULT_SIZES = "125,250,500,1000,2000,4000"
+DEFAULT_REPEAT = 5
+SESSION_TYPES = ("LEC", "LAB", "INT", "PRA", "SEM")
+DAYS = ("LW", "MJ", "LMWJ", "V", "S", "MJV")
+INSTRUCTORS = ("ROSA MARTINEZ JUAN", "ORTIZ RIVERA, A.", "COLON DIAZ MARIA", "SANTIAGO LOPEZ PEDRO", "")
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="TeraTermUI screen parser scaling benchmark")
+    parser.add_argument("--sizes", type=str, default=DEFAULT_SIZES,
+                        help=f"Comma separated amount of sections/courses per dump (default: {DEFAULT_SIZES})")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT,
+                        help=f"Runs per size, the fastest one is kept (default: {DEFAULT_REPEAT})")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic dumps (default: 0)")
+    return parser.parse_args()
+
+
+def time_range(rng):
+    start = rng.randrange(7 * 60, 19 * 60, 10)
+    end = start + rng.choice((50, 80, 110, 170))
+    return f"{format_hour(start)}-{format_hour(end)}"
+
+
+def format_hour(minutes):
+    hour = (minutes // 60 - 1) % 12 + 1
+    return f"{hour:02d}{minutes % 60:02d}{'AM' if minutes < 720 else 'PM'}"
+
+
+def section_code(index):
+    return f"{chr(65 + index % 26)}{chr(65 + index // 26 % 26)}{index // 676 % 10}"
+
+
+# Synthetic "LISTA DE SECCIONES" (1CS) clipboard dump, about a third of the sections have an extra day/time row
+def sections_dump(count, rng):
+    lines = [" ESPA3101 LISTA DE SECCIONES                    TERM: B61", " ALL (Y/N): Y", ""]
+    for index in range(count):
+        av = rng.choice(("30", "0", "12", "RSVD", "999"))
+        lines.append(f"{section_code(index)}  R  {rng.choice(SESSION_TYPES)}  3.00     {rng.choice(DAYS):<6} "
+                     f"{time_range(rng)}   {av:<4} {rng.choice(INSTRUCTORS)}")
+        if index % 3 == 0:
+            lines.append(f"                      {rng.choice(DAYS):<6} {time_range(rng)}")
+    return "\n".join(lines)
+
+
+# Synthetic enrolled classes (1CP) dump, every course has its own row and some have an extra day/time row
+def enrolled_dump(count, rng):
+    lines = []
+    for index in range(count):
+        course = f"{chr(65 + index % 26)}{chr(65 + index // 26 % 26)}PA{3000 + index % 1000:04d}"
+        lines.append(f"{chr(65 + index % 26)} {course}{section_code(index)} R COURSE NUMBER {index:<10} LE A "
+                     f"{rng.choice(DAYS):<5} {time_range(rng)}  A {100 + index % 300}")
+        if index % 4 == 0:
+            lines.append(f"                                         {rng.choice(DAYS):<5} {time_range(rng)} "
+                         f"{200 + index % 300}")
+    lines.append(f"CREDITOS TOTAL:   {count * 3}.00")
+    return "\n".join(lines)
+
+
+def best_time(function, text, repeat):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(text)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    init()
+    args = parse_arguments()
+    sizes = sorted(int(size) for size in args.sizes.split(",") if size.strip())
+    rng = random.Random(args.seed)
+    errors = []
+    per_item = {"sections": [], "enrolled": []}
+
+    print(Fore.BLUE + f"{'size':>8} {'1CS ms':>10} {'us/section':>11} {'1CP ms':>10} {'us/course':>10}\n"
+          + Style.RESET_ALL)
+    for size in sizes:
+        sections_time, (sections, *_) = best_time(TeraTermUI.extract_class_data, sections_dump(size, rng),
+                                                  args.repeat)
+        enrolled_time, (enrolled, _) = best_time(TeraTermUI.extract_my_enrolled_classes, enrolled_dump(size, rng),
+                                                 args.repeat)
+        courses = sum(1 for row in enrolled if row.code)
+        if len(sections) != size:
+            errors.append(f"Parsed {len(sections)} of {size} sections")
+        if courses != size:
+            errors.append(f"Parsed {courses} of {size} enrolled courses")
+        per_item["sections"].append(sections_time / size)
+        per_item["enrolled"].append(enrolled_time / size)
+        print(f"{size:>8} {sections_time * 1000:>10.2f} {sections_time / size * 1e6:>11.2f} "
+              f"{enrolled_time * 1000:>10.2f} {enrolled_time / size * 1e6:>10.2f}")
+
+    # Linear scaling keeps the cost per section flat, a quadratic parser would grow it with the dump size
+    for screen, costs in per_item.items():
+        growth = costs[-1] / costs[0]
+        print(f"\n{screen}: cost per item at {sizes[-1]} is {growth:.2f}x the one at {sizes[0]}", end="")
+        if growth > 2.0:
+            errors.append(f"{screen} cost per item grew {growth:.2f}x between {sizes[0]} and {sizes[-1]}")
+    print("\n")
+
+    if errors:
+        for error in errors:
+            print(Fore.RED + error + Style.RESET_ALL)
+        sys.exit(1)
+    print(Fore.GREEN + "Both parsers scale linearly with the dump size\n" + Style.RESET_ALL)
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from colorama import init, Fore, Style
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from TeraTermUI import SectionRecord, SectionSortIndex, TeraTermUI
+
+DEFAULT_TABLES = 20
+DEFAULT_ROWS = 60
+DEFAULT_ROUNDS = 50
+DAYS = ("LW", "MJ", "LMWJ", "V", "S")
+AV_VALUES = ("30", "0", "12", "5", "RSVD", "999", "RSTR", "1")
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="TeraTermUI SectionSortIndex benchmark against the old sort_tables")
+    parser.add_argument("--tables", type=int, default=DEFAULT_TABLES,
+                        help=f"Number of search tables, 20 is the app limit (default: {DEFAULT_TABLES})")
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS,
+                        help=f"Rows per table, extra day/time rows included (default: {DEFAULT_ROWS})")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS,
+                        help=f"Times the four sort options are cycled through (default: {DEFAULT_ROUNDS})")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic sections (default: 0)")
+    return parser.parse_args()
+
+
+def load_translation():
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "translations", "english.json"),
+              "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def time_range(rng):
+    if rng.random() < 0.05:
+        return "TBA"
+    start = rng.randrange(7 * 60, 19 * 60, 10)
+    end = start + rng.choice((50, 80, 110, 170))
+    return "-".join(f"{(minutes // 60 - 1) % 12 + 1:02d}{minutes % 60:02d}{'AM' if minutes < 720 else 'PM'}"
+                    for minutes in (start, end))
+
+
+# One search table worth of sections, about a quarter of them have a second day/time row like labs do
+def make_sections(rows, rng):
+    sections = []
+    total = 0
+    while total < rows:
+        section = SectionRecord(f"{chr(65 + len(sections) % 26)}{chr(65 + len(sections) // 26 % 26)}1", "R",
+                                "3.00", rng.choice(AV_VALUES), "ROSA MARTINEZ JUAN, ORTIZ, A.")
+        section.add_slot(rng.choice(DAYS), time_range(rng))
+        if rng.random() < 0.25 and total + 2 <= rows:
+            section.add_slot(rng.choice(DAYS), time_range(rng))
+        sections.append(section)
+        total += len(section.days)
+    return sections
+
+
+# The per table body of sort_tables before SectionSortIndex, it re-derives every key from the rendered rows,
+# parses each time with datetime.strptime twice and spins up a ThreadPoolExecutor to sort two small lists
+def old_sort_table(table_data, sort_by_option, translation):
+    headers = table_data[0]
+    time_index = headers.index(translation["times"]) if translation["times"] in headers else -1
+    av_index = headers.index(translation["av"]) if translation["av"] in headers else -1
+    section_index = headers.index(translation["sec"]) if translation["sec"] in headers else -1
+    memoized_times = {}
+
+    def get_time_minutes(t_row):
+        if time_index == -1 or not t_row[time_index] or t_row[time_index].strip().lower() == "tba":
+            return float("inf")
+
+        times_key = tuple(t_row[time_index].strip().split("\n"))
+        if times_key in memoized_times:
+            return memoized_times[times_key]
+
+        total_minutes = 0
+        for t in times_key:
+            if t in memoized_times:
+                minutes = memoized_times[t]
+            else:
+                try:
+                    minutes = int(datetime.strptime(t, "%I:%M %p").strftime("%H")) * 60 + \
+                              int(datetime.strptime(t, "%I:%M %p").strftime("%M"))
+                    memoized_times[t] = minutes
+                except ValueError:
+                    minutes = float("inf")
+                    memoized_times[t] = minutes
+            total_minutes += minutes
+            if minutes == float("inf"):
+                return minutes
+
+        memoized_times[times_key] = total_minutes
+        return total_minutes
+
+    def parse_av_value(av_value):
+        try:
+            av_int = int(av_value)
+            if 100 <= av_int <= 999:
+                return float("inf")
+            return av_int
+        except ValueError:
+            return float("inf")
+
+    entries_with_section = []
+    entries_without_section = {}
+    non_standard_positions = []
+    last_section_key = None
+
+    for i, row in enumerate(table_data[1:]):
+        if section_index != -1 and row[section_index].strip():
+            section_key = row[section_index].strip()
+            entries_with_section.append((section_key, row))
+            last_section_key = section_key
+        elif last_section_key:
+            if last_section_key not in entries_without_section:
+                entries_without_section[last_section_key] = []
+            entries_without_section[last_section_key].append(row)
+        else:
+            non_standard_positions.append((i + 1, row))
+
+    def sort_key(entry, primary_index, secondary_index):
+        primary_value = get_time_minutes(entry[1]) if primary_index == time_index else parse_av_value(
+            entry[1][primary_index])
+        secondary_value = get_time_minutes(entry[1]) if secondary_index == time_index else parse_av_value(
+            entry[1][secondary_index])
+
+        if primary_value == float("inf"):
+            primary_value = float("-inf") if reverse_sort else float("inf")
+        if secondary_value == float("inf"):
+            secondary_value = float("-inf") if reverse_sort else float("inf")
+
+        return primary_value, secondary_value
+
+    reverse_sort = False
+    if sort_by_option in [translation["time_asc"], translation["time_dec"]] and time_index != -1:
+        reverse_sort = (sort_by_option == translation["time_dec"])
+        sort_key_func = lambda x: sort_key(x, time_index, av_index)
+    elif sort_by_option in [translation["av_asc"], translation["av_dec"]] and av_index != -1:
+        reverse_sort = (sort_by_option == translation["av_dec"])
+        sort_key_func = lambda x: sort_key(x, av_index, time_index)
+
+    with ThreadPoolExecutor() as executor:
+        future1 = executor.submit(lambda: entries_with_section.sort(key=sort_key_func, reverse=reverse_sort))
+        future2 = executor.submit(lambda: non_standard_positions.sort(key=sort_key_func, reverse=reverse_sort))
+
+    future1.result()
+    future2.result()
+
+    final_data = [headers]
+    for section_key, row in entries_with_section:
+        final_data.append(row)
+        if section_key in entries_without_section:
+            final_data.extend(entries_without_section[section_key])
+    for _, row in non_standard_positions:
+        final_data.append(row)
+    return final_data
+
+
+def main():
+    init()
+    args = parse_arguments()
+    translation = load_translation()
+    rng = random.Random(args.seed)
+    headers = TeraTermUI.searched_class_headers(translation)
+    options = [translation["time_asc"], translation["time_dec"], translation["av_asc"], translation["av_dec"]]
+    tables = [make_sections(args.rows, rng) for _ in range(args.tables)]
+
+    start = time.perf_counter()
+    indexes = [SectionSortIndex(sections) for sections in tables]
+    build_time = time.perf_counter() - start
+
+    # The old path sorted whatever was rendered last, so every switch starts from the previous option's rows
+    rendered = [[headers] + index.rows() for index in indexes]
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        for option in options:
+            rendered = [old_sort_table(table_data, option, translation) for table_data in rendered]
+    old_time = (time.perf_counter() - start) / (args.rounds * len(options))
+
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        for option in options:
+            option_key = SectionSortIndex.option_key(option, translation)
+            [[headers] + index.rows(option_key) for index in indexes]
+    index_time = (time.perf_counter() - start) / (args.rounds * len(options))
+
+    mismatches = [option for option in options
+                  if [old_sort_table([headers] + index.rows(), option, translation) for index in indexes] !=
+                  [[headers] + index.rows(SectionSortIndex.option_key(option, translation)) for index in indexes]]
+
+    print(Fore.BLUE + f"{args.tables} tables x {args.rows} rows, {len(options)} sort options x {args.rounds} rounds\n"
+          + Style.RESET_ALL)
+    print(f"  SectionSortIndex build:  {build_time * 1000:8.3f} ms for all tables, once per search")
+    print(f"  old sort_tables:         {old_time * 1000:8.3f} ms per switch")
+    print(f"  SectionSortIndex.rows(): {index_time * 1000:8.3f} ms per switch ({old_time / index_time:.1f}x)\n")
+
+    if mismatches:
+        print(Fore.RED + f"Orders differ from the old sort for: {', '.join(mismatches)}\n" + Style.RESET_ALL)
+        sys.exit(1)
+    print(Fore.GREEN + "Both paths produce the same rows for every sort option\n" + Style.RESET_ALL)
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
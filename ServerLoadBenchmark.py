@@ -0,0 +1,167 @@
+import argparse
+import os
+import random
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from colorama import init, Fore, Style
+from concurrent.futures import ThreadPoolExecutor
+from TeraTermUI import LatencyWindow, ServerLoadMonitor
+
+DEFAULT_ROUNDS = 20
+DEFAULT_COUNT = 30
+DEFAULT_UPDATES = 100000
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="TeraTermUI ServerLoadMonitor benchmark against a local listener")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS,
+                        help=f"Number of sample() calls to time (default: {DEFAULT_ROUNDS})")
+    parser.add_argument("--count", type=int, default=DEFAULT_COUNT,
+                        help=f"Connects per sample, like the app (default: {DEFAULT_COUNT})")
+    parser.add_argument("--updates", type=int, default=DEFAULT_UPDATES,
+                        help=f"Latencies streamed into the 2500 entry window (default: {DEFAULT_UPDATES})")
+    return parser.parse_args()
+
+
+# Stand-in for uprbay.uprb.edu:22, accepts every connection and closes it right away like a refused handshake would
+class LocalListener:
+    def __init__(self):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.listen(1024)
+        self.port = self.sock.getsockname()[1]
+        self.running = True
+        self.thread = threading.Thread(target=self.serve, daemon=True)
+        self.thread.start()
+
+    def serve(self):
+        while self.running:
+            try:
+                connection, _ = self.sock.accept()
+            except OSError:
+                return
+            connection.close()
+
+    def close(self):
+        self.running = False
+        self.sock.close()
+
+
+# The sampler before the asyncio prober, one thread and one blocking connect_ex per probe
+def thread_pool_sample(host, port, count, peak_threads, max_workers=100):
+    def measure_latency():
+        peak_threads[0] = max(peak_threads[0], threading.active_count())
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(5)
+            start = time.time()
+            if sock.connect_ex((host, port)) == 0:
+                return (time.time() - start) * 1000
+        return None
+
+    with ThreadPoolExecutor(max_workers=min(count, max_workers)) as executor:
+        return [latency for latency in executor.map(lambda _: measure_latency(), range(count))]
+
+
+def exact_percentile(data, percent):
+    data = sorted(data)
+    k = (len(data) - 1) * (percent / 100.0)
+    f = int(k)
+    c = min(f + 1, len(data) - 1)
+    return data[f] * (c - k) + data[c] * (k - f) if f != c else data[f]
+
+
+def bench_sample(port, rounds, count):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        monitor = ServerLoadMonitor(csv_path=os.path.join(temp_dir, "server_load.csv"), host="127.0.0.1", port=port)
+        asyncio_peak = [threading.active_count()]
+        original_record = monitor.record
+
+        def record(latency):
+            asyncio_peak[0] = max(asyncio_peak[0], threading.active_count())
+            original_record(latency)
+
+        monitor.record = record
+        start = time.perf_counter()
+        for _ in range(rounds):
+            monitor.sample(count=count, force=True, jitter=0.0)
+        asyncio_time = time.perf_counter() - start
+        failures = monitor.failures
+
+    thread_peak = [threading.active_count()]
+    start = time.perf_counter()
+    for _ in range(rounds):
+        thread_pool_sample("127.0.0.1", port, count, thread_peak)
+    thread_time = time.perf_counter() - start
+    return asyncio_time, thread_time, failures, asyncio_peak[0], thread_peak[0]
+
+
+def bench_window(updates):
+    latencies = [random.lognormvariate(4.5, 0.6) for _ in range(updates)]
+    window = LatencyWindow(maxlen=2500)
+    start = time.perf_counter()
+    window.extend(latencies)
+    update_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        window.percentile(50)
+        window.percentile(90)
+        window.percentile(99)
+    window_query_time = (time.perf_counter() - start) / 1000
+
+    # What get_stats and is_responsive used to do on every call, statistics and a sort over the whole deque
+    values = deque(latencies[-2500:], maxlen=2500)
+    start = time.perf_counter()
+    for _ in range(100):
+        statistics.mean(values)
+        statistics.median(values)
+        statistics.stdev(values)
+        exact_percentile(values, 90)
+        exact_percentile(values, 99)
+    deque_query_time = (time.perf_counter() - start) / 100
+
+    errors = {percent: abs(window.percentile(percent) - exact_percentile(values, percent)) /
+              exact_percentile(values, percent) * 100 for percent in (50, 90, 99)}
+    return update_time / updates, window_query_time, deque_query_time, errors
+
+
+def main():
+    init()
+    args = parse_arguments()
+    listener = LocalListener()
+    try:
+        asyncio_time, thread_time, failures, asyncio_threads, pool_threads = bench_sample(listener.port, args.rounds,
+                                                                                         args.count)
+    finally:
+        listener.close()
+    print(Fore.BLUE + f"sample() x {args.rounds} rounds of {args.count} connects to 127.0.0.1:{listener.port}\n"
+          + Style.RESET_ALL)
+    print(f"  asyncio prober:     {asyncio_time / args.rounds * 1000:8.2f} ms per sample, {failures} failures, "
+          f"peak {asyncio_threads} threads")
+    print(f"  thread per connect: {thread_time / args.rounds * 1000:8.2f} ms per sample, peak {pool_threads} threads\n")
+
+    update_cost, window_query, deque_query, errors = bench_window(args.updates)
+    print(Fore.BLUE + f"LatencyWindow, {args.updates} latencies streamed through a 2500 entry window\n"
+          + Style.RESET_ALL)
+    print(f"  append:                 {update_cost * 1e6:8.2f} us per latency")
+    print(f"  p50 + p90 + p99:        {window_query * 1e6:8.2f} us")
+    print(f"  sort/statistics before: {deque_query * 1e6:8.2f} us")
+    print("  error vs exact:         " + ", ".join(f"p{percent} {error:.2f}%" for percent, error in errors.items())
+          + "\n")
+
+    if failures or max(errors.values()) > 1.0:
+        print(Fore.RED + "Probes failed against the local listener or a percentile is more than 1% off\n"
+              + Style.RESET_ALL)
+        sys.exit(1)
+    print(Fore.GREEN + "Benchmark completed\n" + Style.RESET_ALL)
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
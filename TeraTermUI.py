@@ -24,14 +24,17 @@
 import asyncio
 import atexit
 import base64
+import bisect
 import csv
 import ctypes
 import customtkinter
 import gc
 import hashlib
+import heapq
 import json
 import locale
 import logging
+import math
 import os
 import platform
 import psutil
@@ -40,6 +43,7 @@ import pyperclip
 import pystray
 import pytesseract
 import pytz
+import queue
 import random
 import re
 import requests
@@ -68,8 +72,8 @@ import win32gui
 import win32security
 import winsound
 import zlib
-from collections import defaultdict, deque
-from concurrent.futures import as_completed, ThreadPoolExecutor
+from collections import Counter, defaultdict, deque, OrderedDict
+from concurrent.futures import as_completed, Future, ThreadPoolExecutor
 from contextlib import contextmanager
 from Cryptodome.Cipher import AES
 from Cryptodome.Hash import HMAC, SHA256
@@ -84,6 +88,7 @@ from difflib import get_close_matches, SequenceMatcher
 from filelock import FileLock, Timeout
 from functools import lru_cache, wraps
 from hmac import compare_digest
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from mss import mss
 from pathlib import Path
 from PIL import Image
@@ -136,6 +141,22 @@ if sys.platform.startswith("win"):
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
 
+# Records a span on the active AutomationTracer for every call of the decorated function
+def trace_span(name, category="automation"):
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            tracer = AutomationTracer.active
+            if tracer is None:
+                return func(*args, **kwargs)
+            with tracer.span(name, category):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
 # Measures the time it takes for the app to log-in
 def measure_time(threshold):
     def decorator(func):
@@ -159,6 +180,9 @@ def measure_time(threshold):
 
 
 class TeraTermUI(customtkinter.CTk):
+    # Bumped whenever migrate_database() gains a step
+    DATABASE_SCHEMA = 1
+
     def __init__(self):
         super().__init__()
         self.title("Tera Term UI")
@@ -185,6 +209,7 @@ class TeraTermUI(customtkinter.CTk):
         self.stop_check_idle = threading.Event()
         self.stop_check_process = threading.Event()
         self.thread_pool = ThreadPoolExecutor(max_workers=5)
+        self.scheduler = Scheduler(tk_root=self, executor=self.thread_pool)
         self.future_tesseract = None
         self.future_backup = None
         self.future_feedback = None
@@ -216,8 +241,13 @@ class TeraTermUI(customtkinter.CTk):
             self.data_storage = SecureDataStore(key_path=os.path.join(tera_path, "masterkey.json"))
             self.server_monitor = ServerLoadMonitor(csv_path=os.path.join(tera_path, "server_load.csv"))
         else:
+            self.logs = TeraTermUI.get_absolute_path("logs.txt")
             self.data_storage = SecureDataStore()
             self.server_monitor = ServerLoadMonitor()
+        self.error_log = ErrorLogPipeline(self.logs)
+        self.tracer = AutomationTracer(os.path.join(os.path.dirname(self.logs), "trace.json"))
+        AutomationTracer.active = self.tracer
+        self.last_screen = None
 
         # Instance variables not yet needed but defined
         # to avoid the instance attribute defined outside __init__ warning
@@ -238,8 +268,10 @@ class TeraTermUI(customtkinter.CTk):
         self.booting_in_progress = False
         self.progress_bar = None
         self.loading_label = None
-        self.check_idle_thread = None
-        self.check_process_thread = None
+        self.check_idle_job = None
+        self.check_process_job = None
+        self.check_process_state = None
+        self.countdown_job = None
         self.idle_num_check = None
         self.idle_warning = None
         self.back_checkbox_state = None
@@ -284,6 +316,9 @@ class TeraTermUI(customtkinter.CTk):
             "arrows": {"path": os.path.join("images", "arrows.png"), "size": (18, 18)}
         }
         self.loaded_images= {}
+        for image_data in self.images.values():
+            customtkinter.CTkImage.image_cache.preload(TeraTermUI.get_absolute_path(image_data["path"]),
+                                                       image_data["size"])
         self.url_cache = {}
 
         # path for tesseract application
@@ -554,6 +589,8 @@ class TeraTermUI(customtkinter.CTk):
         self.m_register_menu = []
         self.m_tooltips = []
         self.schedule_map = TeraTermUI.generate_schedule()
+        self.main_schedule_conflicts = ScheduleConflictEngine()
+        self.change_schedule_conflicts = ScheduleConflictEngine()
         self.placeholder_texts_classes = ("ESPA3101", "INGL3101", "ADMI4005", "BIOL3011", "MATE3001",
                                           "CISO3121", "HUMA3101", "MECU3031")
         self.placeholder_texts_sections = ("LM1", "KM1", "LH1", "KH1", "LN1", "KN1", "LJ1", "KJ1")
@@ -569,10 +606,6 @@ class TeraTermUI(customtkinter.CTk):
         self.saved_classes = False
         self.auto_enroll = None
         self.auto_enroll_tooltip = None
-        self.changed_classes = None
-        self.changed_sections = None
-        self.changed_semesters = None
-        self.changed_registers = None
 
         # My Classes
         self.enrolled_header_tooltips = {}
@@ -611,6 +644,9 @@ class TeraTermUI(customtkinter.CTk):
         self.faq = None
         self.faq_text = None
         self.qa_table = None
+        self.timings_text = None
+        self.timings = None
+        self.timings_table = None
 
         # Help Window
         self.help_frame = None
@@ -619,8 +655,8 @@ class TeraTermUI(customtkinter.CTk):
         self.searchbox_text = None
         self.search_box = None
         self.class_list = None
-        self.courses_db_cache = None
-        self.normalized_courses_cache = None
+        self.courses_search_index = None
+        self.debounce_search = None
         self.curriculum_text = None
         self.curriculum = None
         self.terms_text = None
@@ -647,7 +683,7 @@ class TeraTermUI(customtkinter.CTk):
         # Top level window management, flags and counters
         self.DEFAULT_SEMESTER = TeraTermUI.calculate_default_semester()
         self.semester_values = TeraTermUI.generate_semester_values(self.DEFAULT_SEMESTER)
-        self.clipboard_handler = ClipboardHandler()
+        self.clipboard_handler = ClipboardHandler(scheduler=self.scheduler)
         self.prev_sample_count = None
         self.search_event_completed = True
         self.option_menu_event_completed = True
@@ -684,6 +720,8 @@ class TeraTermUI(customtkinter.CTk):
         self.teraterm5_first_boot = False
         self.last_teraterm_path = None
         self.tesseract_unzipped = False
+        self.ocr_worker = OcrWorker()
+        self.screen_capture = ScreenCapturePipeline(self.ocr_worker.recognize)
         self.in_multiple_screen = False
         self.started_auto_enroll = False
         self.error_auto_enroll = False
@@ -736,9 +774,10 @@ class TeraTermUI(customtkinter.CTk):
             es_path = "translations/spanish.json"
             if not os.path.isfile(en_path) or not os.path.isfile(es_path):
                 raise Exception("Language file not found")
-            self.connection_db = sqlite3.connect(db_path, check_same_thread=False)
-            self.cursor_db = self.connection_db.cursor()
-            self.check_database_lock()
+            self.db_pool = DatabasePool(db_path)
+            self.migrate_database()
+            self.user_config = UserConfigStore(db_path)
+            self.saved_classes_model = SavedClassesModel(self.db_pool)
             self.protocol("WM_DELETE_WINDOW", self.on_closing)
             self.bind("<Control-space>", lambda event: self.focus_set())
             self.bind("<Escape>", lambda event: self.on_closing())
@@ -746,17 +785,13 @@ class TeraTermUI(customtkinter.CTk):
             user_data_fields = ["directory", "location", "config", "pdf_dir", "host", "language", "appearance",
                                 "audio_tera", "audio_app", "scaling", "welcome", "default_semester", "skip_auth",
                                 "win_pos_x", "win_pos_y"]
-            results = {}
-            for field in user_data_fields:
-                query_user = f"SELECT {field} FROM user_config"
-                result = self.cursor_db.execute(query_user).fetchone()
-                results[field] = result[0] if result else None
+            results = {field: self.user_config.get(field) for field in user_data_fields}
             if results["location"]:
                 if results["location"] != self.teraterm_exe_location:
                     if os.path.exists(results["location"]):
                         self.teraterm_exe_location = results["location"]
                     else:
-                        self.cursor_db.execute("UPDATE user_config SET location=NULL")
+                        self.user_config.set("location", None)
             if results["directory"] and results["config"]:
                 if results["directory"] != self.teraterm_directory or results["config"] != self.teraterm_config:
                     if os.path.exists(results["directory"]) and os.path.exists(results["config"]):
@@ -766,9 +801,9 @@ class TeraTermUI(customtkinter.CTk):
                         self.can_edit = True
                     else:
                         if not os.path.exists(results["directory"]):
-                            self.cursor_db.execute("UPDATE user_config SET directory=NULL")
+                            self.user_config.set("directory", None)
                         if not os.path.exists(results["config"]):
-                            self.cursor_db.execute("UPDATE user_config SET config=NULL")
+                            self.user_config.set("config", None)
 
             # performs some operations on separate threads when application starts up
             self.boot_up(self.teraterm_config)
@@ -821,7 +856,7 @@ class TeraTermUI(customtkinter.CTk):
                 if os.path.isdir(results["pdf_dir"]):
                     self.last_save_pdf_dir = results["pdf_dir"]
                 else:
-                    self.cursor_db.execute("UPDATE user_config SET pdf_dir=NULL")
+                    self.user_config.set("pdf_dir", None)
             if results["skip_auth"] == "Yes":
                 self.skip_auth = True
             elif not results["skip_auth"]:
@@ -831,7 +866,7 @@ class TeraTermUI(customtkinter.CTk):
                 if results["default_semester"] in values:
                     self.DEFAULT_SEMESTER = results["default_semester"]
                 else:
-                    self.cursor_db.execute("UPDATE user_config SET default_semester=NULL")
+                    self.user_config.set("default_semester", None)
             if results["welcome"] != "Done":
                 self.help_button.configure(state="disabled")
                 self.status_button.configure(state="disabled")
@@ -848,11 +883,7 @@ class TeraTermUI(customtkinter.CTk):
                     self.log_in.configure(state="normal")
                     self.after(150, lambda: self.bind("<Return>", lambda event: self.login_event_handler()))
                     self.after(150, lambda: self.bind("<F1>", lambda event: self.help_button_event()))
-                    row_check = self.cursor_db.execute("SELECT 1 FROM user_config").fetchone()
-                    if not row_check:
-                        self.cursor_db.execute("INSERT INTO user_config (welcome) VALUES (?)", ("Done",))
-                    else:
-                        self.cursor_db.execute("UPDATE user_config SET welcome=?", ("Done",))
+                    self.user_config.set("welcome", "Done")
 
                 self.after(3500, lambda: show_message_box())
             else:
@@ -866,10 +897,10 @@ class TeraTermUI(customtkinter.CTk):
                         self.connection_db.commit()
                 # Check for update for the application
                 current_date = datetime.today().strftime("%Y-%m-%d")
-                date_record = self.cursor_db.execute("SELECT update_date FROM user_config").fetchone()
-                if date_record is None or date_record[0] is None or not date_record[0].strip() or (
+                date_record = self.user_config.get("update_date")
+                if date_record is None or not date_record.strip() or (
                         datetime.strptime(current_date, "%Y-%m-%d")
-                        - datetime.strptime(date_record[0], "%Y-%m-%d")).days >= 7:
+                        - datetime.strptime(date_record, "%Y-%m-%d")).days >= 7:
                     try:
                         self.check_update = True
                         if asyncio.run(self.test_connection()):
@@ -916,6 +947,9 @@ class TeraTermUI(customtkinter.CTk):
             p = psutil.Process(os.getpid())
             p.nice(psutil.HIGH_PRIORITY_CLASS)
         atexit.register(self.cleanup_temp)
+        atexit.register(self.error_log.stop)
+        atexit.register(self.tracer.export)
+        atexit.register(self.scheduler.stop)
         atexit.register(self.restore_teraterm_ini, self.teraterm_config)
         self.after(0, self.unload_image, "status")
         self.after(0, self.unload_image, "help")
@@ -1035,8 +1069,7 @@ class TeraTermUI(customtkinter.CTk):
                             option_3=translation["option_3"], icon_size=(65, 65), delay_destroy=True,
                             button_color=("#c30101", "#c30101", "#145DA0", "use_default"),
                             option_1_type="checkbox", hover_color=("darkred", "darkred", "use_default"))
-        on_exit = self.cursor_db.execute("SELECT exit FROM user_config").fetchone()
-        if on_exit and on_exit[0] is not None and on_exit[0] == 1:
+        if self.user_config.get("exit") == 1:
             msg.check_checkbox()
         self.destroy_tooltip()
         response, self.exit_checkbox_state = msg.get()
@@ -1055,6 +1088,7 @@ class TeraTermUI(customtkinter.CTk):
             self.clipboard_handler.close()
             self.server_monitor.save_stats()
             self.save_user_config()
+            self.user_config.close()
             self.end_app()
             if self.exit_checkbox_state:
                 if TeraTermUI.checkIfProcessRunning("ttermpro"):
@@ -1094,6 +1128,7 @@ class TeraTermUI(customtkinter.CTk):
         self.clipboard_handler.close()
         self.server_monitor.save_stats()
         self.save_user_config(include_exit=False)
+        self.user_config.close()
         self.end_app()
         sys.exit(0)
 
@@ -1176,45 +1211,62 @@ class TeraTermUI(customtkinter.CTk):
                     TeraTermUI.terminate_process()
                     break
 
-    def check_database_lock(self):
+    # Every thread gets its own connection and cursor from the pool, so the Tk thread, the thread_pool workers and the
+    # daemon threads never step on each other's statements or transactions
+    @property
+    def connection_db(self):
+        return self.db_pool.connection()
+
+    @property
+    def cursor_db(self):
+        return self.db_pool.cursor()
+
+    # Brings the database schema up to date, the revision is kept under "schema" in metadata since "version" belongs
+    # to the shipped data and is what the updater compares, a replaced database.db simply gets migrated again
+    def migrate_database(self):
+        row = self.cursor_db.execute("SELECT value FROM metadata WHERE key = 'schema'").fetchone()
+        schema = int(row[0]) if row and str(row[0]).isdigit() else 0
+        if schema >= TeraTermUI.DATABASE_SCHEMA:
+            return
+
         try:
-            self.cursor_db.execute("SELECT 1")
-        except sqlite3.OperationalError as err:
-            if "database is locked" in str(err):
-                raise Exception("Database is locked")
-            else:
-                raise err
+            self.cursor_db.execute("BEGIN")
+            if schema < 1:
+                columns = {column[1] for column in self.cursor_db.execute("PRAGMA table_info(courses)")}
+                for column in ("name_normalized", "code_normalized"):
+                    if column not in columns:
+                        self.cursor_db.execute(f"ALTER TABLE courses ADD COLUMN {column} TEXT")
+                courses = self.cursor_db.execute("SELECT id, name, code FROM courses").fetchall()
+                self.cursor_db.executemany(
+                    "UPDATE courses SET name_normalized = ?, code_normalized = ? WHERE id = ?",
+                    [(CourseSearchIndex.normalize_string(name or ""), CourseSearchIndex.normalize_string(code or ""),
+                      course_id) for course_id, name, code in courses])
+                self.cursor_db.execute("CREATE INDEX IF NOT EXISTS idx_courses_name ON courses(name)")
+                self.cursor_db.execute("CREATE INDEX IF NOT EXISTS idx_courses_code ON courses(code)")
+                self.cursor_db.execute("SAVEPOINT courses_fts")
+                try:
+                    self.cursor_db.execute("CREATE VIRTUAL TABLE IF NOT EXISTS courses_fts USING fts5("
+                                           "name_normalized, code_normalized, content='courses', content_rowid='id')")
+                    self.cursor_db.execute("INSERT INTO courses_fts(courses_fts) VALUES('rebuild')")
+                    self.cursor_db.execute("RELEASE courses_fts")
+                except sqlite3.OperationalError as err:
+                    # SQLite built without FTS5, the search falls back to the in-memory index
+                    self.cursor_db.execute("ROLLBACK TO courses_fts")
+                    self.cursor_db.execute("RELEASE courses_fts")
+                    logging.warning(f"Full-text search unavailable: {err}")
+            self.cursor_db.execute("INSERT OR REPLACE INTO metadata (key, value, date) VALUES ('schema', ?, ?)",
+                                   (str(TeraTermUI.DATABASE_SCHEMA), datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+            self.connection_db.commit()
+        except sqlite3.Error as err:
+            self.connection_db.rollback()
+            logging.error(f"Database migration failed: {err}")
 
-    # creates a txt file file containing logs for critical erros encountered in the app
+    # logs critical errors encountered in the app, the record is only queued here and written by the log pipeline
     def log_error(self):
-        import inspect
-
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         try:
-            exc_type, exc_value, exc_traceback = sys.exc_info()
-            full_traceback = "".join(traceback.format_exception(exc_type, exc_value, exc_traceback)).strip()
-            stack = inspect.stack()
-            current_frame = stack[1] if len(stack) > 1 else None
-            filename = current_frame.filename if current_frame else "UnknownFile"
-            function = current_frame.function if current_frame else "UnknownFunction"
-            lineno = current_frame.lineno if current_frame else -1
-
-            function_info = f"{filename}:{function}:{lineno}"
-            error_message = (f"[ERROR] [{self.mode}] [{self.USER_APP_VERSION}] [{timestamp}]\n"
-                             f"Location: {function_info}\n{full_traceback}")
-            separator = "-" * 125 + "\n"
-
-            if self.mode == "Installation":
-                appdata_path = os.environ.get("APPDATA")
-                tera_path = os.path.join(appdata_path, "TeraTermUI")
-                logs_path = os.path.join(tera_path, "logs.txt")
-            else:
-                logs_path = TeraTermUI.get_absolute_path("logs.txt")
-
-            with open(logs_path, "a", encoding="utf-8") as file:
-                file.write(f"{error_message}\n{separator}")
+            self.error_log.error(self.mode, self.USER_APP_VERSION, self.last_screen, sys.exc_info())
         except Exception as err:
-            logging.error(f"[LOG_ERROR_FAILURE] [{timestamp}] Could not write error log: {str(err)}")
+            logging.error(f"[LOG_ERROR_FAILURE] Could not queue error log: {str(err)}")
 
     # Checks if the user was logged in previously is the same as the current one
     @staticmethod
@@ -1255,7 +1307,7 @@ class TeraTermUI(customtkinter.CTk):
                             if not self.wait_for_window():
                                 return
 
-                            self.uprb.UprbayTeraTermVt.type_keys("{TAB}" + student_id + code + "{ENTER}")
+                            self.type_keys("{TAB}" + student_id + code + "{ENTER}")
                             text_output = self.wait_for_response(["SIGN-IN", "ON FILE", "PIN NUMBER",
                                                                   "ERRORS FOUND"], init_timeout=False, timeout=7)
                             if "SIGN-IN" in text_output:
@@ -1283,17 +1335,17 @@ class TeraTermUI(customtkinter.CTk):
                                 self.after(350, lambda: self.bind(
                                     "<Return>", lambda event: self.student_event_handler()))
                                 if "ON FILE" in text_output:
-                                    self.uprb.UprbayTeraTermVt.type_keys("{TAB 3}")
+                                    self.type_keys("{TAB 3}")
                                     self.after(0, lambda: self.student_id_entry.configure(border_color="#c30101"))
                                     self.after(100, self.show_error_message, 315, 230,
                                                translation["error_invalid_student_id"])
                                 elif "PIN NUMBER" in text_output:
-                                    self.uprb.UprbayTeraTermVt.type_keys("{TAB 2}")
+                                    self.type_keys("{TAB 2}")
                                     self.after(0, lambda: self.code_entry.configure(border_color="#c30101"))
                                     self.after(100, self.show_error_message, 315, 230,
                                                translation["error_invalid_code"])
                                 elif "ERRORS FOUND" in text_output:
-                                    self.uprb.UprbayTeraTermVt.type_keys("{TAB 3}")
+                                    self.type_keys("{TAB 3}")
                                     self.after(0, lambda: self.student_id_entry.configure(border_color="#c30101"))
                                     self.after(0, lambda: self.code_entry.configure(border_color="#c30101"))
                                     self.after(100, self.show_error_message, 305, 225,
@@ -1474,25 +1526,18 @@ class TeraTermUI(customtkinter.CTk):
                 "Current": "Actual"
             }
         }
-        save = self.cursor_db.execute("SELECT class, section, semester, action FROM saved_classes"
-                                   " WHERE class IS NOT NULL").fetchall()
-        save_check = self.cursor_db.execute('SELECT "id" FROM saved_classes').fetchone()
-        semester = self.cursor_db.execute("SELECT semester FROM saved_classes ORDER BY id LIMIT 1").fetchone()
-        if save_check and save_check[0] is not None:
-            if semester[0] != self.DEFAULT_SEMESTER:
+        model = self.saved_classes_model
+        model.load()
+        save = [row[1:5] for row in model.rows if row[1] is not None]
+        if model.rows:
+            if model.value(0, "semester") != self.DEFAULT_SEMESTER:
                 cutoff = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d %H:%M:%S")
-                old_entries = self.cursor_db.execute("SELECT id FROM saved_classes WHERE timestamp "
-                                                  "IS NULL OR timestamp < ?", (cutoff,)).fetchall()
-                if old_entries:
-                    self.cursor_db.execute("DELETE FROM saved_classes")
-                    self.connection_db.commit()
+                if any(row[5] is None or row[5] < cutoff for row in model.rows):
+                    model.clear()
                     return
-            if save_check[0] == 1:
+            if model.value(0, "id") == 1:
                 self.save_class_data.select()
-                self.changed_classes = set()
-                self.changed_sections = set()
-                self.changed_semesters = set()
-                self.changed_registers = set()
+                model.reset_changes()
                 for i in range(8):
                     self.m_register_menu[i].configure(
                         command=lambda value, idx=i: self.detect_register_menu_change(value, idx))
@@ -1574,6 +1619,7 @@ class TeraTermUI(customtkinter.CTk):
             self.update_loading_screen(loading_screen, future)
 
     # function for registering/dropping classes
+    @trace_span("submit_event", "flow")
     def submit_event(self):
         with self.lock_thread:
             try:
@@ -1599,7 +1645,7 @@ class TeraTermUI(customtkinter.CTk):
                                     and (re.fullmatch("^[A-Z][0-9]{2}$", semester) or semester == curr_sem)):
                                 if not self.wait_for_window():
                                     return
-                                self.uprb.UprbayTeraTermVt.type_keys("SRM{ENTER}1S4")
+                                self.type_keys("SRM{ENTER}1S4")
                                 if semester == curr_sem:
                                     result = self.handle_current_semester()
                                     if result == "error":
@@ -1610,7 +1656,7 @@ class TeraTermUI(customtkinter.CTk):
                                         return
                                     else:
                                         semester = result
-                                self.uprb.UprbayTeraTermVt.type_keys(semester + "{ENTER}")
+                                self.type_keys(semester + "{ENTER}")
                                 self.after(0, lambda: self.disable_go_next_buttons())
                                 text_output = self.capture_screenshot()
                                 count_enroll = text_output.count("ENROLLED") + text_output.count("RECOMMENDED")
@@ -1619,14 +1665,14 @@ class TeraTermUI(customtkinter.CTk):
                                         not in text_output and "ENTER REGISTRATION" in text_output and \
                                         count_enroll != 15:
                                     self.e_counter = 0
-                                    self.uprb.UprbayTeraTermVt.type_keys("{TAB 3}")
+                                    self.type_keys("{TAB 3}")
                                     for i in range(count_enroll, 0, -1):
-                                        self.uprb.UprbayTeraTermVt.type_keys("{TAB 2}")
+                                        self.type_keys("{TAB 2}")
                                     if choice == "register":
-                                        self.uprb.UprbayTeraTermVt.type_keys("R")
+                                        self.type_keys("R")
                                     elif choice == "drop":
-                                        self.uprb.UprbayTeraTermVt.type_keys("D")
-                                    self.uprb.UprbayTeraTermVt.type_keys(course + section + "{ENTER}")
+                                        self.type_keys("D")
+                                    self.type_keys(course + section + "{ENTER}")
                                     text_output = self.wait_for_response(["CONFIRMED", "DROPPED"])
                                     count_enroll = text_output.count("ENROLLED") + text_output.count("RECOMMENDED")
                                     dropped_classes = "DROPPED"
@@ -1642,7 +1688,7 @@ class TeraTermUI(customtkinter.CTk):
                                         self.e_counter -= count_dropped
                                         self.e_counter += count_enroll
                                         if choice == "register":
-                                            self.uprb.UprbayTeraTermVt.type_keys("{ENTER}")
+                                            self.type_keys("{ENTER}")
                                             time.sleep(1)
                                             self.classes_status[section] = {"classes": course, "status": "ENROLLED",
                                                                             "semester": semester}
@@ -1673,7 +1719,7 @@ class TeraTermUI(customtkinter.CTk):
                                         self.after(100, self.show_information_message, 350, 265,
                                                    translation["enrollment_limit"])
                                     if "INVALID TERM SELECTION" in text_output:
-                                        self.uprb.UprbayTeraTermVt.type_keys(
+                                        self.type_keys(
                                             self.DEFAULT_SEMESTER + "SRM{ENTER}")
                                         self.reset_activity_timer()
                                         self.after(100, self.show_error_message, 300, 215,
@@ -1681,7 +1727,7 @@ class TeraTermUI(customtkinter.CTk):
                                     else:
                                         if "USO INTERNO" not in text_output and "TERMINO LA MATRICULA" \
                                                 not in text_output:
-                                            self.uprb.UprbayTeraTermVt.type_keys(
+                                            self.type_keys(
                                                 self.DEFAULT_SEMESTER + "SRM{ENTER}")
                                             self.reset_activity_timer()
                                             self.after(100, self.show_error_message, 300, 210,
@@ -1763,6 +1809,7 @@ class TeraTermUI(customtkinter.CTk):
         self.search_event_completed = False
 
     # function for searching for classes
+    @trace_span("search_event", "flow")
     def search_event(self):
         with self.lock_thread:
             try:
@@ -1779,7 +1826,7 @@ class TeraTermUI(customtkinter.CTk):
                                 re.fullmatch("^[A-Z][0-9]{2}$", semester) or semester == curr_sem)):
                             if not self.wait_for_window():
                                 return
-                            self.uprb.UprbayTeraTermVt.type_keys("SRM{ENTER}1CS")
+                            self.type_keys("SRM{ENTER}1CS")
                             if semester == curr_sem:
                                 result = self.handle_current_semester()
                                 if result == "error":
@@ -1790,12 +1837,12 @@ class TeraTermUI(customtkinter.CTk):
                                     return
                                 else:
                                     semester = result
-                            self.uprb.UprbayTeraTermVt.type_keys(semester + "{ENTER}")
+                            self.type_keys(semester + "{ENTER}")
                             self.after(0, lambda: self.disable_go_next_buttons())
                             if self.search_function_counter == 0 or semester != self.get_semester_for_table:
                                 text_output = self.capture_screenshot()
                                 if "INVALID TERM SELECTION" in text_output:
-                                    self.uprb.UprbayTeraTermVt.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
+                                    self.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
                                     self.reset_activity_timer()
                                     self.after(100, self.show_error_message, 320, 235,
                                                translation["invalid_semester"])
@@ -1813,13 +1860,13 @@ class TeraTermUI(customtkinter.CTk):
                                 data, course_found, invalid_action, \
                                     y_n_found, y_n_value, term_value = TeraTermUI.extract_class_data(copy)
                                 if "INVALID ACTION" in copy and "LISTA DE SECCIONES" not in copy:
-                                    self.uprb.UprbayTeraTermVt.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
+                                    self.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
                                     self.reset_activity_timer()
                                     self.after(100, self.show_error_message, 320, 235,
                                                translation["failed_to_search"])
                                     return
                                 elif "INVALID ACTION" in copy and "LISTA DE SECCIONES" in copy:
-                                    self.uprb.UprbayTeraTermVt.type_keys("{TAB 2}SRM{ENTER}")
+                                    self.type_keys("{TAB 2}SRM{ENTER}")
                                     self.reset_activity_timer()
                                     self.after(100, self.show_error_message, 320, 235,
                                                translation["failed_to_search"])
@@ -1850,15 +1897,15 @@ class TeraTermUI(customtkinter.CTk):
                             if not (self.get_class_for_table == course and self.get_semester_for_table != semester and
                                     show_all == self.show_all_sections):
                                 if self.search_function_counter == 0:
-                                    self.uprb.UprbayTeraTermVt.type_keys(course)
+                                    self.type_keys(course)
                                 if self.search_function_counter >= 1:
-                                    self.uprb.UprbayTeraTermVt.type_keys("1CS" + course)
-                                self.uprb.UprbayTeraTermVt.type_keys("{TAB}")
+                                    self.type_keys("1CS" + course)
+                                self.type_keys("{TAB}")
                                 if show_all == "on":
-                                    self.uprb.UprbayTeraTermVt.type_keys("Y")
+                                    self.type_keys("Y")
                                 elif show_all == "off":
-                                    self.uprb.UprbayTeraTermVt.type_keys("N")
-                                self.uprb.UprbayTeraTermVt.type_keys("{ENTER}")
+                                    self.type_keys("N")
+                                self.type_keys("{ENTER}")
                             text_output = self.capture_screenshot()
                             if "MORE SECTIONS" in text_output:
                                 self.after(0, lambda: self.search_next_page_layout())
@@ -1880,7 +1927,7 @@ class TeraTermUI(customtkinter.CTk):
                                 self.search_function_counter += 1
                                 self.after(0, lambda: self.s_class_entry.configure(border_color="#c30101"))
                             elif "INVALID ACTION" in text_output or "INVALID TERM SELECTION" in text_output:
-                                self.uprb.UprbayTeraTermVt.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
+                                self.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
                                 self.reset_activity_timer()
                                 if "INVALID TERM SELECTION" in text_output:
                                     self.after(100, self.show_error_message, 320, 235,
@@ -2089,6 +2136,7 @@ class TeraTermUI(customtkinter.CTk):
                 self.my_classes_event_completed = False
 
     # function for seeing the classes you are currently enrolled for
+    @trace_span("my_classes_event", "flow")
     def my_classes_event(self, dialog_input):
         with self.lock_thread:
             try:
@@ -2101,7 +2149,7 @@ class TeraTermUI(customtkinter.CTk):
                         if re.fullmatch("^[A-Z][0-9]{2}$", dialog_input) or dialog_input == curr_sem:
                             if not self.wait_for_window():
                                 return
-                            self.uprb.UprbayTeraTermVt.type_keys("SRM{ENTER}1CP")
+                            self.type_keys("SRM{ENTER}1CP")
                             if dialog_input == curr_sem:
                                 result = self.handle_current_semester()
                                 if result == "error":
@@ -2112,7 +2160,7 @@ class TeraTermUI(customtkinter.CTk):
                                     return
                                 else:
                                     dialog_input = result
-                            self.uprb.UprbayTeraTermVt.type_keys(dialog_input + "{ENTER}")
+                            self.type_keys(dialog_input + "{ENTER}")
                             self.after(0, lambda: self.disable_go_next_buttons())
                             text_output = self.capture_screenshot()
                             if "INVALID TERM SELECTION" not in text_output and "INVALID ACTION" not in text_output:
@@ -2134,7 +2182,7 @@ class TeraTermUI(customtkinter.CTk):
                                 except Exception as err:
                                     logging.error(f"An error occurred while restoring clipboard content: {err}")
                             else:
-                                self.uprb.UprbayTeraTermVt.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
+                                self.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
                                 self.reset_activity_timer()
                                 if "INVALID ACTION" in text_output:
                                     self.after(100, self.show_error_message, 320, 235,
@@ -2371,9 +2419,8 @@ class TeraTermUI(customtkinter.CTk):
 
     # Detects if there is any changes from whats saved in the database from what is written in entries
     def detect_change(self, event=None):
-        self.cursor_db.execute("SELECT COUNT(*) FROM saved_classes")
-        count = self.cursor_db.fetchone()[0]
-        if count == 0:
+        model = self.saved_classes_model
+        if not model.rows:
             return
 
         triggered_widget = event.widget if event is not None else None
@@ -2382,19 +2429,15 @@ class TeraTermUI(customtkinter.CTk):
             if triggered_widget in self.m_classes_entry:
                 entry_list = self.m_classes_entry
                 column_name = "class"
-                changed_set = self.changed_classes
             elif triggered_widget in self.m_section_entry:
                 entry_list = self.m_section_entry
                 column_name = "section"
-                changed_set = self.changed_sections
             elif triggered_widget in self.m_semester_entry:
                 entry_list = self.m_semester_entry
                 column_name = "semester"
-                changed_set = self.changed_semesters
             elif triggered_widget in self.m_register_menu:
                 entry_list = self.m_register_menu
                 column_name = "action"
-                changed_set = self.changed_registers
             else:
                 triggered_widget = triggered_widget.master
                 continue
@@ -2404,51 +2447,36 @@ class TeraTermUI(customtkinter.CTk):
             if triggered_widget in self.m_semester_entry:
                 if entry_value in ["CURRENT", "ACTUAL"]:
                     entry_value = "CURRENT"
-            db_row_number = entry_index + 1
-            query = f"SELECT {column_name} FROM saved_classes LIMIT 1 OFFSET ?"
-            self.cursor_db.execute(query, (db_row_number - 1,))
-            result = self.cursor_db.fetchone()
-            if column_name == "semester" and result:
-                db_value = TeraTermUI.sanitize_input(result[0], to_upper=True)
+            db_value = model.value(entry_index, column_name)
+            if column_name == "semester" and entry_index < len(model.rows):
+                db_value = TeraTermUI.sanitize_input(db_value, to_upper=True)
                 if db_value in ["CURRENT", "ACTUAL"]:
                     db_value = "CURRENT"
-                result = (db_value,)
-            if result and entry_value != result[0]:
-                changed_set.add(entry_index)
-            else:
-                changed_set.discard(entry_index)
+            changed = entry_index < len(model.rows) and entry_value != db_value
+            model.mark_changed(entry_index, column_name, changed)
             self.update_save_data_state()
             break
 
     def detect_register_menu_change(self, selected_value, index):
         self.focus_set()
-        self.cursor_db.execute("SELECT COUNT(*) FROM saved_classes")
-        count = self.cursor_db.fetchone()[0]
-        if count == 0:
+        model = self.saved_classes_model
+        if not model.rows:
             return
 
         register_menu = self.m_register_menu[index]
         if register_menu.get() != selected_value:
             return
 
-        db_row_number = index + 1
-        self.cursor_db.execute("SELECT action FROM saved_classes LIMIT 1 OFFSET ?", (db_row_number - 1,))
-        result = self.cursor_db.fetchone()
-
-        if result:
-            db_value = result[0]
+        if index < len(model.rows):
+            db_value = model.value(index, "action")
             normalized_selected_value = "REGISTER" if selected_value.upper() in ["REGISTER", "REGISTRA"] else "DROP"
             normalized_db_value = "REGISTER" if db_value.upper() in ["REGISTER", "REGISTRA"] else "DROP"
-
-            if normalized_selected_value != normalized_db_value:
-                self.changed_registers.add(index)
-            else:
-                self.changed_registers.discard(index)
+            model.mark_changed(index, "action", normalized_selected_value != normalized_db_value)
         self.update_save_data_state()
 
     # If any changes were detected then update the checkbox, to let the user know about it
     def update_save_data_state(self):
-        if any([self.changed_classes, self.changed_sections, self.changed_semesters, self.changed_registers]):
+        if self.saved_classes_model.changes:
             if self.save_class_data.get() == "on":
                 self.save_class_data.deselect()
         else:
@@ -2486,6 +2514,7 @@ class TeraTermUI(customtkinter.CTk):
         self.update_loading_screen(loading_screen, future)
 
     # function that enrolls multiple classes with one click
+    @trace_span("submit_multiple_event", "flow")
     def submit_multiple_event(self):
         with self.lock_thread:
             try:
@@ -2506,7 +2535,7 @@ class TeraTermUI(customtkinter.CTk):
                         if can_enroll_classes:
                             if not self.wait_for_window():
                                 return
-                            self.uprb.UprbayTeraTermVt.type_keys("SRM{ENTER}1S4")
+                            self.type_keys("SRM{ENTER}1S4")
                             if semester == curr_sem:
                                 result = self.handle_current_semester()
                                 if result == "error":
@@ -2517,7 +2546,7 @@ class TeraTermUI(customtkinter.CTk):
                                     return
                                 else:
                                     semester = result
-                            self.uprb.UprbayTeraTermVt.type_keys(semester + "{ENTER}")
+                            self.type_keys(semester + "{ENTER}")
                             self.after(0, lambda: self.disable_go_next_buttons())
                             text_output = self.capture_screenshot()
                             count_enroll = text_output.count("ENROLLED") + text_output.count("RECOMMENDED")
@@ -2526,21 +2555,21 @@ class TeraTermUI(customtkinter.CTk):
                                     and "ENTER REGISTRATION" in text_output and count_enroll != 15:
                                 self.e_counter = 0
                                 self.m_counter = 0
-                                self.uprb.UprbayTeraTermVt.type_keys("{TAB 3}")
+                                self.type_keys("{TAB 3}")
                                 for i in range(count_enroll, 0, -1):
                                     self.e_counter += 1
-                                    self.uprb.UprbayTeraTermVt.type_keys("{TAB 2}")
+                                    self.type_keys("{TAB 2}")
                                 for i in range(self.a_counter + 1):
                                     if choices[i] in ["Register", "Registra"]:
-                                        self.uprb.UprbayTeraTermVt.type_keys("R")
+                                        self.type_keys("R")
                                     elif choices[i] in ["Drop", "Baja"]:
-                                        self.uprb.UprbayTeraTermVt.type_keys("D")
-                                    self.uprb.UprbayTeraTermVt.type_keys(classes[i] + sections[i])
+                                        self.type_keys("D")
+                                    self.type_keys(classes[i] + sections[i])
                                     self.m_counter += 1
                                     if i == self.a_counter:
-                                        self.uprb.UprbayTeraTermVt.type_keys("{ENTER}")
+                                        self.type_keys("{ENTER}")
                                     else:
-                                        self.uprb.UprbayTeraTermVt.type_keys("{TAB}")
+                                        self.type_keys("{TAB}")
                                 text_output = self.wait_for_response(["CONFIRMED", "DROPPED"])
                                 dropped_classes = "DROPPED"
                                 count_dropped = text_output.count(dropped_classes)
@@ -2574,12 +2603,12 @@ class TeraTermUI(customtkinter.CTk):
                                     self.after(2500, self.show_enrollment_error_information_multiple,
                                                text_output, classes)
                                     if "CONFIRMED" in text_output and "DROPPED" in text_output:
-                                        self.uprb.UprbayTeraTermVt.type_keys("{ENTER}")
+                                        self.type_keys("{ENTER}")
                                         time.sleep(1)
                                         self.after(100, self.show_success_message, 350, 265,
                                                    translation["enrolled_dropped_multiple_success"])
                                     elif "CONFIRMED" in text_output and "DROPPED" not in text_output:
-                                        self.uprb.UprbayTeraTermVt.type_keys("{ENTER}")
+                                        self.type_keys("{ENTER}")
                                         time.sleep(1)
                                         self.after(100, self.show_success_message, 350, 265,
                                                    translation["enrolled_multiple_success"])
@@ -2608,13 +2637,13 @@ class TeraTermUI(customtkinter.CTk):
                                     self.after(100, self.show_information_message, 350, 265,
                                                translation["enrollment_limit"])
                                 if "INVALID TERM SELECTION" in text_output:
-                                    self.uprb.UprbayTeraTermVt.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
+                                    self.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
                                     self.reset_activity_timer()
                                     self.after(100, self.show_error_message, 300, 215,
                                                translation["invalid_semester"])
                                 else:
                                     if "USO INTERNO" not in text_output and "TERMINO LA MATRICULA" not in text_output:
-                                        self.uprb.UprbayTeraTermVt.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
+                                        self.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
                                         self.reset_activity_timer()
                                     if "INVALID ACTION" in text_output and self.started_auto_enroll:
                                         self.after(0, lambda: self.submit_multiple_event_handler())
@@ -2667,6 +2696,7 @@ class TeraTermUI(customtkinter.CTk):
         self.option_menu_event_completed = False
 
     # changes to the respective screen the user chooses
+    @trace_span("option_menu_event", "flow")
     def option_menu_event(self):
         with self.lock_thread:
             try:
@@ -2715,7 +2745,7 @@ class TeraTermUI(customtkinter.CTk):
                             result = None
                             if semester == curr_sem:
                                 if not self.found_latest_semester:
-                                    self.uprb.UprbayTeraTermVt.type_keys("SRM{ENTER}")
+                                    self.type_keys("SRM{ENTER}")
                                 result = self.handle_current_semester()
                                 if result == "error":
                                     self.focus_or_not = True
@@ -2729,16 +2759,16 @@ class TeraTermUI(customtkinter.CTk):
                             match menu:
                                 case "SRM":
                                     if result is None:
-                                        self.uprb.UprbayTeraTermVt.type_keys("SRM{ENTER}")
+                                        self.type_keys("SRM{ENTER}")
                                     self.after(0, lambda: self.disable_go_next_buttons())
                                 case "004":
-                                    self.uprb.UprbayTeraTermVt.type_keys("SRM{ENTER}004" + semester + "{ENTER}")
+                                    self.type_keys("SRM{ENTER}004" + semester + "{ENTER}")
                                     self.after(0, lambda: self.disable_go_next_buttons())
                                 case "1GP":
-                                    self.uprb.UprbayTeraTermVt.type_keys("SRM{ENTER}1GP" + semester + "{ENTER}")
+                                    self.type_keys("SRM{ENTER}1GP" + semester + "{ENTER}")
                                     self.after(0, lambda: self.disable_go_next_buttons())
-                                    text_output = self.capture_screenshot()
-                                    if "INVALID TERM SELECTION" not in text_output:
+                                    screen_state = self.capture_screen_state()
+                                    if not screen_state.has("invalid_term"):
                                         def go_next_grid():
                                             self._1VE_screen = False
                                             self._1GP_screen = True
@@ -2754,36 +2784,36 @@ class TeraTermUI(customtkinter.CTk):
                                         self.after(0, lambda: go_next_grid())
                                     else:
                                         self.focus_or_not = True
-                                        self.uprb.UprbayTeraTermVt.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
+                                        self.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
                                         self.reset_activity_timer()
                                         self.after(100, self.show_error_message, 300, 215,
                                                    translation["invalid_semester"])
                                 case "118":
-                                    self.uprb.UprbayTeraTermVt.type_keys("SRM{ENTER}118" + semester + "{ENTER}")
+                                    self.type_keys("SRM{ENTER}118" + semester + "{ENTER}")
                                     self.after(0, lambda: self.disable_go_next_buttons())
-                                    text_output = self.capture_screenshot()
-                                    if "INVALID TERM SELECTION" in text_output:
+                                    screen_state = self.capture_screen_state()
+                                    if screen_state.has("invalid_term"):
                                         self.focus_or_not = True
-                                        self.uprb.UprbayTeraTermVt.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
+                                        self.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
                                         self.reset_activity_timer()
                                         self.after(100, self.show_error_message, 300, 215,
                                                    translation["invalid_semester"])
                                 case "1VE":
-                                    self.uprb.UprbayTeraTermVt.type_keys("SRM{ENTER}1VE" + semester + "{ENTER}")
+                                    self.type_keys("SRM{ENTER}1VE" + semester + "{ENTER}")
                                     self.after(0, lambda: self.disable_go_next_buttons())
-                                    text_output = self.capture_screenshot()
-                                    if "CONFLICT" in text_output:
+                                    screen_state = self.capture_screen_state()
+                                    if screen_state.has("conflict"):
                                         self.focus_or_not = True
-                                        self.uprb.UprbayTeraTermVt.type_keys("004" + semester + "{ENTER}")
+                                        self.type_keys("004" + semester + "{ENTER}")
                                         self.after(100, self.show_information_message, 310, 225,
                                                    translation["hold_flag"])
-                                    if "INVALID TERM SELECTION" in text_output:
+                                    if screen_state.has("invalid_term"):
                                         self.focus_or_not = True
-                                        self.uprb.UprbayTeraTermVt.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
+                                        self.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
                                         self.reset_activity_timer()
                                         self.after(100, self.show_error_message, 300, 215,
                                                    translation["invalid_semester"])
-                                    if "CONFLICT" not in text_output or "INVALID TERM SELECTION" not in text_output:
+                                    if not screen_state.has("conflict") or not screen_state.has("invalid_term"):
                                         def go_next_grid():
                                             self._1VE_screen = True
                                             self._1GP_screen = False
@@ -2798,20 +2828,20 @@ class TeraTermUI(customtkinter.CTk):
 
                                         self.after(0, lambda: go_next_grid())
                                 case "3DD":
-                                    self.uprb.UprbayTeraTermVt.type_keys("SRM{ENTER}3DD" + semester + "{ENTER}")
+                                    self.type_keys("SRM{ENTER}3DD" + semester + "{ENTER}")
                                     self.after(0, lambda: self.disable_go_next_buttons())
-                                    text_output = self.capture_screenshot()
-                                    if "INVALID TERM SELECTION" in text_output:
+                                    screen_state = self.capture_screen_state()
+                                    if screen_state.has("invalid_term"):
                                         self.focus_or_not = True
-                                        self.uprb.UprbayTeraTermVt.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
+                                        self.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
                                         self.reset_activity_timer()
                                         self.after(100, self.show_error_message, 300, 215,
                                                    translation["invalid_semester"])
                                 case "409":
-                                    self.uprb.UprbayTeraTermVt.type_keys("SRM{ENTER}409" + semester + "{ENTER}")
+                                    self.type_keys("SRM{ENTER}409" + semester + "{ENTER}")
                                     self.after(0, lambda: self.disable_go_next_buttons())
-                                    text_output = self.capture_screenshot()
-                                    if "INVALID TERM SELECTION" not in text_output:
+                                    screen_state = self.capture_screen_state()
+                                    if not screen_state.has("invalid_term"):
                                         def go_next_grid():
                                             self._1VE_screen = False
                                             self._1GP_screen = False
@@ -2827,20 +2857,20 @@ class TeraTermUI(customtkinter.CTk):
                                         self.after(0, lambda: go_next_grid())
                                     else:
                                         self.focus_or_not = True
-                                        self.uprb.UprbayTeraTermVt.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
+                                        self.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
                                         self.reset_activity_timer()
                                         self.after(100, self.show_error_message, 300, 215,
                                                    translation["invalid_semester"])
                                 case "683":
-                                    self.uprb.UprbayTeraTermVt.type_keys("SRM{ENTER}683" + semester + "{ENTER}")
+                                    self.type_keys("SRM{ENTER}683" + semester + "{ENTER}")
                                     self.after(0, lambda: self.disable_go_next_buttons())
-                                    text_output = self.capture_screenshot()
-                                    if "CONFLICT" in text_output:
+                                    screen_state = self.capture_screen_state()
+                                    if screen_state.has("conflict"):
                                         self.focus_or_not = True
-                                        self.uprb.UprbayTeraTermVt.type_keys("004{ENTER}")
+                                        self.type_keys("004{ENTER}")
                                         self.after(100, self.show_information_message, 310, 225,
                                                    translation["hold_flag"])
-                                    if "CONFLICT" not in text_output:
+                                    if not screen_state.has("conflict"):
                                         def go_next_grid():
                                             self._1VE_screen = False
                                             self._1GP_screen = False
@@ -2855,15 +2885,13 @@ class TeraTermUI(customtkinter.CTk):
 
                                         self.after(0, lambda: go_next_grid())
                                 case "1PL":
-                                    self.uprb.UprbayTeraTermVt.type_keys("SRM{ENTER}1PL" + semester + "{ENTER}")
+                                    self.type_keys("SRM{ENTER}1PL" + semester + "{ENTER}")
                                     self.after(0, lambda: self.disable_go_next_buttons())
-                                    text_output = self.capture_screenshot()
-                                    if "TERM OUTDATED" in text_output or "NO PUEDE REALIZAR CAMBIOS" in text_output or \
-                                           "NO PUEDE HACER CAMBIOS" in text_output or "INVALID TERM SELECTION" \
-                                            in text_output:
+                                    screen_state = self.capture_screen_state()
+                                    if screen_state.has("term_outdated", "changes_blocked", "invalid_term"):
                                         self.focus_or_not = True
-                                        if "TERM OUTDATED" in text_output or "INVALID TERM SELECTION" in text_output:
-                                            self.uprb.UprbayTeraTermVt.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
+                                        if screen_state.has("term_outdated", "invalid_term"):
+                                            self.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
                                             self.reset_activity_timer()
                                         if lang == "English":
                                             self.after(100, self.show_error_message, 325, 240,
@@ -2884,20 +2912,18 @@ class TeraTermUI(customtkinter.CTk):
                                         self.focus_or_not = True
                                         self.after(100, lambda: warning())
                                 case "1S4":
-                                    self.uprb.UprbayTeraTermVt.type_keys("SRM{ENTER}1S4" + semester + "{ENTER}")
+                                    self.type_keys("SRM{ENTER}1S4" + semester + "{ENTER}")
                                     self.after(0, lambda: self.disable_go_next_buttons())
                                     text_output = self.capture_screenshot()
                                     if "INVALID TERM SELECTION" in text_output or "USO INTERNO" not in text_output \
                                         and "TERMINO LA MATRICULA" not in text_output:
-                                        self.uprb.UprbayTeraTermVt.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
+                                        self.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
                                         self.reset_activity_timer()
                                 case "4CM":
-                                    self.uprb.UprbayTeraTermVt.type_keys("SRM{ENTER}4CM" + semester + "{ENTER}")
+                                    self.type_keys("SRM{ENTER}4CM" + semester + "{ENTER}")
                                     self.after(0, lambda: self.disable_go_next_buttons())
-                                    text_output = self.capture_screenshot()
-                                    if "TERM OUTDATED" not in text_output and "NO PUEDE REALIZAR CAMBIOS" not in \
-                                            text_output and "NO PUEDE HACER CAMBIOS" not in text_output and \
-                                            "INVALID TERM SELECTION" not in text_output:
+                                    screen_state = self.capture_screen_state()
+                                    if not screen_state.has("term_outdated", "changes_blocked", "invalid_term"):
                                         def go_next_grid():
                                             self._1VE_screen = False
                                             self._1GP_screen = False
@@ -2911,11 +2937,10 @@ class TeraTermUI(customtkinter.CTk):
                                                                   sticky="n")
 
                                         self.after(0, lambda: go_next_grid())
-                                    if "TERM OUTDATED" in text_output or "NO PUEDE REALIZAR CAMBIOS" in text_output or \
-                                            "NO PUEDE HACER CAMBIOS" in text_output:
+                                    if screen_state.has("term_outdated", "changes_blocked"):
                                         self.focus_or_not = True
-                                        if "TERM OUTDATED" in text_output:
-                                            self.uprb.UprbayTeraTermVt.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
+                                        if screen_state.has("term_outdated"):
+                                            self.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
                                             self.reset_activity_timer()
                                         if lang == "English":
                                             self.after(100, self.show_error_message, 325, 240,
@@ -2925,14 +2950,13 @@ class TeraTermUI(customtkinter.CTk):
                                                        "Error! No se pudo entrar"
                                                        "\n a la pantalla" + self.menu_entry.get())
                                 case "4SP":
-                                    self.uprb.UprbayTeraTermVt.type_keys("SRM{ENTER}4SP" + semester + "{ENTER}")
+                                    self.type_keys("SRM{ENTER}4SP" + semester + "{ENTER}")
                                     self.after(0, lambda: self.disable_go_next_buttons())
-                                    text_output = self.capture_screenshot()
-                                    if "TERM OUTDATED" in text_output or "NO PUEDE REALIZAR CAMBIOS" in text_output or \
-                                            "NO PUEDE HACER CAMBIOS" in text_output:
+                                    screen_state = self.capture_screen_state()
+                                    if screen_state.has("term_outdated", "changes_blocked"):
                                         self.focus_or_not = True
-                                        if "TERM OUTDATED" in text_output:
-                                            self.uprb.UprbayTeraTermVt.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
+                                        if screen_state.has("term_outdated"):
+                                            self.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
                                             self.reset_activity_timer()
                                         if lang == "English":
                                             self.after(100, self.show_error_message, 325, 240,
@@ -3014,7 +3038,7 @@ class TeraTermUI(customtkinter.CTk):
                 or response[0] == "Sí":
             if not self.wait_for_window():
                 return
-            self.uprb.UprbayTeraTermVt.type_keys("SO{ENTER}")
+            self.type_keys("SO{ENTER}")
             self.after(0, lambda: self.disable_go_next_buttons())
         elif not TeraTermUI.checkIfProcessRunning("ttermpro") and response[0] == "Yes" \
                 or response[0] == "Sí":
@@ -3039,20 +3063,20 @@ class TeraTermUI(customtkinter.CTk):
                         if not self.wait_for_window():
                             return
                         if self._1VE_screen:
-                            self.uprb.UprbayTeraTermVt.type_keys("{TAB 3}{ENTER}")
+                            self.type_keys("{TAB 3}{ENTER}")
                             self.reset_activity_timer()
                         elif self._1GP_screen:
-                            self.uprb.UprbayTeraTermVt.type_keys("{ENTER}")
+                            self.type_keys("{ENTER}")
                             self.reset_activity_timer()
                         elif self._409_screen:
-                            self.uprb.UprbayTeraTermVt.type_keys("{TAB 4}{ENTER}")
+                            self.type_keys("{TAB 4}{ENTER}")
                             self.reset_activity_timer()
                         elif self._683_screen:
                             self.went_to_683_screen = True
-                            self.uprb.UprbayTeraTermVt.type_keys("{ENTER}")
+                            self.type_keys("{ENTER}")
                             self.reset_activity_timer()
                         elif self._4CM_screen:
-                            self.uprb.UprbayTeraTermVt.type_keys("{ENTER}")
+                            self.type_keys("{ENTER}")
                             self.reset_activity_timer()
                             text_output = self.capture_screenshot()
                             if "RATE NOT ON ARFILE" in text_output:
@@ -3106,7 +3130,7 @@ class TeraTermUI(customtkinter.CTk):
                     if TeraTermUI.checkIfProcessRunning("ttermpro"):
                         if not self.wait_for_window():
                             return
-                        self.uprb.UprbayTeraTermVt.type_keys("{ENTER}")
+                        self.type_keys("{ENTER}")
                         time.sleep(0.5)
                         try:
                             self.clipboard_handler.save_clipboard_content()
@@ -3236,8 +3260,8 @@ class TeraTermUI(customtkinter.CTk):
 
                                 self.after(125, lambda: server_closed())
                             elif self.server_status == "Prompt found":
-                                self.uprb.UprbayTeraTermVt.type_keys("^q")
-                                self.uprb.UprbayTeraTermVt.type_keys("{ENTER 3}")
+                                self.type_keys("^q")
+                                self.type_keys("{ENTER 3}")
                                 self.move_window()
                                 self.bind("<Return>", lambda event: self.student_event_handler())
                                 if self.skip_auth:
@@ -3354,18 +3378,11 @@ class TeraTermUI(customtkinter.CTk):
                             button_color=("#c30101", "#145DA0", "#145DA0"),
                             hover_color=("darkred", "use_default", "use_default"))
         response = msg.get()
-        row_exists = self.cursor_db.execute("SELECT 1 FROM user_config").fetchone()
         if response[0] == "Yes" or response[0] == "Sí":
-            if not row_exists:
-                self.cursor_db.execute("INSERT INTO user_config (skip_auth) VALUES (?)", ("Yes",))
-            else:
-                self.cursor_db.execute("UPDATE user_config SET skip_auth=?", ("Yes",))
+            self.user_config.set("skip_auth", "Yes")
             self.skip_auth = True
         else:
-            if not row_exists:
-                self.cursor_db.execute("INSERT INTO user_config (skip_auth) VALUES (?)", ("No",))
-            else:
-                self.cursor_db.execute("UPDATE user_config SET skip_auth=?", ("No",))
+            self.user_config.set("skip_auth", "No")
             self.skip_auth = False
         self.ask_skip_auth = False
         if self.help and self.help.winfo_exists():
@@ -3384,20 +3401,12 @@ class TeraTermUI(customtkinter.CTk):
         self.disable_enable_auth()
 
     def disable_enable_auth(self):
-        row_exists = self.cursor_db.execute("SELECT 1 FROM user_config").fetchone()
         if self.skip_auth_switch.get() == "on":
-            if not row_exists:
-                self.cursor_db.execute("INSERT INTO user_config (skip_auth) VALUES (?)", ("Yes",))
-            else:
-                self.cursor_db.execute("UPDATE user_config SET skip_auth=?", ("Yes",))
+            self.user_config.set("skip_auth", "Yes")
             self.skip_auth = True
         elif self.skip_auth_switch.get() == "off":
-            if not row_exists:
-                self.cursor_db.execute("INSERT INTO user_config (skip_auth) VALUES (?)", ("No",))
-            else:
-                self.cursor_db.execute("UPDATE user_config SET skip_auth=?", ("No",))
+            self.user_config.set("skip_auth", "No")
             self.skip_auth = False
-        self.connection_db.commit()
 
     # Message that informs the user that logging-in tooked too long
     def notice_user(self, running_launchers):
@@ -3652,7 +3661,7 @@ class TeraTermUI(customtkinter.CTk):
             self.connect_to_uprb()
             text_output = self.capture_screenshot()
             if "PF4=exit" in text_output or "press PF4" in text_output:
-                self.uprb.UprbayTeraTermVt.type_keys("^v")
+                self.type_keys("^v")
                 text_output = self.capture_screenshot()
             to_continue = "return to continue"
             count_to_continue = text_output.count(to_continue)
@@ -3670,15 +3679,15 @@ class TeraTermUI(customtkinter.CTk):
             elif "return to continue" in text_output or "INFORMACION ESTUDIANTIL" in text_output:
                 if hwnd_tt:
                     win32gui.PostMessage(hwnd_tt, win32con.WM_CLOSE, 0, 0)
-                self.uprb.UprbayTeraTermVt.type_keys("^q")
+                self.type_keys("^q")
                 if "return to continue" in text_output and "Loading" in text_output:
-                    self.uprb.UprbayTeraTermVt.type_keys("{ENTER 3}")
+                    self.type_keys("{ENTER 3}")
                 elif count_to_continue == 2 or "ZZZ" in text_output:
-                    self.uprb.UprbayTeraTermVt.type_keys("{ENTER 2}")
+                    self.type_keys("{ENTER 2}")
                 elif count_to_continue == 1 or "automaticamente" in text_output:
-                    self.uprb.UprbayTeraTermVt.type_keys("{ENTER}")
+                    self.type_keys("{ENTER}")
                 else:
-                    self.uprb.UprbayTeraTermVt.type_keys("{VK_RIGHT}{VK_LEFT}")
+                    self.type_keys("{VK_RIGHT}{VK_LEFT}")
                 self.bind("<Control-BackSpace>", lambda event: self.keybind_go_back_home())
                 self.bind("<Return>", lambda event: self.student_event_handler())
                 self.home_frame.grid_forget()
@@ -3696,8 +3705,8 @@ class TeraTermUI(customtkinter.CTk):
             elif any(keyword in text_output for keyword in keywords):
                 if hwnd_tt:
                     win32gui.PostMessage(hwnd_tt, win32con.WM_CLOSE, 0, 0)
-                self.uprb.UprbayTeraTermVt.type_keys("^q")
-                self.uprb.UprbayTeraTermVt.type_keys("{VK_RIGHT}{VK_LEFT}")
+                self.type_keys("^q")
+                self.type_keys("{VK_RIGHT}{VK_LEFT}")
                 self.connect_to_uprb()
                 self.home_frame.grid_forget()
                 self.intro_box.grid_forget()
@@ -4762,85 +4771,107 @@ class TeraTermUI(customtkinter.CTk):
         }
 
         enrolled_section_codes = set(
-            row.get(current_translation["course"], "").split("-")[-1].strip()
-            for row in (self.enrolled_classes_data or []) if row.get(current_translation["course"], ""))
+            row.code.split("-")[-1].strip() for row in (self.enrolled_classes_data or []) if row.code)
+        searched_sections = self.searched_sections()
 
-        def collect_valid_entries(entries):
-            return [(TeraTermUI.sanitize_input(entry.get(), to_upper=True), entry) for entry in entries
-                    if entry and entry.get().strip()]
-
-        valid_main_entries = collect_valid_entries(self.m_section_entry)
-        valid_change_entries = collect_valid_entries(self.change_section_entries or [])
-
-        @lru_cache(maxsize=None)
         def resolve_schedule_info(section_codes):
             return current_schedule_map.get(section_codes, current_schedule_map.get(section_codes[:2], ("", "", "")))
 
-        def compile_schedule(entry_data, with_enrolled=False):
-            compiled = {}
-            for code, _ in entry_data:
-                sched_days, sched_start, sched_end = resolve_schedule_info(code)
-                if sched_days == "Online" or code.startswith("EL"):
-                    continue
-                for sched_day in sched_days.split(", "):
-                    compiled.setdefault(sched_day, []).append((sched_start, sched_end, code))
-
-            if with_enrolled:
-                for enrolled_code in enrolled_section_codes:
-                    sched_days, sched_start, sched_end = resolve_schedule_info(enrolled_code)
-                    if sched_days == "Online" or enrolled_code.startswith("EL"):
-                        continue
-                    for sched_day in sched_days.split(", "):
-                        compiled.setdefault(sched_day, []).append((sched_start, sched_end, enrolled_code))
-
-            for entries in compiled.values():
-                entries.sort()
-            return compiled
-
-        def detect_internal_conflicts(schedule_dict):
-            conflict_set = set()
-            for time_group in schedule_dict.values():
-                for i, (start_1, end_1, code_1) in enumerate(time_group[:-1]):
-                    for start_2, end_2, code_2 in time_group[i + 1:]:
-                        if start_1 < end_2 and start_2 < end_1:
-                            conflict_set.update({(code_1, start_1, end_1), (code_2, start_2, end_2)})
-            return conflict_set
-
-        def detect_cross_conflicts(base_sched, comp_sched):
-            cross_set = set()
-            for sched_day, base_blocks in base_sched.items():
-                if sched_day not in comp_sched:
-                    continue
-                for base_start, base_end, base_code in base_blocks:
-                    for comp_start, comp_end, comp_code in comp_sched[sched_day]:
-                        if base_start < comp_end and comp_start < base_end:
-                            cross_set.update({(base_code, base_start, base_end), (comp_code, comp_start, comp_end)})
-            return cross_set
-
-        sched_main = compile_schedule(valid_main_entries)
-        sched_change = compile_schedule(valid_change_entries)
-        sched_enrolled = compile_schedule([], with_enrolled=True)
-
-        main_conflicts = detect_internal_conflicts(sched_main)
-        change_conflicts = detect_internal_conflicts(sched_change)
-        cross_conflicts = detect_cross_conflicts(sched_change, sched_enrolled)
+        # The real time ranges when the class was searched for that semester, the usual ones for the code otherwise,
+        # returned as (slots, approximate)
+        def resolve_slots(course, semester, section_codes):
+            section = searched_sections.get((course, semester), {}).get(section_codes)
+            if section is not None:
+                return ScheduleConflictEngine.slots_from_section(section.days, section.minutes), False
+            return ScheduleConflictEngine.slots_from_schedule(resolve_schedule_info(section_codes)), True
+
+        # the tooltips are built from the same slots the engine was given for each entry
+        entry_slots = {}
+
+        def sync_entries(engine, kind, entries, course_for, semester):
+            for index, entry in enumerate(entries):
+                code = TeraTermUI.sanitize_input(entry.get(), to_upper=True) if entry is not None else ""
+                if not code or code.startswith("EL"):
+                    engine.remove((kind, index))
+                else:
+                    course = course_for(index)
+                    entry_slots[kind, index] = resolve_slots(course, semester(index), code)
+                    engine.update((kind, index), f"{course}-{code}" if course else code, entry_slots[kind, index][0])
+            for index in range(len(entries), engine.count(kind)):
+                engine.remove((kind, index))
+
+        def main_course(index):
+            if index >= len(self.m_classes_entry):
+                return ""
+            return TeraTermUI.sanitize_input(self.m_classes_entry[index].get(), to_upper=True)
+
+        def main_semester(index):
+            if index >= len(self.m_semester_entry):
+                return ""
+            return TeraTermUI.sanitize_input(self.m_semester_entry[index].get(), to_upper=True)
+
+        enrolled_data = self.enrolled_classes_data or []
+        enrolled_semester = TeraTermUI.sanitize_input(self.dialog_input or "", to_upper=True)
+
+        def enrolled_course(index):
+            if index >= len(enrolled_data) or not enrolled_data[index].code:
+                return ""
+            return TeraTermUI.sanitize_input(enrolled_data[index].code.rsplit("-", 1)[0], to_upper=True)
+
+        # Extra rows of the enrolled classes screen belong to the class above them
+        enrolled_slots = {}
+        for row in enrolled_data:
+            if row.code:
+                enrolled_code = row.code
+                enrolled_slots[enrolled_code] = ([], [])
+            elif not enrolled_slots:
+                continue
+            enrolled_slots[enrolled_code][0].append(row.days)
+            enrolled_slots[enrolled_code][1].append(row.minutes)
+
+        main_conflicts = self.main_schedule_conflicts
+        change_conflicts = self.change_schedule_conflicts
+        sync_entries(main_conflicts, "main", self.m_section_entry, main_course, main_semester)
+        sync_entries(change_conflicts, "change", self.change_section_entries or [], enrolled_course,
+                     lambda index: enrolled_semester)
+        for _, enrolled_code in change_conflicts.keys("enrolled"):
+            if enrolled_code not in enrolled_slots:
+                change_conflicts.remove(("enrolled", enrolled_code))
+        for enrolled_code, (days, minutes) in enrolled_slots.items():
+            if not enrolled_code.split("-")[-1].strip().startswith("EL"):
+                change_conflicts.update(("enrolled", enrolled_code), enrolled_code,
+                                        ScheduleConflictEngine.slots_from_section(days, minutes))
 
         default_border = customtkinter.ThemeManager.theme["CTkEntry"]["border_color"]
         ui_lang = self.language_menu.get()
-        fmt_time = TeraTermUI.convert_to_12_hour_format
+        approx_label = "Aprox." if ui_lang == "Español" else "Approx."
+
+        def fmt_minutes(minutes):
+            return f"{(minutes // 60 - 1) % 12 + 1}:{minutes % 60:02d} {'AM' if minutes < 720 else 'PM'}"
 
-        def format_tooltip_text(sections_code, is_conflict, prefix_label):
-            day_block, start_block, end_block = resolve_schedule_info(sections_code)
-            is_onlines = day_block == "Online" or sections_code.startswith("EL")
+        # Days sharing a time range go on one line, times from the schedule map are marked as approximate
+        def format_tooltip_text(sections_code, key, is_conflict, prefix_label, conflicting_codes=()):
+            slots, approximate = entry_slots.get(key, ((), True))
+            is_onlines = sections_code.startswith("EL") or (
+                    not slots and resolve_schedule_info(sections_code)[0] == "Online")
             if is_onlines:
                 return current_translation["online_class"], "#1E90FF", True
-            human_time = f"{fmt_time(start_block)} - {fmt_time(end_block)}"
-            human_days = ", ".join(
-                day_translation_map.get(d, d) for d in day_block.split(", ")) if ui_lang == "Español" else day_block
-            text = f"{prefix_label}{human_days}\n*{'Aprox.' if ui_lang == 'Español' else 'Approx.'} {human_time}"
+            if conflicting_codes:
+                prefix_label += f"{current_translation['conflicts_with']}{', '.join(sorted(conflicting_codes))}\n"
+            ranges = {}
+            for slot_day, slot_start, slot_end in slots:
+                day_names = ranges.setdefault((slot_start, slot_end), [])
+                day_name = day_translation_map.get(slot_day, slot_day) if ui_lang == "Español" else slot_day
+                if day_name not in day_names:
+                    day_names.append(day_name)
+            lines = []
+            for (slot_start, slot_end), day_names in ranges.items():
+                human_time = f"{fmt_minutes(slot_start)} - {fmt_minutes(slot_end)}"
+                lines.append(f"{', '.join(day_names)}\n{'*' + approx_label + ' ' if approximate else ''}{human_time}")
+            text = prefix_label + "\n".join(lines) if lines else prefix_label.rstrip("\n")
             return text, "#CC5500" if is_conflict else "#1E90FF", False
 
-        def apply_tooltip_visuals(entry_group, conflict_set, tooltip_group, is_change=False):
+        def apply_tooltip_visuals(entry_group, conflict_engine, tooltip_group, is_change=False):
             for index, inputs_entry in enumerate(entry_group):
                 code_raw = TeraTermUI.sanitize_input(inputs_entry.get(), to_upper=True)
                 tooltips_pos = idx * 2 + 1 if is_change else index
@@ -4849,12 +4880,14 @@ class TeraTermUI(customtkinter.CTk):
                     tooltip_group[tooltips_pos].configure(message="", visibility=False)
                     continue
 
-                if any(conf[0] == code_raw for conf in conflict_set):
-                    tips_msg, tips_color, is_onlines = format_tooltip_text(code_raw, True,
-                                                                        current_translation["conflict_tooltip"])
+                if conflict_engine.has_conflict(("main", index)):
+                    tips_msg, tips_color, is_onlines = format_tooltip_text(
+                        code_raw, ("main", index), True, current_translation["conflict_tooltip"],
+                        conflict_engine.conflicting_codes(("main", index)))
                     inputs_entry.configure(border_color=default_border if is_onlines else "#CC5500")
-                elif code_raw in current_schedule_map or code_raw[:2] in current_schedule_map:
-                    tips_msg, tips_color, _ = format_tooltip_text(code_raw, False, "")
+                elif entry_slots.get(("main", index), ((), True))[0] or code_raw in current_schedule_map or \
+                        code_raw[:2] in current_schedule_map:
+                    tips_msg, tips_color, _ = format_tooltip_text(code_raw, ("main", index), False, "")
                     inputs_entry.configure(border_color=default_border)
                 else:
                     inputs_entry.configure(border_color=default_border)
@@ -4882,20 +4915,27 @@ class TeraTermUI(customtkinter.CTk):
                                                                   bg_color="#1E90FF")
                     continue
 
+                # the class this entry replaces doesn't count as a conflict
+                enrolled_clashes = change_conflicts.conflicting_codes(("change", idx), "enrolled")
+                if idx < len(enrolled_data):
+                    enrolled_clashes.discard(enrolled_data[idx].code)
                 if section_code in enrolled_section_codes:
-                    tip_msg, tip_color, is_online = format_tooltip_text(section_code, True,
+                    tip_msg, tip_color, is_online = format_tooltip_text(section_code, ("change", idx), True,
                                                                         current_translation["conflict_table_tooltip"])
                     input_entry.configure(border_color=default_border if is_online else "#CC5500")
-                elif any(conf[0] == section_code for conf in cross_conflicts):
-                    tip_msg, tip_color, is_online = format_tooltip_text(section_code, True,
-                                                                        current_translation["conflict_table_tooltip"])
+                elif enrolled_clashes:
+                    tip_msg, tip_color, is_online = format_tooltip_text(
+                        section_code, ("change", idx), True, current_translation["conflict_table_tooltip"],
+                        enrolled_clashes)
                     input_entry.configure(border_color=default_border if is_online else "#CC5500")
-                elif any(conf[0] == section_code for conf in change_conflicts):
-                    tip_msg, tip_color, is_online = format_tooltip_text(section_code, True,
-                                                                        current_translation["conflict_tooltip"])
+                elif change_conflicts.has_conflict(("change", idx), "change"):
+                    tip_msg, tip_color, is_online = format_tooltip_text(
+                        section_code, ("change", idx), True, current_translation["conflict_tooltip"],
+                        change_conflicts.conflicting_codes(("change", idx), "change"))
                     input_entry.configure(border_color=default_border if is_online else "#CC5500")
-                elif section_code in current_schedule_map or section_code[:2] in current_schedule_map:
-                    tip_msg, tip_color, _ = format_tooltip_text(section_code, False, "")
+                elif entry_slots.get(("change", idx), ((), True))[0] or section_code in current_schedule_map or \
+                        section_code[:2] in current_schedule_map:
+                    tip_msg, tip_color, _ = format_tooltip_text(section_code, ("change", idx), False, "")
                     input_entry.configure(border_color=default_border)
                 else:
                     input_entry.configure(border_color=default_border)
@@ -4922,8 +4962,7 @@ class TeraTermUI(customtkinter.CTk):
     def auto_enroll_event_handler(self):
         translation = self.load_language()
         self.focus_set()
-        idle = self.cursor_db.execute("SELECT idle FROM user_config").fetchone()
-        if idle[0] != "Disabled":
+        if self.user_config.get("idle") != "Disabled":
             if self.auto_enroll.get() == "on":
                 msg = CTkMessagebox(title=translation["auto_enroll"], message=translation["auto_enroll_prompt"],
                                     icon=TeraTermUI.get_absolute_path("images/submit.png"),
@@ -4955,6 +4994,7 @@ class TeraTermUI(customtkinter.CTk):
         self.auto_enroll_focus = False
 
     # Auto-Enroll classes, will basically automatically enroll your classes at the exact time of your enrollment date
+    @trace_span("auto_enroll_event", "flow")
     def auto_enroll_event(self):
         with self.lock_thread:
             try:
@@ -4977,14 +5017,14 @@ class TeraTermUI(customtkinter.CTk):
                     if TeraTermUI.checkIfProcessRunning("ttermpro"):
                         if not self.wait_for_window():
                             return
-                        self.uprb.UprbayTeraTermVt.type_keys("SRM{ENTER}")
+                        self.type_keys("SRM{ENTER}")
                         self.after(0, lambda: self.disable_go_next_buttons())
                         text_output = self.capture_screenshot()
                         if "OPCIONES PARA EL ESTUDIANTE" in text_output or "BALANCE CTA" in text_output or \
                                 "PANTALLAS MATRICULA" in text_output or "PANTALLAS GENERALES" in text_output or \
                                 "LISTA DE SECCIONES" in text_output:
                             if "LISTA DE SECCIONES" in text_output:
-                                self.uprb.UprbayTeraTermVt.type_keys("SRM{ENTER}")
+                                self.type_keys("SRM{ENTER}")
                                 self.reset_activity_timer()
                             TeraTermUI.manage_user_input()
                             self.automate_copy_class_data()
@@ -5056,7 +5096,7 @@ class TeraTermUI(customtkinter.CTk):
                                 self.after(125, lambda: self.auto_enroll.deselect())
                             if ("INVALID ACTION" in text_output and "PANTALLAS MATRICULA" in text_output) or \
                                     ("LISTA DE SECCIONES" in text_output and "COURSE NOT" in text_output):
-                                self.uprb.UprbayTeraTermVt.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
+                                self.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
                                 self.reset_activity_timer()
                                 self.after(0, lambda: self.bring_back_timer_window())
                         else:
@@ -5185,20 +5225,24 @@ class TeraTermUI(customtkinter.CTk):
                 if self.prev_sample_count != stats.get("samples"):
                     self.server_rating.configure(text=f"{translation['server_status_rating']}{rating}",
                                                  text_color=color)
-                    logging.info(f"Server \"{host}\" Response Time Statistics (ms):\n       {stats}")
+                    logging.debug(f"Server \"{host}\" Response Time Statistics (ms): {stats}")
                     self.prev_sample_count = stats.get("samples")
 
             self.timer_label.configure(text=self.get_countdown_message(total_seconds))
-            if total_seconds > 60:
-                self.timer_window.after(5000, lambda: self.countdown_status(pr_date))
-            else:
-                if not self.notification_sent:
-                    self.tray.notify(translation["notif_countdown"].replace(
-                        "{semester}", self.m_semester_entry[0].get()), title="Tera Term UI")
-                    self.notification_sent = True
-                self.timer_window.after(1000, lambda: self.countdown_status(pr_date))
+            step = 5 if total_seconds > 60 else 1
+            if total_seconds <= 60 and not self.notification_sent:
+                self.tray.notify(translation["notif_countdown"].replace(
+                    "{semester}", self.m_semester_entry[0].get()), title="Tera Term UI")
+                self.notification_sent = True
+            # Ticks land on whole steps before pr_date, so the last one fires right at the enrollment time
+            delay = total_seconds % step
+            if delay < 0.05:
+                delay += step
+            self.countdown_job = self.scheduler.schedule(delay, lambda: self.countdown_status(pr_date), on_tk=True)
 
     def countdown_status(self, pr_date):
+        if not self.running_countdown or self.timer_window is None or not self.timer_window.winfo_exists():
+            return
         puerto_rico_tz = pytz.timezone("America/Puerto_Rico")
         total_seconds = (pr_date - datetime.now(puerto_rico_tz)).total_seconds()
         bootup_threshold_low = 15 * 60
@@ -5281,6 +5325,9 @@ class TeraTermUI(customtkinter.CTk):
     # Ends the auto-enroll event and the timer
     def end_countdown(self):
         translation = self.load_language()
+        if self.countdown_job is not None:
+            self.countdown_job.cancel()
+            self.countdown_job = None
         self.pr_date = None
         self.auto_enroll_flag = False
         self.countdown_running = False
@@ -5401,8 +5448,8 @@ class TeraTermUI(customtkinter.CTk):
                     if any(keyword in text_output for keyword in keywords) and not is_multiple:
                         if hwnd_tt:
                             win32gui.PostMessage(hwnd_tt, win32con.WM_CLOSE, 0, 0)
-                        self.uprb.UprbayTeraTermVt.type_keys("^q")
-                        self.uprb.UprbayTeraTermVt.type_keys("{VK_RIGHT}{VK_LEFT}")
+                        self.type_keys("^q")
+                        self.type_keys("{VK_RIGHT}{VK_LEFT}")
                         self.connect_to_uprb()
                     else:
                         if attempt < MAX_BOOT_RETRIES:
@@ -5450,7 +5497,7 @@ class TeraTermUI(customtkinter.CTk):
                     self.server_status = self.wait_for_prompt("return to continue",
                                                               "REGRESE PRONTO")
                     if self.server_status == "Prompt found":
-                        self.uprb.UprbayTeraTermVt.type_keys("{ENTER 3}")
+                        self.type_keys("{ENTER 3}")
                         self.move_window()
                     else:
                         if attempt == MAX_BOOT_RETRIES:
@@ -5465,7 +5512,7 @@ class TeraTermUI(customtkinter.CTk):
                     student_ct, code_ct, nonce_sid, nonce_code, tag_sid, tag_code = row
                     student_id = self.data_storage.decrypt(student_ct, nonce_sid, tag_sid)
                     code = self.data_storage.decrypt(code_ct, nonce_code, tag_code)
-                    self.uprb.UprbayTeraTermVt.type_keys("{TAB}" + student_id + code + "{ENTER}")
+                    self.type_keys("{TAB}" + student_id + code + "{ENTER}")
                     text_output = self.wait_for_response(["SIGN-IN", "ON FILE",  "PIN NUMBER", "ERRORS FOUND"],
                                                          init_timeout=False, timeout=7)
                     if "SIGN-IN" in text_output:
@@ -6109,11 +6156,8 @@ class TeraTermUI(customtkinter.CTk):
                         host_entry_value = TeraTermUI.sanitize_input(self.host_entry.get(), to_lower=True)
                     if not TeraTermUI.check_host(host_entry_value):
                         continue
-                result = self.cursor_db.execute(f"SELECT {field} FROM user_config").fetchone()
-                if result is None:
-                    self.cursor_db.execute(f"INSERT INTO user_config ({field}) VALUES (?)", (value,))
-                elif result[0] != value:
-                    self.cursor_db.execute(f"UPDATE user_config SET {field} = ? ", (value,))
+                self.user_config.set(field, value)
+            self.user_config.flush()
             if self.must_save_user_data and self.in_student_frame:
                 student_id = TeraTermUI.sanitize_input(self.student_id_entry.get())
                 code = TeraTermUI.sanitize_input(self.code_entry.get())
@@ -6129,7 +6173,7 @@ class TeraTermUI(customtkinter.CTk):
             logging.error(f"Database error occurred: {err}")
             self.log_error()
         finally:
-            self.connection_db.close()
+            self.db_pool.close_all()
 
     def keybind_save_user_data(self, event=None):
         if self.loading_screen_status is not None and self.loading_screen_status.winfo_exists():
@@ -6207,8 +6251,7 @@ class TeraTermUI(customtkinter.CTk):
         save = self.save_class_data.get()
         translation = self.load_language()
         if save == "on":
-            self.cursor_db.execute("DELETE FROM saved_classes")
-            self.connection_db.commit()
+            rows = []
             is_empty = False
             is_invalid_format = False
             for index in range(self.a_counter + 1):
@@ -6230,11 +6273,10 @@ class TeraTermUI(customtkinter.CTk):
                         "^[A-Z0-9]{3}$", section_value):
                     is_invalid_format = True
                 else:
-                    self.cursor_db.execute("INSERT INTO saved_classes (class, section, semester, action, timestamp) "
-                                        "VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)",
-                                           (class_value, section_value, semester_value, register_value))
-                    self.connection_db.commit()
-                    self.saved_classes = True
+                    rows.append((class_value, section_value, semester_value, register_value))
+            self.saved_classes_model.replace(rows)
+            if rows:
+                self.saved_classes = True
 
             if is_empty:
                 self.show_error_message(330, 255, translation["failed_saved_lack_info"])
@@ -6243,16 +6285,11 @@ class TeraTermUI(customtkinter.CTk):
                 self.show_error_message(330, 255, translation["failed_saved_invalid_info"])
                 self.save_class_data.deselect()
             else:
-                self.cursor_db.execute("SELECT COUNT(*) FROM saved_classes")
-                row_count = self.cursor_db.fetchone()[0]
-                if row_count == 0:
+                if not self.saved_classes_model.rows:
                     self.show_error_message(330, 255, translation["failed_saved_invalid_info"])
                     self.save_class_data.deselect()
                 else:
-                    self.changed_classes = set()
-                    self.changed_sections = set()
-                    self.changed_semesters = set()
-                    self.changed_registers = set()
+                    self.saved_classes_model.reset_changes()
                     for i in range(8):
                         self.m_register_menu[i].configure(
                             command=lambda value, idx=i: self.detect_register_menu_change(value, idx))
@@ -6260,8 +6297,7 @@ class TeraTermUI(customtkinter.CTk):
                         self.m_section_entry[i].bind("<FocusOut>", self.m_sections_bind_wrapper)
                     self.show_success_message(350, 265, translation["saved_classes_success"])
         if save == "off":
-            self.cursor_db.execute("DELETE FROM saved_classes")
-            self.connection_db.commit()
+            self.saved_classes_model.clear()
             self.saved_classes = False
             for i in range(8):
                 self.m_register_menu[i].configure(command=lambda value: self.focus_set())
@@ -6270,8 +6306,7 @@ class TeraTermUI(customtkinter.CTk):
 
     # Compares the saved classes in the database with the current entries in the application
     def delete_saved_classes(self):
-        saved_data = self.cursor_db.execute(
-            "SELECT class, section, semester, action FROM saved_classes WHERE class IS NOT NULL").fetchall()
+        saved_data = [row[1:5] for row in self.saved_classes_model.rows if row[1] is not None]
 
         if not saved_data:
             return
@@ -6324,8 +6359,7 @@ class TeraTermUI(customtkinter.CTk):
         difference_ratio = num_field_differences / total_fields_compared
         if difference_ratio > 0.5:
             # Data is mostly different; delete from database
-            self.cursor_db.execute("DELETE FROM saved_classes")
-            self.connection_db.commit()
+            self.saved_classes_model.clear()
 
     # shows loading screen while doing automations of pywinauto
     def show_loading_screen(self):
@@ -6519,47 +6553,17 @@ class TeraTermUI(customtkinter.CTk):
     # function that checks if the specified program is running or not
     @staticmethod
     def checkIfProcessRunning(processName):
-        process = processName.lower()
-        for proc in psutil.process_iter(attrs=["name"]):
-            try:
-                proc_info = proc.as_dict(attrs=["name"])
-                proc_name = proc_info.get("name", "").lower()
-                if process in proc_name:
-                    return True
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess) as err:
-                logging.error(f"Exception while processing {proc}: {err}")
-                continue
-        return False
+        return ProcessTracker.is_running(processName)
 
     # function to check if multiple of the specified processes are running or not
     @staticmethod
     def checkMultipleProcessesRunning(*processNames):
-        processNames = [p.lower() for p in processNames]
-        running_process_names = set()
-        for proc in psutil.process_iter(attrs=["name"]):
-            try:
-                proc_name = proc.info["name"].lower()
-                running_process_names.add(proc_name)
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess) as err:
-                logging.error(f"Exception while processing {proc}: {err}")
-                continue
-        running_processes = [name for name in processNames if name in running_process_names]
-        return running_processes
+        return ProcessTracker.running(*processNames)
 
     # function that checks if there's more than 1 instance of Tera Term running
     @staticmethod
     def countRunningProcesses(processName):
-        count = 0
-        process = processName.lower()
-        for proc in psutil.process_iter(attrs=["name"]):
-            try:
-                proc_info = proc.as_dict(attrs=["name"])
-                proc_name = proc_info.get("name", "").lower()
-                if process in proc_name:
-                    count += 1
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess) as err:
-                logging.error(f"Exception while processing {proc}: {err}")
-                continue
+        count = ProcessTracker.count(processName)
         return count, (count > 1)
 
     # checks if the specified window exists
@@ -6598,13 +6602,7 @@ class TeraTermUI(customtkinter.CTk):
 
         try:
             with socket.create_connection((HOST, PORT), timeout=timeout):
-                try:
-                    idle = self.cursor_db.execute("SELECT idle FROM user_config").fetchone()
-                except Exception as err:
-                    idle = ["Disabled"]
-                    logging.error("An error occurred: %s", err)
-                    self.log_error()
-                if idle[0] != "Disabled":
+                if self.user_config.get("idle") != "Disabled":
                     self.after(500, lambda: self.server_monitor.sample())
                 # the connection attempt succeeded
                 return True
@@ -6613,13 +6611,15 @@ class TeraTermUI(customtkinter.CTk):
             self.after(100, self.show_error_message, 385, 245, translation["uprb_down"])
             return False
 
-    # captures a screenshot of tera term and performs OCR
-    def capture_screenshot(self):
+    # captures a screenshot of tera term and performs OCR, with classify it returns the ScreenState instead, which
+    # skips OCR entirely when every row of the screen has been seen before
+    @trace_span("capture_screenshot", "screen")
+    def capture_screenshot(self, delay=1, classify=False):
         max_retries = 3
         retries = 0
         expected_menu_keywords = ["File", "Edit", "Setup", "Control", "Window", "Help"]
         while retries < max_retries:
-            time.sleep(1)
+            time.sleep(delay if retries == 0 else 1)
             translation = self.load_language()
             tesseract_dir_path = self.app_temp_dir / "Tesseract-OCR"
             default_tesseract_path = Path("C:/Program Files/Tesseract-OCR/tesseract.exe")
@@ -6632,7 +6632,6 @@ class TeraTermUI(customtkinter.CTk):
                 x, y, right, bottom = get_window_rect(hwnd)
                 width = right - x
                 height = bottom - y
-                crop_margin = (2, 10, 10, 2)
                 if self.loading_screen_status is not None and self.loading_screen_status.winfo_exists():
                     self.loading_screen.attributes("-topmost", False)
                     self.loading_screen.lower()
@@ -6648,15 +6647,17 @@ class TeraTermUI(customtkinter.CTk):
                     img = Image.frombytes("RGB", (screenshot.width, screenshot.height), screenshot.rgb)
                     if self.loading_screen_status is not None and self.loading_screen_status.winfo_exists():
                         self.after(150, self.loading_screen.attributes, "-topmost", True)
-                    img = img.crop((crop_margin[0], crop_margin[1], img.width - crop_margin[2],
-                                    img.height - crop_margin[3])).convert("L")
-                    img = img.resize((img.width * 2, img.height * 2), resample=Image.Resampling.LANCZOS)
                     # img.save("screenshot.png")
-                    custom_config = r"--oem 3 --psm 6"
-                    text = pytesseract.image_to_string(img, config=custom_config)
+                    if classify:
+                        state = self.screen_capture.classify(img)
+                        if state is not None and state.has("menu_bar"):
+                            return state
+                    text = self.screen_capture.read(img)
                     matches = sum(1 for keyword in expected_menu_keywords if keyword in text)
                     if matches >= 3:
-                        return text
+                        return ScreenState.from_text(text) if classify else text
+                    # The retry has to read the whole screen again instead of answering from the cache
+                    self.screen_capture.reset()
                     retries += 1
             else:
                 try:
@@ -6666,14 +6667,19 @@ class TeraTermUI(customtkinter.CTk):
                     pytesseract.pytesseract.tesseract_cmd = str(tesseract_dir / "tesseract.exe")
                     self.tesseract_unzipped = True
                     gc.collect()
-                    return self.capture_screenshot()
+                    return self.capture_screenshot(classify=classify)
                 except Exception as err:
                     logging.error(f"Error occurred during unzipping: {str(err)}")
                     self.tesseract_unzipped = False
                     self.after(100, self.show_error_message, 320, 225, translation["tesseract_error"])
                     return None
 
-        return text
+        return ScreenState.from_text(text) if classify else text
+
+    def capture_screen_state(self, delay=1):
+        screen_state = self.capture_screenshot(delay=delay, classify=True)
+        self.last_screen = screen_state.screen if screen_state is not None else None
+        return screen_state
 
     # creates pdf of the table containing for the searched class
     def create_search_pdf(self, data_list, classes_list, filepath, semesters_list):
@@ -7128,29 +7134,22 @@ class TeraTermUI(customtkinter.CTk):
             self.thread_pool.submit(attempt_open_url, processed_parts, norm_name)
 
     # displays the extracted data of searched classes into a table
+    @trace_span("display_searched_class_data", "ui")
     def display_searched_class_data(self, data):
         translation = self.load_language()
-        spec_data = TeraTermUI.specific_class_data(data)
-        original_headers = ["SEC", "M", "CRED", "DAYS", "TIMES", "AV", "INSTRUCTOR"]
-        headers = [translation["sec"], translation["m"], translation["cred"],
-                   translation["days"], translation["times"], translation["av"],
-                   translation["instructor"]]
-        header_mapping = dict(zip(original_headers, headers))
-        modified_data = [{header_mapping[key]: value for key, value in item.items() if key in header_mapping}
-                         for item in spec_data]
-        if not modified_data:
+        headers = TeraTermUI.searched_class_headers(translation)
+        if not data:
             self.after(100, self.show_error_message, 320, 235, translation["failed_to_search"])
             return
 
         self.image_search.grid_forget()
         self.notice_search.grid_forget()
-        table_values = [headers] + [[item.get(header, "") for header in headers] for item in modified_data]
-        original_table_values = table_values.copy()
+        sort_index = SectionSortIndex(data)
         if self.sort_by is not None and self.sort_by.get() != translation["sort_by"] and \
                 self.sort_by.get() != translation["original_data"]:
-            sorted_data = self.sort_data(modified_data, self.sort_by.get())
-            table_values = [headers] + [[item.get(header, "") for header in headers] for item in sorted_data]
+            table_values = [headers] + sort_index.rows(SectionSortIndex.option_key(self.sort_by.get(), translation))
         else:
+            table_values = [headers] + sort_index.rows()
             if self.sort_by is not None and self.sort_by.get() == translation["original_data"]:
                 self.sort_by.set(translation["sort_by"])
 
@@ -7162,8 +7161,16 @@ class TeraTermUI(customtkinter.CTk):
             current_row_count = len(table_update.values) - 1 if table_update.values else 0
             if new_row_count != current_row_count:
                 table_update.refresh_table(table_values)
+                if new_row_count > current_row_count:
+                    for row in range(current_row_count + 1, new_row_count + 1):
+                        for i in range(len(headers)):
+                            if i < 4 or i == 5:
+                                table_update.edit(row, i, width=55)
+                    self.bind_search_table_rows(table_update, headers, current_row_count + 1)
             elif table_update.values != table_values:
                 table_update.update_values(table_values)
+            self.original_table_data[table_update] = sort_index
+            self.check_class_conflicts()
             self.current_table_index = duplicate_index
             self.search_scrollbar.scroll_to_top()
             self.update_buttons()
@@ -7214,7 +7221,7 @@ class TeraTermUI(customtkinter.CTk):
                     new_table.refresh_table(table_values)
         else:
             new_table = CTkTable(self.search_scrollbar, column=len(headers), row=len(table_values),
-                                 values=table_values, header_color="#145DA0", hover_color="#339CFF",
+                                 values=table_values, header_color="#145DA0", hover_color="#339CFF", virtual=True,
                                  command=lambda t_row, col: self.copy_cell_data_to_clipboard(
                                      new_table.get_cell(t_row, col)))
             display_class = customtkinter.CTkLabel(self.search_scrollbar, text=self.get_class_for_table,
@@ -7222,7 +7229,8 @@ class TeraTermUI(customtkinter.CTk):
             display_class.bind("<Button-1>", lambda event: self.focus_set())
 
         self.table = new_table
-        self.original_table_data[new_table] = original_table_values
+        self.original_table_data[new_table] = sort_index
+        self.check_class_conflicts()
 
         for i, header in enumerate(headers):
             cell = new_table.get_cell(0, i)
@@ -7233,18 +7241,7 @@ class TeraTermUI(customtkinter.CTk):
         for i, header in enumerate(headers):
             if i < 4 or i == 5:
                 new_table.edit_column(i, width=55)
-        instructor_col_index = headers.index(translation["instructor"])
-        av_col_index = headers.index(translation["av"])
-        for row in range(1, len(table_values)):
-            section_cell = new_table.get_cell(row, 0)
-            new_table.bind_cell(row, 0, "<Button-3>", lambda event, t_cell=section_cell:
-            self.transfer_class_data_to_enroll_tab(event, t_cell))
-            instructor_cell = new_table.get_cell(row, instructor_col_index)
-            new_table.bind_cell(row, instructor_col_index, "<Button-3>", lambda event, t_cell=instructor_cell:
-            self.open_professor_profile(event, t_cell))
-            av_cell = new_table.get_cell(row, av_col_index)
-            new_table.bind_cell(row, av_col_index, "<Button-3>", lambda event, t_cell=av_cell:
-            TeraTermUI.open_student_help(event, t_cell))
+        self.bind_search_table_rows(new_table, headers, 1)
         for col_index in range(len(headers)):
             new_table.bind_cell(0, col_index, "<Button-3>",
                                 lambda event: self.move_tables_overlay_event())
@@ -7359,6 +7356,22 @@ class TeraTermUI(customtkinter.CTk):
         self.bind("<Control-w>", lambda event: self.keybind_remove_current_table())
         self.bind("<Control-W>", lambda event: self.keybind_remove_current_table())
 
+    # right clicking the section, instructor or av cell of a row of the search table runs its action
+    def bind_search_table_rows(self, table, headers, first_row):
+        translation = self.load_language()
+        instructor_col_index = headers.index(translation["instructor"])
+        av_col_index = headers.index(translation["av"])
+        for row in range(first_row, table.rows):
+            section_cell = table.get_cell(row, 0)
+            table.bind_cell(row, 0, "<Button-3>", lambda event, t_cell=section_cell:
+            self.transfer_class_data_to_enroll_tab(event, t_cell))
+            instructor_cell = table.get_cell(row, instructor_col_index)
+            table.bind_cell(row, instructor_col_index, "<Button-3>", lambda event, t_cell=instructor_cell:
+            self.open_professor_profile(event, t_cell))
+            av_cell = table.get_cell(row, av_col_index)
+            table.bind_cell(row, av_col_index, "<Button-3>", lambda event, t_cell=av_cell:
+            TeraTermUI.open_student_help(event, t_cell))
+
     # finds if there's already a course in the tables with the same exact params
     def find_duplicate(self, new_display_class, new_semester, show_all_sections_state, new_table_values):
         for index, (display_class, table_widget, semester, existing_show_all_sections_state, _) in enumerate(
@@ -7373,101 +7386,20 @@ class TeraTermUI(customtkinter.CTk):
                     return index
         return None
 
-    # will automatically sort the data of a new table being added to the current selected sorting option
-    def sort_data(self, data, sort_by_option):
-        translation = self.load_language()
-        headers = list(data[0].keys()) if data else []
-        time_key = translation["times"] if translation["times"] in headers else None
-        av_key = translation["av"] if translation["av"] in headers else None
-        section_key = translation["sec"] if translation["sec"] in headers else None
-        memoized_times = {}
-
-        def get_time_minutes(t_row):
-            if not time_key or not t_row.get(time_key) or t_row.get(time_key).strip().lower() == "tba":
-                return float("inf")
-
-            times_str = t_row.get(time_key, "")
-            times_key = tuple(times_str.strip().split("\n"))
-            if times_key in memoized_times:
-                return memoized_times[times_key]
-
-            total_minutes = 0
-            for t in times_key:
-                if t in memoized_times:
-                    minutes = memoized_times[t]
-                else:
-                    try:
-                        minutes = int(datetime.strptime(t, "%I:%M %p").strftime("%H")) * 60 + \
-                                  int(datetime.strptime(t, "%I:%M %p").strftime("%M"))
-                        memoized_times[t] = minutes
-                    except ValueError:
-                        minutes = float("inf")
-                        memoized_times[t] = minutes
-                if minutes == float("inf"):
-                    return minutes
-                total_minutes += minutes
-
-            memoized_times[times_key] = total_minutes
-            return total_minutes
-
-        def parse_av_value(av_value):
-            try:
-                av_int = int(av_value)
-                if 100 <= av_int <= 999:
-                    return float("inf")
-                return av_int
-            except ValueError:
-                return float("inf")
-
-        entries_with_section = []
-        entries_without_section = {}
-        non_standard_positions = []
-        last_section_key = None
-
-        for i, row in enumerate(data):
-            if section_key and row.get(section_key):
-                section = row.get(section_key).strip()
-                entries_with_section.append((section, row))
-                last_section_key = section
-            elif last_section_key:
-                if last_section_key not in entries_without_section:
-                    entries_without_section[last_section_key] = []
-                entries_without_section[last_section_key].append(row)
-            else:
-                non_standard_positions.append((i, row))
-
-        def sort_key(entry, primary_key, secondary_key):
-            primary_value = get_time_minutes(entry[1]) if primary_key == time_key else parse_av_value(
-                entry[1].get(primary_key, ""))
-            secondary_value = get_time_minutes(entry[1]) if secondary_key == time_key else parse_av_value(
-                entry[1].get(secondary_key, ""))
-
-            if primary_value == float("inf"):
-                primary_value = float("-inf") if reverse_sort else float("inf")
-            if secondary_value == float("inf"):
-                secondary_value = float("-inf") if reverse_sort else float("inf")
-
-            return primary_value, secondary_value
-
-        reverse_sort = False
-        if sort_by_option in [translation["time_asc"], translation["time_dec"]] and time_key:
-            reverse_sort = (sort_by_option == translation["time_dec"])
-            entries_with_section.sort(key=lambda x: sort_key(x, time_key, av_key), reverse=reverse_sort)
-            non_standard_positions.sort(key=lambda x: sort_key(x, time_key, av_key), reverse=reverse_sort)
-        elif sort_by_option in [translation["av_asc"], translation["av_dec"]] and av_key:
-            reverse_sort = (sort_by_option == translation["av_dec"])
-            entries_with_section.sort(key=lambda x: sort_key(x, av_key, time_key), reverse=reverse_sort)
-            non_standard_positions.sort(key=lambda x: sort_key(x, av_key, time_key), reverse=reverse_sort)
-
-        sorted_data = []
-        for section, row in entries_with_section:
-            sorted_data.append(row)
-            if section in entries_without_section:
-                sorted_data.extend(entries_without_section[section])
-        for _, row in non_standard_positions:
-            sorted_data.append(row)
-
-        return sorted_data
+    # parsed sections of every searched table by (course, semester) and then section code, the conflict checker
+    # uses them instead of the usual schedule of the section code
+    def searched_sections(self):
+        sections = {}
+        for display_class, table_widget, semester, _, _ in self.class_table_pairs:
+            sort_index = self.original_table_data.get(table_widget)
+            if sort_index is None:
+                continue
+            # labels become "<course> #n - <semester>" once tables of more than one semester are shown
+            class_name = display_class.cget("text").split("-")[0].strip().split(" #")[0]
+            by_code = sections.setdefault((class_name, semester), {})
+            for section in sort_index.sections:
+                by_code.setdefault(section.sec, section)
+        return sections
 
     # sorts the tables by the selected criteria (AV spaces or Time)
     def sort_tables(self, sort_by_option):
@@ -7477,118 +7409,10 @@ class TeraTermUI(customtkinter.CTk):
                 (not self.last_sort_option and sort_by_option == translation["original_data"]):
             return
 
-        if sort_by_option == translation["original_data"]:
-            for _, table, _, _, _ in self.class_table_pairs:
-                original_data = self.original_table_data[table]
-                table.update_values(original_data)
-            self.last_sort_option = (sort_by_option, len(self.class_table_pairs))
-            self.after(0, lambda: self.search_scrollbar.scroll_to_top())
-            self.after(0, lambda: self.focus_set())
-            return
-
-        headers = None
-        time_index = av_index = section_index = -1
-
+        headers = TeraTermUI.searched_class_headers(translation)
+        option_key = SectionSortIndex.option_key(sort_by_option, translation)
         for _, table, _, _, _ in self.class_table_pairs:
-            table_data = table.values
-            if not headers:
-                headers = table_data[0]
-                time_index = headers.index(translation["times"]) if translation["times"] in headers else -1
-                av_index = headers.index(translation["av"]) if translation["av"] in headers else -1
-                section_index = headers.index(translation["sec"]) if translation["sec"] in headers else -1
-
-            memoized_times = {}
-
-            def get_time_minutes(t_row):
-                if time_index == -1 or not t_row[time_index] or t_row[time_index].strip().lower() == "tba":
-                    return float("inf")
-
-                times_key = tuple(t_row[time_index].strip().split("\n"))
-                if times_key in memoized_times:
-                    return memoized_times[times_key]
-
-                total_minutes = 0
-                for t in times_key:
-                    if t in memoized_times:
-                        minutes = memoized_times[t]
-                    else:
-                        try:
-                            minutes = int(datetime.strptime(t, "%I:%M %p").strftime("%H")) * 60 + \
-                                      int(datetime.strptime(t, "%I:%M %p").strftime("%M"))
-                            memoized_times[t] = minutes
-                        except ValueError:
-                            minutes = float("inf")
-                            memoized_times[t] = minutes
-                    total_minutes += minutes
-                    if minutes == float("inf"):
-                        return minutes
-
-                memoized_times[times_key] = total_minutes
-                return total_minutes
-
-            def parse_av_value(av_value):
-                try:
-                    av_int = int(av_value)
-                    if 100 <= av_int <= 999:
-                        return float("inf")
-                    return av_int
-                except ValueError:
-                    return float("inf")
-
-            entries_with_section = []
-            entries_without_section = {}
-            non_standard_positions = []
-            last_section_key = None
-
-            for i, row in enumerate(table_data[1:]):
-                if section_index != -1 and row[section_index].strip():
-                    section_key = row[section_index].strip()
-                    entries_with_section.append((section_key, row))
-                    last_section_key = section_key
-                elif last_section_key:
-                    if last_section_key not in entries_without_section:
-                        entries_without_section[last_section_key] = []
-                    entries_without_section[last_section_key].append(row)
-                else:
-                    non_standard_positions.append((i + 1, row))
-
-            def sort_key(entry, primary_index, secondary_index):
-                primary_value = get_time_minutes(entry[1]) if primary_index == time_index else parse_av_value(
-                    entry[1][primary_index])
-                secondary_value = get_time_minutes(entry[1]) if secondary_index == time_index else parse_av_value(
-                    entry[1][secondary_index])
-
-                if primary_value == float("inf"):
-                    primary_value = float("-inf") if reverse_sort else float("inf")
-                if secondary_value == float("inf"):
-                    secondary_value = float("-inf") if reverse_sort else float("inf")
-
-                return primary_value, secondary_value
-
-            reverse_sort = False
-            if sort_by_option in [translation["time_asc"], translation["time_dec"]] and time_index != -1:
-                reverse_sort = (sort_by_option == translation["time_dec"])
-                sort_key_func = lambda x: sort_key(x, time_index, av_index)
-            elif sort_by_option in [translation["av_asc"], translation["av_dec"]] and av_index != -1:
-                reverse_sort = (sort_by_option == translation["av_dec"])
-                sort_key_func = lambda x: sort_key(x, av_index, time_index)
-
-            with ThreadPoolExecutor() as executor:
-                future1 = executor.submit(lambda: entries_with_section.sort(key=sort_key_func, reverse=reverse_sort))
-                future2 = executor.submit(lambda: non_standard_positions.sort(key=sort_key_func, reverse=reverse_sort))
-
-            future1.result()
-            future2.result()
-
-            final_data = [headers]
-            for section_key, row in entries_with_section:
-                final_data.append(row)
-                if section_key in entries_without_section:
-                    final_data.extend(entries_without_section[section_key])
-            for _, row in non_standard_positions:
-                final_data.append(row)
-
-            table.update_values(final_data)
+            table.update_values([headers] + self.original_table_data[table].rows(option_key))
 
         self.last_sort_option = (sort_by_option, len(self.class_table_pairs))
         self.after(0, lambda: self.search_scrollbar.scroll_to_top())
@@ -7939,9 +7763,9 @@ class TeraTermUI(customtkinter.CTk):
             try:
                 timings.Timings.window_find_timeout = 0.5
                 timings.Timings.window_find_retry = 0.1
-                self.uprb.UprbayTeraTermVt.type_keys("%e")
+                self.type_keys("%e")
                 if attempt < 1:
-                    self.uprb.UprbayTeraTermVt.type_keys("e")
+                    self.type_keys("e")
                 if attempt >= 1:
                     self.select_screen_item.invoke()
                 break
@@ -7955,7 +7779,7 @@ class TeraTermUI(customtkinter.CTk):
             finally:
                 timings.Timings.window_find_timeout = original_timeout
                 timings.Timings.window_find_retry = original_retry
-        self.uprb.UprbayTeraTermVt.type_keys("%c")
+        self.type_keys("%c")
         if self.loading_screen_status is not None and self.loading_screen_status.winfo_exists():
             self.loading_screen.attributes("-topmost", False)
             self.loading_screen.lower()
@@ -7998,16 +7822,16 @@ class TeraTermUI(customtkinter.CTk):
             copy = pyperclip.paste()
             latest_term = TeraTermUI.get_latest_term(copy)
             if latest_term == "Latest term not found":
-                self.uprb.UprbayTeraTermVt.type_keys("{TAB 2}SRM{ENTER}")
+                self.type_keys("{TAB 2}SRM{ENTER}")
                 self.reset_activity_timer()
                 return "error"
             elif latest_term == "No active semester":
                 translation = self.load_language()
                 if "INVALID ACTION" in copy:
-                    self.uprb.UprbayTeraTermVt.type_keys("SRM" + self.DEFAULT_SEMESTER + "{ENTER}")
+                    self.type_keys("SRM" + self.DEFAULT_SEMESTER + "{ENTER}")
                     self.reset_activity_timer()
                 else:
-                    self.uprb.UprbayTeraTermVt.type_keys("{TAB}SRM" + self.DEFAULT_SEMESTER + "{ENTER}")
+                    self.type_keys("{TAB}SRM" + self.DEFAULT_SEMESTER + "{ENTER}")
                     self.reset_activity_timer()
                 self.after(100, self.show_error_message, 320, 235, translation["no_active_semester"])
                 return "negative"
@@ -8016,13 +7840,7 @@ class TeraTermUI(customtkinter.CTk):
                     self.DEFAULT_SEMESTER = latest_term["percent"]
                 elif latest_term["asterisk"]:
                     self.DEFAULT_SEMESTER = latest_term["asterisk"]
-                row_exists = self.cursor_db.execute("SELECT 1 FROM user_config").fetchone()
-                if not row_exists:
-                    self.cursor_db.execute("INSERT INTO user_config (default_semester) VALUES (?)",
-                                           (self.DEFAULT_SEMESTER,))
-                else:
-                    self.cursor_db.execute("UPDATE user_config SET default_semester=?",
-                                           (self.DEFAULT_SEMESTER,))
+                self.user_config.set("default_semester", self.DEFAULT_SEMESTER)
                 self.found_latest_semester = True
                 self.update_all_semester_tooltips()
                 return self.DEFAULT_SEMESTER
@@ -8155,205 +7973,24 @@ class TeraTermUI(customtkinter.CTk):
         for widget in entries:
             self.update_semester_tooltip(widget)
 
-    # Captures specific search class data to be extracted and manipulated
     @staticmethod
-    def specific_class_data(data):
-        modified_data = []
-        for item in data:
-            days = item["DAYS"].split(", ")
-            times = item["TIMES"].split(", ")
-            first = True  # Flag to identify the first day and time
-
-            # Split instructor name for the first entry
-            if "INSTRUCTOR" in item:
-                instructor_name = item["INSTRUCTOR"].strip()
-                # Check if there is a comma indicating multiple names
-                if "," in instructor_name:
-                    # Split on comma and format properly
-                    parts = [part.strip() for part in instructor_name.split(",") if part.strip()]
-                    # Check if the last part is a single letter
-                    if len(parts[-1]) == 1 and len(parts) > 1:
-                        # If it's a standalone initial without a period, move to the next line
-                        if not parts[-1].endswith("."):
-                            item["INSTRUCTOR"] = "\n".join(parts)
-                        else:
-                            # If it has a period, keep it in the same line
-                            parts[-2] = f"{parts[-2]}, {parts[-1]}"
-                            parts.pop()
-                            item["INSTRUCTOR"] = "\n".join(parts)
-                    else:
-                        # If there's no single-letter issue, format normally
-                        item["INSTRUCTOR"] = "\n".join(parts)
-                else:
-                    # If there's no comma, just ensure the name is clean with no extra newlines
-                    item["INSTRUCTOR"] = instructor_name
-
-            for day, time_slot in zip(days, times):
-                if first:
-                    # For the first day and time, keep the item details intact but remove additional days and times
-                    modified_item = item.copy()
-                    modified_item["DAYS"] = day
-                    modified_item["TIMES"] = time_slot
-                    first = False  # Unset the flag after the first iteration
-                else:
-                    # For additional days and times, create a new item with only the day and time
-                    modified_item = {key: "" for key in item}  # Initialize all keys with empty strings
-                    modified_item["DAYS"] = day
-                    modified_item["TIMES"] = time_slot
-
-                # Check if the time is just a dash, handle it specifically
-                if modified_item["TIMES"] == "-":
-                    modified_item["TIMES"] = "-"
-                else:
-                    # Process times to have proper format for each entry
-                    times_parts = modified_item["TIMES"].split("-")
-                    if len(times_parts) == 2:
-                        start, end = times_parts
-                        start = start.lstrip("0")
-                        end = end.lstrip("0")
-                        if len(start) > 2:
-                            start = start[:-4] + ":" + start[-4:-2] + " " + start[-2:]
-                        if len(end) > 2:
-                            end = end[:-4] + ":" + end[-4:-2] + " " + end[-2:]
-                        modified_item["TIMES"] = "\n".join([start, end])
-                    else:
-                        # If it does not follow the expected pattern, leave it as is
-                        modified_item["TIMES"] = modified_item["TIMES"]
-
-                modified_data.append(modified_item)
-
-        return modified_data
+    def searched_class_headers(translation):
+        return [translation["sec"], translation["m"], translation["cred"], translation["days"],
+                translation["times"], translation["av"], translation["instructor"]]
 
     # extracts the text from the searched class to get the important information
     @staticmethod
     def extract_class_data(text):
-        from typing import List
-
-        lines = text.split("\n")
-        data: List[dict] = []
-        course_found = False
-        invalid_action = False
-        y_n_found = False
-        y_n_value = None
-        current_section = None
-        term_value = None
-
-        for i, line in enumerate(lines):
-            if "INVALID ACTION" in line:
-                invalid_action = True
-
-            if "COURSE NOT IN COURSE TERM FILE" in line:
-                text_next_to_course = line.split("COURSE NOT IN COURSE TERM FILE")[-1].strip()
-                if text_next_to_course:
-                    course_found = True
-
-            if "ALL (Y/N):" in line:
-                y_n_value = line.split("ALL (Y/N):")[-1].strip()
-                if y_n_value in ["Y", "N"]:
-                    y_n_found = True
-                if y_n_value == "Y":
-                    y_n_value = "on"
-                elif y_n_value == "N":
-                    y_n_value = "off"
-
-            if "TERM:" in line:
-                term_value = line.split("TERM:")[-1].strip()[:3]
-
-        session_types = ["LEC", "LAB", "INT", "PRA", "SEM"]
-        session_pattern = "|".join(session_types)
-        pattern = re.compile(
-            rf"(\w+)\s+(\w)\s+({session_pattern})\s+(\d+\.\d+)\s+(?:\w{{1,2}})?\s+(\w+)\s+([\dAMP\-TBA]+)\s+"
-            rf"([\d\s]+)?\s+.*?\s*([NFUL\s]*.*)"
-        )
-        # Regex pattern to match additional time slots
-        time_pattern = re.compile(r"^(\s+)([A-Z]{1,3})\s+([\dAMP\-]+)\s*$")
-        for line in lines:
-            if any(x in line for x in session_types):
-                match = pattern.search(line)
-                if match:
-                    instructor = match.group(8).strip()
-                    instructor_cleaned = re.sub(r"\b(N|FULL|RSVD|RSTR|CANC)\b", "", instructor).strip()
-                    av_value = next(
-                        (val for val in ["RSVD", "RSTR", "CANC", "999", "998"] if val in instructor),
-                        match.group(7).strip() if match.group(7) else "0")
-                    current_section = {
-                        "SEC": match.group(1),
-                        "M": match.group(2),
-                        "CRED": match.group(4),
-                        "DAYS": [match.group(5)],
-                        "TIMES": [match.group(6)],
-                        "AV": av_value,
-                        "INSTRUCTOR": instructor_cleaned
-                    }
-                    data.append(current_section)
-            else:
-                time_match = time_pattern.search(line)
-                if time_match and current_section:
-                    current_section["DAYS"].append(time_match.group(2))
-                    current_section["TIMES"].append(time_match.group(3))
-        # Combine days and times into single strings
-        for section in data:
-            section["DAYS"] = ", ".join(section["DAYS"])
-            section["TIMES"] = ", ".join(section["TIMES"])
-
-        return data, course_found, invalid_action, y_n_found, y_n_value, term_value
+        parser = ScreenParser()
+        data = list(parser.iter_sections(text.split("\n")))
+        return data, parser.course_found, parser.invalid_action, parser.y_n_found, parser.y_n_value, parser.term_value
 
     # extracts the text from the enrolled classes to get the important information
-    def extract_my_enrolled_classes(self, text):
-        translation = self.load_language()
-        # Regex to match the main course entry line
-        main_pattern = re.compile(
-            r"(\b[A-Z])\s+([A-Z]{4}\d{4}[A-Z0-9]{3})\s+([A-Z])?\s+(.+?)\s+([A-Z]{2})\s*([A-GI-NPW]*)\s+"
-            r"([A-Z]{1,5}|TBA)\s+(\d{4}[AP]M-\d{4}[AP]M|TBA)\s*(?:\s+([\dA-Z]*?)\s+([A-Z\d]{3,4}))?"
-            r"(?=\s+\b[A-Z]|\s*$)", re.DOTALL)
-        # Regex to match additional rows with just DIAS, HORAS
-        additional_pattern = re.compile(r"^[ \t]*([A-Z]{1,5})\s+(\d{4}[AP]M-\d{4}[AP]M|TBA)"
-                                        r"(?:\s+([A-Z\d]{3,4}))?(?!.*CREDITOS|TOTAL)", re.MULTILINE)
-
-        enrolled_classes = []
-        # Iterate through each main class match
-        for m in main_pattern.finditer(text):
-            code = f"{m.group(2)[:4]}-{m.group(2)[4:8]}-{m.group(2)[8:]}"
-            modality = m.group(3) or ""
-            grade = m.group(6) or ""
-            days = m.group(7)
-            times = TeraTermUI.parse_time(m.group(8))
-            room = m.group(10) or ""
-
-            # Append primary schedule entry
-            enrolled_classes.append({
-                translation["course"]: code,
-                translation["m"]: modality,
-                translation["grade"]: grade,
-                translation["days"]: days,
-                translation["times"]: times,
-                translation["room"]: room
-            })
-
-            # Extract block of text after this match and before the next course
-            start = m.end()
-            nxt = main_pattern.search(text, start)
-            block = text[start:(nxt.start() if nxt else len(text))]
-
-            # Search for extra schedule-only rows within the current block
-            for a in additional_pattern.finditer(block):
-                extra_days = a.group(1)
-                extra_times = TeraTermUI.parse_time(a.group(2))
-                extra_room = a.group(3) or ""
-                enrolled_classes.append({
-                    translation["course"]: "",
-                    translation["m"]: modality,
-                    translation["grade"]: "",
-                    translation["days"]: extra_days,
-                    translation["times"]: extra_times,
-                    translation["room"]: extra_room
-                })
-
-        # Capture total credits from footer line
-        credits_match = re.search(r"CREDITOS TOTAL:\s+(\d+\.\d+)", text)
-        total_credits = credits_match.group(1) if credits_match else "0.00"
-
-        return enrolled_classes, total_credits
+    @staticmethod
+    def extract_my_enrolled_classes(text):
+        parser = ScreenParser()
+        enrolled_classes = list(parser.iter_enrolled_classes(text.split("\n")))
+        return enrolled_classes, parser.total_credits
 
     @staticmethod
     def parse_time(time_str):
@@ -8393,7 +8030,7 @@ class TeraTermUI(customtkinter.CTk):
         # Extract and prepare table data with translated headers
         headers = [translation["course"], translation["m"], translation["grade"], translation["days"],
                    translation["times"], translation["room"]]
-        table_data = [headers] + [[cls.get(header, "") for header in headers] for cls in data]
+        table_data = [headers] + [cls.row() for cls in data]
 
         column_widths = [120, 50, 60, 55, 120, 55]
         # Create the table
@@ -8463,6 +8100,7 @@ class TeraTermUI(customtkinter.CTk):
         self.show_success_message(350, 265, translation["pdf_save_success"])
 
     # shows the table of and screen of the selected semester of enrolled classes
+    @trace_span("display_enrolled_data", "ui")
     def display_enrolled_data(self, data, creds, dialog_input):
         lang = self.language_menu.get()
         translation = self.load_language()
@@ -8478,7 +8116,7 @@ class TeraTermUI(customtkinter.CTk):
                    translation["times"], translation["room"]]
         self.dialog_input = dialog_input
         self.ask_semester_refresh = True
-        table_values = [headers] + [[cls.get(header, "") for header in headers] for cls in data]
+        table_values = [headers] + [cls.row() for cls in data]
         enrolled_rows = len(data) + 1
         column_widths = {
             translation["course"]: 112,
@@ -8530,7 +8168,7 @@ class TeraTermUI(customtkinter.CTk):
                     pad_y = 28
                 else:
                     pad_y = 6 if previous_row_had_widgets else 40
-                if row_data[translation["course"]] != "":
+                if row_data.code != "":
                     if self.mod_selection_list[row_index] is None:
                         combined_placeholders = self.placeholder_texts_sections + (
                             "KJ1", "LJ1", "KI1", "LI1", "VM1", "JM1")
@@ -8633,7 +8271,7 @@ class TeraTermUI(customtkinter.CTk):
             for row_index in range(len(self.enrolled_classes_data)):
                 if row_index == 0:
                     pad_y = 28
-                if self.enrolled_classes_data[row_index][translation["course"]] != "":
+                if self.enrolled_classes_data[row_index].code != "":
                     combined_placeholders = self.placeholder_texts_sections + ("KJ1", "LJ1", "KI1", "LI1", "VM1", "JM1")
                     placeholder_text = combined_placeholders[row_index % len(combined_placeholders)]
                     mod_selection = customtkinter.CTkOptionMenu(self.modify_classes_frame,
@@ -8749,8 +8387,7 @@ class TeraTermUI(customtkinter.CTk):
                         for row_index in range(len(self.enrolled_classes_data)):
                             mod_selection = self.mod_selection_list[row_index]
                             change_section_entry = self.change_section_entries[row_index]
-                            course_code_no_section = self.enrolled_classes_data[row_index][
-                                                         translation["course"]].replace("-", "")[:8]
+                            course_code_no_section = self.enrolled_classes_data[row_index].code.replace("-", "")[:8]
                             if mod_selection is not None and change_section_entry is not None:
                                 mod = mod_selection.get()
                                 section = TeraTermUI.sanitize_input(change_section_entry.get(), to_upper=True)
@@ -8766,7 +8403,7 @@ class TeraTermUI(customtkinter.CTk):
                         if not_all_choose and section_pattern and not edge_cases_bool:
                             if not self.wait_for_window():
                                 return
-                            self.uprb.UprbayTeraTermVt.type_keys("SRM{ENTER}1S4" + dialog_input + "{ENTER}")
+                            self.type_keys("SRM{ENTER}1S4" + dialog_input + "{ENTER}")
                             self.after(0, lambda: self.disable_go_next_buttons())
                             text_output = self.capture_screenshot()
                             count_enroll = text_output.count("ENROLLED") + text_output.count("RECOMMENDED")
@@ -8781,22 +8418,19 @@ class TeraTermUI(customtkinter.CTk):
                                         mod = self.mod_selection_list[row_index].get()
                                         section = TeraTermUI.sanitize_input(
                                             self.change_section_entries[row_index].get(), to_upper=True)
-                                        course_code = self.enrolled_classes_data[row_index][
-                                            TeraTermUI.sanitize_input(translation["course"])]
-                                        course_code_no_section = self.enrolled_classes_data[row_index][
-                                                                     translation["course"]].replace("-", "")[:8]
-                                        old_section = self.enrolled_classes_data[row_index][
-                                                          translation["course"]].replace("-", "")[8:]
+                                        course_code = self.enrolled_classes_data[row_index].code
+                                        course_code_no_section = course_code.replace("-", "")[:8]
+                                        old_section = course_code.replace("-", "")[8:]
                                     if mod == translation["drop"] or mod == translation["section"]:
                                         if not first_loop:
                                             text_output = self.wait_for_response(["ENROLLED"])
                                             count_enroll = (text_output.count("ENROLLED") +
                                                             text_output.count("RECOMMENDED"))
                                         first_loop = False
-                                        self.uprb.UprbayTeraTermVt.type_keys("{TAB 3}")
+                                        self.type_keys("{TAB 3}")
                                         for i in range(count_enroll, 0, -1):
-                                            self.uprb.UprbayTeraTermVt.type_keys("{TAB 2}")
-                                        self.uprb.UprbayTeraTermVt.type_keys("D" + course_code + "{ENTER}")
+                                            self.type_keys("{TAB 2}")
+                                        self.type_keys("D" + course_code + "{ENTER}")
                                         self.reset_activity_timer()
                                         text_output = self.capture_screenshot()
                                         if "REQUIRED CO-REQUISITE" in text_output:
@@ -8808,22 +8442,22 @@ class TeraTermUI(customtkinter.CTk):
                                                 "classes": course_code_no_section, "status": "DROPPED",
                                                 "semester": dialog_input}
                                         if not is_final or mod == translation["section"]:
-                                            self.uprb.UprbayTeraTermVt.type_keys("{ENTER 2}")
+                                            self.type_keys("{ENTER 2}")
                                             self.reset_activity_timer()
                                         if mod == translation["section"]:
                                             text_output = self.capture_screenshot()
                                             count_enroll = (text_output.count("ENROLLED") +
                                                             text_output.count("RECOMMENDED"))
-                                            self.uprb.UprbayTeraTermVt.type_keys("{TAB 3}")
+                                            self.type_keys("{TAB 3}")
                                             for i in range(count_enroll, 0, -1):
-                                                self.uprb.UprbayTeraTermVt.type_keys("{TAB 2}")
-                                            self.uprb.UprbayTeraTermVt.type_keys(
+                                                self.type_keys("{TAB 2}")
+                                            self.type_keys(
                                                 "R" + course_code_no_section + section + "{ENTER}")
                                             self.reset_activity_timer()
                                             text_output = self.capture_screenshot()
                                             error_classes = text_output
                                             if not is_final:
-                                                self.uprb.UprbayTeraTermVt.type_keys("{ENTER}")
+                                                self.type_keys("{ENTER}")
                                                 self.reset_activity_timer()
                                             if "INVALID COURSE ID" in text_output or "COURSE CLOSED" in text_output or \
                                                     "R/TC" in text_output or "Closed by Spec-Prog" in text_output or \
@@ -8832,15 +8466,15 @@ class TeraTermUI(customtkinter.CTk):
                                                 text_output = self.capture_screenshot()
                                                 count_enroll = (text_output.count("ENROLLED") +
                                                                 text_output.count("RECOMMENDED"))
-                                                self.uprb.UprbayTeraTermVt.type_keys("{TAB 3}")
+                                                self.type_keys("{TAB 3}")
                                                 for i in range(count_enroll, 0, -1):
-                                                    self.uprb.UprbayTeraTermVt.type_keys("{TAB 2}")
-                                                self.uprb.UprbayTeraTermVt.type_keys("R" + course_code + "{ENTER}")
+                                                    self.type_keys("{TAB 2}")
+                                                self.type_keys("R" + course_code + "{ENTER}")
                                                 self.reset_activity_timer()
                                                 text_output = self.capture_screenshot()
                                                 closed_error = text_output
                                                 if not is_final:
-                                                    self.uprb.UprbayTeraTermVt.type_keys("{ENTER}")
+                                                    self.type_keys("{ENTER}")
                                                     self.reset_activity_timer()
                                                 if "COURSE CLOSED" in text_output:
                                                     section_closed = True
@@ -8864,11 +8498,11 @@ class TeraTermUI(customtkinter.CTk):
                                 text_output = self.wait_for_response(["CONFIRMED", "DROPPED"],
                                                                      init_timeout=False)
                                 if "CONFIRMED" in text_output:
-                                    self.uprb.UprbayTeraTermVt.type_keys("{ENTER}")
+                                    self.type_keys("{ENTER}")
                                 if "DROPPED" in text_output:
-                                    self.uprb.UprbayTeraTermVt.type_keys("{ENTER}")
+                                    self.type_keys("{ENTER}")
                                 try:
-                                    self.uprb.UprbayTeraTermVt.type_keys("SRM{ENTER}1CP" + dialog_input + "{ENTER}")
+                                    self.type_keys("SRM{ENTER}1CP" + dialog_input + "{ENTER}")
                                     self.reset_activity_timer()
                                     try:
                                         self.clipboard_handler.save_clipboard_content()
@@ -8974,14 +8608,14 @@ class TeraTermUI(customtkinter.CTk):
                                                translation["success_modify"])
                             else:
                                 if "INVALID TERM SELECTION" in text_output:
-                                    self.uprb.UprbayTeraTermVt.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
+                                    self.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
                                     self.reset_activity_timer()
                                     self.after(100, self.show_error_message, 300, 215,
                                                translation["invalid_semester"])
                                 else:
                                     if "USO INTERNO" not in text_output and "TERMINO LA MATRICULA" \
                                             not in text_output:
-                                        self.uprb.UprbayTeraTermVt.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
+                                        self.type_keys(self.DEFAULT_SEMESTER + "SRM{ENTER}")
                                         self.reset_activity_timer()
                                         self.after(100, self.show_error_message, 315, 225,
                                                    translation["failed_modify"])
@@ -9043,47 +8677,59 @@ class TeraTermUI(customtkinter.CTk):
                 TeraTermUI.manage_user_input()
 
     # checks whether the program can continue its normal execution or if the server is on maintenance
+    @trace_span("wait_for_prompt", "screen")
     def wait_for_prompt(self, prompt_text, maintenance_text, timeout=15):
         time.sleep(1)
         start_time = time.time()
+        delay = 1
         while True:
-            text_output = self.capture_screenshot()
+            text_output = self.capture_screenshot(delay=delay)
             if maintenance_text in text_output:
                 return "Maintenance message found"
             elif prompt_text in text_output:
                 return "Prompt found"
             elif time.time() - start_time > timeout:
                 return "Timeout"
-            time.sleep(0.5)
+            # unchanged frames skip OCR so the following polls can be much closer together
+            delay = 0
+            time.sleep(ScreenCapturePipeline.POLL_INTERVAL)
 
     # some actions within tera term take some time to process, we have this to wait for the response to show up
+    @trace_span("wait_for_response", "screen")
     def wait_for_response(self, keywords, init_timeout=True, timeout=2.5):
         if init_timeout:
             time.sleep(1)
         start_time = time.time()
         last_text_output = ""
+        delay = 1
         while time.time() - start_time <= timeout:
-            text_output = self.capture_screenshot()
+            text_output = self.capture_screenshot(delay=delay)
             for keyword in keywords:
                 if keyword in text_output:
                     return text_output
             last_text_output = text_output
-            time.sleep(0.5)
+            delay = 0
+            time.sleep(ScreenCapturePipeline.POLL_INTERVAL)
 
         return last_text_output
 
+    # Every keystroke sent to Tera Term goes through here so it shows up in the automation trace
+    @trace_span("type_keys", "input")
+    def type_keys(self, keys):
+        self.uprb.UprbayTeraTermVt.type_keys(keys)
+
     # in here we determine if tera term window is prepared to recieve commands
     def wait_for_window(self):
         try:
             self.focus_tera_term()
             self.uprbay_window.wait("visible", timeout=3)
             if self.run_fix or self.in_student_frame:
-                self.uprb.UprbayTeraTermVt.type_keys("^q")
+                self.type_keys("^q")
             if self.went_to_1PL_screen and self.run_fix:
-                self.uprb.UprbayTeraTermVt.type_keys("X{ENTER}")
+                self.type_keys("X{ENTER}")
                 self.went_to_1PL_screen = False
             elif self.went_to_683_screen and self.run_fix:
-                self.uprb.UprbayTeraTermVt.type_keys("00{ENTER}")
+                self.type_keys("00{ENTER}")
                 self.went_to_683_screen = False
             return True
         except Exception as err:
@@ -9105,15 +8751,15 @@ class TeraTermUI(customtkinter.CTk):
                 to_continue = "return to continue"
                 count_to_continue = text_output.count(to_continue)
                 if "return to continue" in text_output or "INFORMACION ESTUDIANTIL" in text_output:
-                    self.uprb.UprbayTeraTermVt.type_keys("^q")
+                    self.type_keys("^q")
                     if "return to continue" in text_output and "Loading" in text_output:
-                        self.uprb.UprbayTeraTermVt.type_keys("{ENTER 3}")
+                        self.type_keys("{ENTER 3}")
                     elif count_to_continue == 2 or "ZZZ" in text_output:
-                        self.uprb.UprbayTeraTermVt.type_keys("{ENTER 2}")
+                        self.type_keys("{ENTER 2}")
                     elif count_to_continue == 1 or "automaticamente" in text_output:
-                        self.uprb.UprbayTeraTermVt.type_keys("{ENTER}")
+                        self.type_keys("{ENTER}")
                     else:
-                        self.uprb.UprbayTeraTermVt.type_keys("{VK_RIGHT}{VK_LEFT}")
+                        self.type_keys("{VK_RIGHT}{VK_LEFT}")
             self.move_window()
             return True
 
@@ -9197,6 +8843,9 @@ class TeraTermUI(customtkinter.CTk):
                     else:
                         messagebox.showerror("Error", f"Fatal Error!\n\n{str(err)}")
                     self.after(0, lambda: self.end_app(forced=True))
+        # Loads the OCR engine now so the first screenshot doesn't pay for it
+        if self.tesseract_unzipped:
+            self.ocr_worker.health_check()
 
     # determines if tera term .exe selected is actually the offical app
     @staticmethod
@@ -9430,14 +9079,16 @@ class TeraTermUI(customtkinter.CTk):
                             hover_color=("darkred", "use_default", "use_default"))
         response = msg.get()
         if response[0] == translation["update_now"]:
-            self.cursor_db.execute("UPDATE user_config SET update_date = NULL")
+            self.user_config.set("update_date", None)
             self.run_updater(latest_version)
         elif response[0] == translation["download_title"]:
-            self.cursor_db.execute("UPDATE user_config SET update_date = NULL")
+            self.user_config.set("update_date", None)
             webbrowser.open("https://github.com/Hanuwa/TeraTermUI/releases/latest")
 
     # Deletes Tesseract OCR and tera term config file from the temp folder
     def cleanup_temp(self):
+        # The OCR engine has to let go of the Tesseract files before they can be deleted
+        self.ocr_worker.stop()
         tesseract_dir = Path(self.app_temp_dir) / "Tesseract-OCR"
         backup_file_path = Path(self.app_temp_dir) / "TERATERM.ini.bak"
         if self.mode == "Portable":
@@ -9465,6 +9116,7 @@ class TeraTermUI(customtkinter.CTk):
                 shutil.rmtree(self.app_temp_dir)
 
     # error window pop up message
+    @trace_span("show_error_message", "ui")
     def show_error_message(self, width, height, error_msg_text):
         if self.error is not None and self.error.winfo_exists():
             self.error.lift()
@@ -9507,6 +9159,7 @@ class TeraTermUI(customtkinter.CTk):
         gc.collect()
 
     # success window pop up message
+    @trace_span("show_success_message", "ui")
     def show_success_message(self, width, height, success_msg_text):
         translation = self.load_language()
         if self.success is not None and self.success.winfo_exists():
@@ -9560,30 +9213,24 @@ class TeraTermUI(customtkinter.CTk):
     def parse_enrollment_errors(self, text_output, submitted_classes=None):
         translation = self.load_language()
         found_errors = []
-        lines = text_output.splitlines()
 
-        course_section_pattern = re.compile(r"([A-Z]{4})([0-9@]{4})([A-Z0-9]{3})")
-        for line in lines:
-            for code, message in self.enrollment_error_messages.items():
-                if code in line:
-                    match = course_section_pattern.search(line)
-                    if match:
-                        subject, number, section = match.groups()
-                        number = number.replace("@", "0")
-                        formatted = f"{subject}-{number}-{section}"
-                        found_errors.append(f"{formatted}: {message}")
-                    else:
-                        if submitted_classes:
-                            cleaned_line = re.sub(r"[^A-Z0-9]", "", line.upper())
-                            match = get_close_matches(cleaned_line, [cls.upper().replace("-", "") for cls in
-                                                                     submitted_classes], n=1, cutoff=0.6)
-                            if match:
-                                formatted_match = match[0]
-                                found_errors.append(f"{formatted_match}: {message}")
-                            else:
-                                found_errors.append(f"{translation['unknown_class_status']}: {message}")
-                        else:
-                            found_errors.append(f"{translation['unknown_class_status']}: {message}")
+        parser = ScreenParser()
+        for code, formatted, line in parser.iter_error_banners(text_output.splitlines(),
+                                                               self.enrollment_error_messages):
+            message = self.enrollment_error_messages[code]
+            if formatted:
+                found_errors.append(f"{formatted}: {message}")
+            elif submitted_classes:
+                cleaned_line = re.sub(r"[^A-Z0-9]", "", line.upper())
+                match = get_close_matches(cleaned_line, [cls.upper().replace("-", "") for cls in
+                                                         submitted_classes], n=1, cutoff=0.6)
+                if match:
+                    formatted_match = match[0]
+                    found_errors.append(f"{formatted_match}: {message}")
+                else:
+                    found_errors.append(f"{translation['unknown_class_status']}: {message}")
+            else:
+                found_errors.append(f"{translation['unknown_class_status']}: {message}")
 
         return found_errors
 
@@ -9969,10 +9616,10 @@ class TeraTermUI(customtkinter.CTk):
                                                 hover_color=("darkred", "use_default", "use_default"))
                             response = msg.get()
                             if response[0] == translation["update_now"]:
-                                self.cursor_db.execute("UPDATE user_config SET update_date = NULL")
+                                self.user_config.set("update_date", None)
                                 self.run_updater(latest_version)
                             elif response[0] == translation["download_title"]:
-                                self.cursor_db.execute("UPDATE user_config SET update_date = NULL")
+                                self.user_config.set("update_date", None)
                                 webbrowser.open("https://github.com/Hanuwa/TeraTermUI/releases/latest")
 
                         self.after(50, lambda: update())
@@ -10093,21 +9740,20 @@ class TeraTermUI(customtkinter.CTk):
                 if self.search_function_counter == 0:
                     text_output = self.capture_screenshot()
                     if "INVALID ACTION" in text_output and "LISTA DE SECCIONES" in text_output:
-                        self.uprb.UprbayTeraTermVt.type_keys("{TAB 2}SRM{ENTER}")
+                        self.type_keys("{TAB 2}SRM{ENTER}")
                         self.reset_activity_timer()
                 else:
-                    self.uprb.UprbayTeraTermVt.type_keys("{TAB}SRM" + self.DEFAULT_SEMESTER + "{ENTER}")
+                    self.type_keys("{TAB}SRM" + self.DEFAULT_SEMESTER + "{ENTER}")
                     self.reset_activity_timer()
                 text_output = self.capture_screenshot()
                 if "INVALID ACTION" in text_output:
-                    self.uprb.UprbayTeraTermVt.type_keys("{TAB}SRM" + self.DEFAULT_SEMESTER + "{ENTER}")
+                    self.type_keys("{TAB}SRM" + self.DEFAULT_SEMESTER + "{ENTER}")
                     self.reset_activity_timer()
                 elif "PF4=exit" in text_output or "press PF4" in text_output:
-                    self.uprb.UprbayTeraTermVt.type_keys("^v")
+                    self.type_keys("^v")
                     self.reset_activity_timer()
                 self.classes_status.clear()
-                self.cursor_db.execute("UPDATE user_config SET default_semester=NULL")
-                self.connection_db.commit()
+                self.user_config.set("default_semester", None)
                 if not self.error_occurred and not self.show_fix_exe:
                     self.after(100, self.show_information_message, 355, 235,
                                translation["fix_after"])
@@ -10212,156 +9858,161 @@ class TeraTermUI(customtkinter.CTk):
     def stop_check_process_thread(self):
         if not self.stop_check_process.is_set():
             self.stop_check_process.set()
+            if self.check_process_job is not None:
+                self.check_process_job.cancel()
+                self.check_process_job = None
             self.reset_activity_timer()
 
     def start_check_process_thread(self):
-        self.check_process_thread = threading.Thread(target=self.check_process_periodically)
         if self.stop_check_process.is_set():
             self.stop_check_process.clear()
-        self.check_process_thread.daemon = True
-        self.check_process_thread.start()
+        if self.check_process_job is not None:
+            self.check_process_job.cancel()
+        self.check_process_state = None
+        self.check_process_job = self.scheduler.schedule(30 + random.uniform(5, 25), self.check_process_periodically,
+                                                         interval=35, jitter=10, slack=5)
 
-    # checks if tera term is open every so often in its own thread
+    # checks if tera term is open every so often, runs as a scheduler job
     def check_process_periodically(self):
         import pyautogui
 
+        if self.stop_check_process.is_set():
+            return
         lang = self.language_menu.get()
         translation = self.load_language()
-        time.sleep(30 + random.uniform(5, 25))
-        not_running_count = 0
-        power_timeout = TeraTermUI.get_power_timeout()
-        device_type = TeraTermUI.get_device_type()
-        if power_timeout is None:
-            threshold = 120
-        elif power_timeout == "off":
-            threshold = None
-        else:
-            if device_type == "laptop":
-                threshold = power_timeout["DC Power Setting"] * 1 / 4
-            elif device_type == "desktop":
-                threshold = power_timeout["AC Power Setting"] * 1 / 4
-            else:
+        if self.check_process_state is None:
+            power_timeout = TeraTermUI.get_power_timeout()
+            device_type = TeraTermUI.get_device_type()
+            if power_timeout is None:
                 threshold = 120
-        pyautogui.FAILSAFE = False
-        while not self.stop_check_process.is_set():
-            try:
-                idle = self.cursor_db.execute("SELECT idle FROM user_config").fetchone()
-            except Exception as err:
-                idle = ["Disabled"]
-                logging.error("An error occurred: %s", err)
-                self.log_error()
-            if self.loading_screen_status is None and idle[0] != "Disabled":
-                if threshold is not None:
-                    idle_time = get_idle_duration()
-                    if idle_time >= threshold and TeraTermUI.is_win_session_interactive():
-                        ES_DISPLAY_REQUIRED = 0x00000002
-                        ctypes.windll.kernel32.SetThreadExecutionState(ES_DISPLAY_REQUIRED)
-                        pyautogui.press("scrolllock")
-                        time.sleep(1)
-                        pyautogui.press("scrolllock")
-                stats = self.server_monitor.get_stats()
-                host = self.server_monitor.host
-                rating, color = self.server_monitor.get_reliability_rating(lang)
-                if not stats or stats["samples"] <= 30:
-                    sample_count = 40
-                elif stats["failure_rate"] > 20 or (stats.get("median") and stats["median"] > 1000):
-                    sample_count = 80
-                elif stats["failure_rate"] < 5 and stats["median"] is not None and stats["median"] < 200 and stats[
-                    "std_dev"] < 50:
-                    sample_count = 10
-                elif stats["std_dev"] > 100 or stats["max"] > 1000 or stats["average"] > 400:
-                    sample_count = 30
-                else:
-                    sample_count = 20
-                self.server_monitor.sample(count=sample_count)
-                new_sample_count = stats.get("samples")
-                has_new_data = (self.prev_sample_count != new_sample_count)
-                if self.timer_window is not None and self.timer_window.winfo_exists() and has_new_data:
-                    self.server_rating.configure(text=f"{translation['server_status_rating']}{rating}",
-                                                 text_color=color)
-                if has_new_data:
-                    logging.info(f'Server "{host}" Response Time Statistics (ms):\n       {stats}')
-                    self.prev_sample_count = new_sample_count
-                is_running = TeraTermUI.checkIfProcessRunning("ttermpro")
-                if is_running:
-                    if not_running_count > 1 and self.stop_check_idle.is_set():
-                        self.start_check_idle_thread()
-                    not_running_count = 0
-                    self.forceful_countdown_end = False
+            elif power_timeout == "off":
+                threshold = None
+            else:
+                if device_type == "laptop":
+                    threshold = power_timeout["DC Power Setting"] * 1 / 4
+                elif device_type == "desktop":
+                    threshold = power_timeout["AC Power Setting"] * 1 / 4
                 else:
-                    not_running_count += 1
-                    if not_running_count == 1:
-                        def not_running():
-                            self.play_sound("notification.wav")
-                            CTkMessagebox(title=translation["automation_error_title"], icon="warning",
-                                          message=translation["tera_term_stopped_running"], button_width=380)
+                    threshold = 120
+            pyautogui.FAILSAFE = False
+            self.check_process_state = {"threshold": threshold, "not_running_count": 0}
+        state = self.check_process_state
+        threshold = state["threshold"]
+        idle = self.user_config.get("idle")
+        if self.loading_screen_status is None and idle != "Disabled":
+            if threshold is not None:
+                idle_time = get_idle_duration()
+                if idle_time >= threshold and TeraTermUI.is_win_session_interactive():
+                    ES_DISPLAY_REQUIRED = 0x00000002
+                    ctypes.windll.kernel32.SetThreadExecutionState(ES_DISPLAY_REQUIRED)
+                    pyautogui.press("scrolllock")
+                    time.sleep(1)
+                    pyautogui.press("scrolllock")
+            stats = self.server_monitor.get_stats()
+            host = self.server_monitor.host
+            rating, color = self.server_monitor.get_reliability_rating(lang)
+            if not stats or stats["samples"] <= 30:
+                sample_count = 40
+            elif stats["failure_rate"] > 20 or (stats.get("median") and stats["median"] > 1000):
+                sample_count = 80
+            elif stats["failure_rate"] < 5 and stats["median"] is not None and stats["median"] < 200 and stats[
+                "std_dev"] < 50:
+                sample_count = 10
+            elif stats["std_dev"] > 100 or stats["max"] > 1000 or stats["average"] > 400:
+                sample_count = 30
+            else:
+                sample_count = 20
+            self.server_monitor.sample(count=sample_count)
+            new_sample_count = stats.get("samples")
+            has_new_data = (self.prev_sample_count != new_sample_count)
+            if self.timer_window is not None and self.timer_window.winfo_exists() and has_new_data:
+                self.server_rating.configure(text=f"{translation['server_status_rating']}{rating}",
+                                             text_color=color)
+            if has_new_data:
+                logging.debug(f'Server "{host}" Response Time Statistics (ms): {stats}')
+                self.prev_sample_count = new_sample_count
+            is_running = TeraTermUI.checkIfProcessRunning("ttermpro")
+            if is_running:
+                if state["not_running_count"] > 1 and self.stop_check_idle.is_set():
+                    self.start_check_idle_thread()
+                state["not_running_count"] = 0
+                self.forceful_countdown_end = False
+            else:
+                state["not_running_count"] += 1
+                if state["not_running_count"] == 1:
+                    def not_running():
+                        self.play_sound("notification.wav")
+                        CTkMessagebox(title=translation["automation_error_title"], icon="warning",
+                                      message=translation["tera_term_stopped_running"], button_width=380)
 
-                        if not self.forceful_countdown_end:
-                            self.after(50, lambda: not_running())
-                        self.forceful_countdown_end = False
-                    if not_running_count > 1:
-                        self.stop_check_process_thread()
-            time.sleep(30 + random.uniform(5, 15))
+                    if not self.forceful_countdown_end:
+                        self.after(50, lambda: not_running())
+                    self.forceful_countdown_end = False
+                if state["not_running_count"] > 1:
+                    self.stop_check_process_thread()
 
     def stop_check_idle_thread(self):
         if not self.stop_check_idle.is_set():
             self.stop_check_idle.set()
+            if self.check_idle_job is not None:
+                self.check_idle_job.cancel()
+                self.check_idle_job = None
             self.reset_activity_timer()
 
-    # Starts the check for idle thread
+    # Starts the check for idle job
     def start_check_idle_thread(self):
-        idle = self.cursor_db.execute("SELECT idle FROM user_config").fetchone()
-        if idle[0] != "Disabled":
-            self.check_idle_thread = threading.Thread(target=self.check_idle)
+        if self.user_config.get("idle") != "Disabled":
             if self.stop_check_idle.is_set():
                 self.stop_check_idle.clear()
-            self.check_idle_thread.daemon = True
-            self.check_idle_thread.start()
+            if self.check_idle_job is not None:
+                self.check_idle_job.cancel()
+            self.idle_num_check = 0
+            self.last_activity = time.time()
+            self.idle_threshold = 180
+            self.use_temp_threshold = False
+            self.check_idle_job = self.scheduler.schedule(0, self.check_idle, interval=25, slack=5)
 
-    # Checks if the user is idle for 3 minutes and does some action so that Tera Term doesn't close by itself
+    # Checks if the user is idle for 3 minutes and does some action so that Tera Term doesn't close by itself, runs
+    # as a scheduler job every 25 seconds
     def check_idle(self):
+        if self.stop_check_idle.is_set():
+            return
         translation = self.load_language()
-        self.idle_num_check = 0
-        self.last_activity = time.time()
-        self.idle_threshold = 180
-        self.use_temp_threshold = False
         try:
-            while not self.stop_check_idle.is_set():
-                threshold = self.idle_threshold * 0.75 if self.use_temp_threshold else self.idle_threshold
-                if time.time() - self.last_activity >= threshold:
-                    with self.lock_thread:
-                        if TeraTermUI.checkIfProcessRunning("ttermpro"):
-                            translation = self.load_language()
-                            if TeraTermUI.window_exists(translation["idle_warning_title"]):
-                                self.idle_warning.close_messagebox()
-                            if TeraTermUI.is_win_session_interactive():
-                                self.keep_teraterm_open()
-                            self.last_activity = time.time()
-                            self.idle_num_check += 1
-                            if self.use_temp_threshold:
-                                self.use_temp_threshold = False
-                            if self.idle_num_check % 5 == 0:
-                                self.use_temp_threshold = True
-                            if self.idle_num_check == 34 and not self.countdown_running:
-                                def idle_warning():
-                                    self.play_sound("notification.wav")
-                                    self.idle_warning = CTkMessagebox(
-                                        title=translation["idle_warning_title"], message=translation["idle_warning"],
-                                        button_width=380)
-                                    self.idle_warning.lift()
-                                    self.idle_warning.focus_force()
-                                    self.idle_warning.attributes("-topmost", True)
-                                    self.idle_warning.after_idle(self.idle_warning.attributes, "-topmost", False)
-                                    response = self.idle_warning.get()[0]
-                                    if response == "OK":
-                                        self.idle_num_check = max(0, self.idle_num_check // 2)
-
-                                self.after(50, lambda: idle_warning())
-                        else:
-                            self.stop_check_idle_thread()
-                if self.idle_num_check == 35 and not self.countdown_running:
-                    self.stop_check_idle_thread()
-                time.sleep(25)
+            threshold = self.idle_threshold * 0.75 if self.use_temp_threshold else self.idle_threshold
+            if time.time() - self.last_activity >= threshold:
+                with self.lock_thread:
+                    if TeraTermUI.checkIfProcessRunning("ttermpro"):
+                        translation = self.load_language()
+                        if TeraTermUI.window_exists(translation["idle_warning_title"]):
+                            self.idle_warning.close_messagebox()
+                        if TeraTermUI.is_win_session_interactive():
+                            self.keep_teraterm_open()
+                        self.last_activity = time.time()
+                        self.idle_num_check += 1
+                        if self.use_temp_threshold:
+                            self.use_temp_threshold = False
+                        if self.idle_num_check % 5 == 0:
+                            self.use_temp_threshold = True
+                        if self.idle_num_check == 34 and not self.countdown_running:
+                            def idle_warning():
+                                self.play_sound("notification.wav")
+                                self.idle_warning = CTkMessagebox(
+                                    title=translation["idle_warning_title"], message=translation["idle_warning"],
+                                    button_width=380)
+                                self.idle_warning.lift()
+                                self.idle_warning.focus_force()
+                                self.idle_warning.attributes("-topmost", True)
+                                self.idle_warning.after_idle(self.idle_warning.attributes, "-topmost", False)
+                                response = self.idle_warning.get()[0]
+                                if response == "OK":
+                                    self.idle_num_check = max(0, self.idle_num_check // 2)
+
+                            self.after(50, lambda: idle_warning())
+                    else:
+                        self.stop_check_idle_thread()
+            if self.idle_num_check == 35 and not self.countdown_running:
+                self.stop_check_idle_thread()
         except Exception as err:
             logging.error("An error occurred: %s", err)
             self.log_error()
@@ -10410,25 +10061,17 @@ class TeraTermUI(customtkinter.CTk):
 
     # Disables check_idle functionality
     def disable_enable_idle(self):
-        row_exists = self.cursor_db.execute("SELECT 1 FROM user_config").fetchone()
         if self.disable_idle.get() == "on":
-            if not row_exists:
-                self.cursor_db.execute("INSERT INTO user_config (idle) VALUES (?)", ("Disabled",))
-            else:
-                self.cursor_db.execute("UPDATE user_config SET idle=?", ("Disabled",))
+            self.user_config.set("idle", "Disabled")
             self.stop_check_idle_thread()
         elif self.disable_idle.get() == "off":
-            if not row_exists:
-                self.cursor_db.execute("INSERT INTO user_config (idle) VALUES (?)", ("Enabled",))
-            else:
-                self.cursor_db.execute("UPDATE user_config SET idle=?", ("Enabled",))
+            self.user_config.set("idle", "Enabled")
             if self.auto_enroll is not None:
                 self.auto_enroll.configure(state="normal")
             if self.run_fix and TeraTermUI.checkIfProcessRunning("ttermpro"):
                 self.start_check_idle_thread()
                 self.keep_teraterm_open()
                 self.reset_activity_timer()
-        self.connection_db.commit()
 
     def keybind_disable_enable_audio(self, source):
         if source == "tera":
@@ -10444,7 +10087,6 @@ class TeraTermUI(customtkinter.CTk):
         self.disable_enable_audio(source)
 
     def disable_enable_audio(self, source):
-        row_exists = self.cursor_db.execute("SELECT 1 FROM user_config").fetchone()
         if source == "tera":
             is_on = self.disable_audio_tera.get() == "on"
             column_name = "audio_tera"
@@ -10453,12 +10095,7 @@ class TeraTermUI(customtkinter.CTk):
             column_name = "audio_app"
         else:
             return
-        new_value = "Disabled" if is_on else "Enabled"
-        if not row_exists:
-            self.cursor_db.execute(f"INSERT INTO user_config ({column_name}) VALUES (?)", (new_value,))
-        else:
-            self.cursor_db.execute(f"UPDATE user_config SET {column_name}=?", (new_value,))
-        self.connection_db.commit()
+        self.user_config.set(column_name, "Disabled" if is_on else "Enabled")
         if source == "tera":
             self.set_beep_sound(self.teraterm_config, is_on)
             self.muted_tera = is_on
@@ -10729,6 +10366,15 @@ class TeraTermUI(customtkinter.CTk):
         self.qa_table = [[translation["q"], translation["a"]],
                          [translation["q1"], translation["a1"]],
                          [translation["q2"], translation["a2"]]]
+        self.timings_text = None
+        self.timings = None
+        if self.tracer.last_flow is not None:
+            flow, elapsed = self.tracer.last_flow
+            self.timings_text = customtkinter.CTkLabel(
+                self.status_frame, text=translation["timings_title"].replace("{action}", flow)
+                .replace("{seconds}", f"{elapsed:.2f}"), font=customtkinter.CTkFont(size=15, weight="bold"))
+            self.timings = [[translation["timings_step"], translation["timings_calls"], translation["timings_total"]]]
+            self.timings.extend([step, str(count), f"{total:.2f}"] for step, count, total in self.tracer.last_summary)
 
     # Creates the status window
     def status_button_event(self):
@@ -10782,6 +10428,11 @@ class TeraTermUI(customtkinter.CTk):
         self.faq_text.pack()
         self.faq = CTkTable(self.status_frame, row=3, column=2, values=self.qa_table, hover=False)
         self.faq.pack(expand=True, fill="both", padx=20, pady=10)
+        if self.timings_text is not None:
+            self.timings_text.pack()
+            self.timings_table = CTkTable(self.status_frame, column=3, row=len(self.timings), values=self.timings,
+                                          hover=False)
+            self.timings_table.pack(expand=True, fill="both", padx=20, pady=10)
         self.feedback_text.lang = lang
         self.status.focus_set()
         self.status_tooltip.show()
@@ -10862,7 +10513,8 @@ class TeraTermUI(customtkinter.CTk):
 
         attrs_to_clear = ["status_frame", "status_title", "version", "feedback_text", "feedback_send",
                           "check_update_text", "check_update_btn", "website", "website_link", "notaso", "notaso_link",
-                          "keybinds_text", "keybinds_table", "keybinds", "faq_text", "qa_table", "faq"]
+                          "keybinds_text", "keybinds_table", "keybinds", "faq_text", "qa_table", "faq",
+                          "timings_text", "timings_table", "timings"]
         for attr in attrs_to_clear:
             if hasattr(self, attr):
                 obj = getattr(self, attr)
@@ -10967,8 +10619,7 @@ class TeraTermUI(customtkinter.CTk):
         if response[0] == "Yes" or response[0] == "Sí":
             if not self.disable_feedback:
                 current_date = datetime.today().strftime("%Y-%m-%d")
-                date_record = self.cursor_db.execute("SELECT feedback_date FROM user_config").fetchone()
-                if date_record is None or date_record[0] != current_date:
+                if self.user_config.get("feedback_date") != current_date:
                     feedback = self.feedback_text.get("1.0", customtkinter.END).strip()
                     feedback = re.sub(r"[\u200B-\u200D\u2060\uFEFF]", "", feedback)
                     word_count = len(feedback.split())
@@ -11031,14 +10682,7 @@ class TeraTermUI(customtkinter.CTk):
                                       message=translation["feedback_success"], button_width=380)
 
                     self.after(50, lambda: show_success())
-                    row_exists = self.cursor_db.execute("SELECT 1 FROM user_config").fetchone()
-                    if not row_exists:
-                        self.cursor_db.execute("INSERT INTO user_config (feedback_date) VALUES (?)",
-                                               (current_date,))
-                    else:
-                        self.cursor_db.execute("UPDATE user_config SET feedback_date=?",
-                                               (current_date,))
-                    self.connection_db.commit()
+                    self.user_config.set("feedback_date", current_date)
                 else:
                     if not self.connection_error:
                         def show_error():
@@ -11201,17 +10845,8 @@ class TeraTermUI(customtkinter.CTk):
                     self.teraterm_config = os.path.join(self.teraterm_directory, "TERATERM.ini")
                 else:
                     self.teraterm5_first_boot = True
-            row_exists = self.cursor_db.execute("SELECT 1 FROM user_config").fetchone()
-            if not row_exists:
-                self.cursor_db.execute(
-                    "INSERT INTO user_config (directory, location, config) VALUES (?, ?, ?)",
-                    (self.teraterm_directory, self.teraterm_exe_location, self.teraterm_config)
-                )
-            else:
-                self.cursor_db.execute("UPDATE user_config SET directory=?", (self.teraterm_directory,))
-                self.cursor_db.execute("UPDATE user_config SET location=?", (self.teraterm_exe_location,))
-                self.cursor_db.execute("UPDATE user_config SET config=?", (self.teraterm_config,))
-            self.connection_db.commit()
+            self.user_config.update(directory=self.teraterm_directory, location=self.teraterm_exe_location,
+                                    config=self.teraterm_config)
             self.changed_location = True
             self.edit_teraterm_ini(self.teraterm_config)
             self.after(100, self.show_success_message, 350, 265, translation["tera_term_success"])
@@ -11310,20 +10945,8 @@ class TeraTermUI(customtkinter.CTk):
                     self.teraterm_config = os.path.join(self.teraterm_directory, "TERATERM.ini")
                 else:
                     self.teraterm5_first_boot = True
-                row_exists = self.cursor_db.execute("SELECT 1 FROM user_config").fetchone()
-                if not row_exists:
-                    self.cursor_db.execute(
-                        "INSERT INTO user_config (directory, location, config) VALUES (?, ?, ?)",
-                        (self.teraterm_directory, self.teraterm_exe_location, self.teraterm_config)
-                    )
-                else:
-                    self.cursor_db.execute("UPDATE user_config SET directory=?",
-                                           (self.teraterm_directory,))
-                    self.cursor_db.execute("UPDATE user_config SET location=?",
-                                           (self.teraterm_exe_location,))
-                    self.cursor_db.execute("UPDATE user_config SET config=?",
-                                           (self.teraterm_config,))
-                self.connection_db.commit()
+                self.user_config.update(directory=self.teraterm_directory, location=self.teraterm_exe_location,
+                                        config=self.teraterm_config)
                 self.changed_location = True
                 self.edit_teraterm_ini(self.teraterm_config)
                 self.show_success_message(350, 265, translation["tera_term_success"])
@@ -11364,57 +10987,31 @@ class TeraTermUI(customtkinter.CTk):
         else:
             return None
 
-    # Search function query for searching for either class code or name
+    # Search function query for searching for either class code or name, only the last keystroke gets evaluated
     def search_classes(self, event):
+        if self.debounce_search:
+            self.after_cancel(self.debounce_search)
 
-        def normalize_string(s):
-            s = unicodedata.normalize("NFD", s)
-            s = s.encode("ascii", "ignore").decode("utf-8")
-            return s.lower()
-
-        def tokenize(s):
-            return re.findall(r"\w+", normalize_string(s))
-
-        def match_score(words, target):
-            if words == target:
-                return 2.0
-            elif target.startswith(words):
-                return 1.5
-            elif words in target:
-                return 1.2
-            elif SequenceMatcher(None, words, target).ratio() >= 0.7:
-                return 1.0
-            return 0.0
+        self.debounce_search = self.after(120, self._execute_search_classes)
 
+    def _execute_search_classes(self):
+        self.debounce_search = None
         translation = self.load_language()
         self.class_list.delete(0, tk.END)
         search_term = self.search_box.get().strip()
         if not search_term:
             return
 
-        normalized_search = normalize_string(search_term)
-        search_words = tokenize(search_term)
+        normalized_search = CourseSearchIndex.normalize_string(search_term)
 
         try:
-            if self.courses_db_cache is None:
-                self.courses_db_cache = self.cursor_db.execute("SELECT name, code FROM courses").fetchall()
-                self.normalized_courses_cache = [(name, code, tokenize(name), tokenize(code))
-                                                 for name, code in self.courses_db_cache]
+            if self.courses_search_index is None:
+                self.courses_search_index = CourseSearchIndex.from_database(self.connection_db)
 
             if normalized_search in ["all", "todo", "todos", "todas"]:
-                results = sorted(self.courses_db_cache, key=lambda x: x[0])
+                results = self.cursor_db.execute("SELECT name, code FROM courses ORDER BY name").fetchall()
             else:
-                results = []
-                for name, code, tokens_name, tokens_code in self.normalized_courses_cache:
-                    total_score = 0
-                    for word in search_words:
-                        scores = [match_score(word, token) for token in tokens_name + tokens_code]
-                        total_score += max(scores, default=0)
-                    if total_score >= len(search_words):
-                        results.append((total_score, name, code))
-
-                results = sorted(results, key=lambda x: -x[0])
-                results = [(name, code) for _, name, code in results]
+                results = self.courses_search_index.search(search_term)
 
             if not results:
                 self.class_list.insert(tk.END, translation["no_results"])
@@ -11597,22 +11194,14 @@ class TeraTermUI(customtkinter.CTk):
         self.disable_audio_app.pack()
         self.fix_text.pack()
         self.fix.pack(pady=5)
-        idle = self.cursor_db.execute("SELECT idle FROM user_config").fetchone()
-        audio_tera = self.cursor_db.execute("SELECT audio_tera FROM user_config").fetchone()
-        audio_app = self.cursor_db.execute("SELECT audio_app FROM user_config").fetchone()
-        skip_auth = self.cursor_db.execute("SELECT skip_auth FROM user_config").fetchone()
-        if idle and idle[0] is not None:
-            if idle[0] == "Disabled":
-                self.disable_idle.select()
-        if audio_tera and audio_tera[0] is not None or self.beep_off_default:
-            if audio_tera[0] == "Disabled" or self.beep_off_default:
-                self.disable_audio_tera.select()
-        if audio_app and audio_app[0] is not None:
-            if audio_app[0] == "Disabled":
-                self.disable_audio_app.select()
-        if skip_auth and skip_auth[0] is not None:
-            if skip_auth[0] == "Yes":
-                self.skip_auth_switch.select()
+        if self.user_config.get("idle") == "Disabled":
+            self.disable_idle.select()
+        if self.user_config.get("audio_tera") == "Disabled" or self.beep_off_default:
+            self.disable_audio_tera.select()
+        if self.user_config.get("audio_app") == "Disabled":
+            self.disable_audio_app.select()
+        if self.user_config.get("skip_auth") == "Yes":
+            self.skip_auth_switch.select()
         self.search_box.lang = lang
         self.help.focus_set()
         self.help_tooltip.show()
@@ -11656,6 +11245,9 @@ class TeraTermUI(customtkinter.CTk):
         self.help.bind("<Escape>", lambda event: self.on_help_window_close())
 
     def on_help_window_close(self):
+        if self.debounce_search:
+            self.after_cancel(self.debounce_search)
+            self.debounce_search = None
         if self.help:
             bindings = self.help.bind()
             if isinstance(bindings, (list, tuple)):
@@ -11765,12 +11357,7 @@ class TeraTermUI(customtkinter.CTk):
                 if latest_version and latest_version.startswith("v"):
                     latest_version = latest_version[1:]
                 current_date = datetime.today().strftime("%Y-%m-%d")
-                row_exists = self.cursor_db.execute("SELECT 1 FROM user_config").fetchone()
-                if not row_exists:
-                    self.cursor_db.execute("INSERT INTO user_config (update_date) VALUES (?)",
-                                           (current_date,))
-                else:
-                    self.cursor_db.execute("UPDATE user_config SET update_date=?", (current_date,))
+                self.user_config.set("update_date", current_date)
 
                 return latest_version
 
@@ -12016,12 +11603,9 @@ class TeraTermUI(customtkinter.CTk):
         if image_name not in self.loaded_images:
             try:
                 image_data = self.images[image_name]
-                with Image.open(TeraTermUI.get_absolute_path(image_data["path"])) as img:
-                    if img.mode not in ("RGB", "RGBA"):
-                        img = img.convert("RGBA" if img.mode == "P" and "transparency" in img.info else "RGB")
-                    if img.size != image_data["size"]:
-                        img = img.resize(image_data["size"], Image.Resampling.LANCZOS)
-                    self.loaded_images[image_name] = customtkinter.CTkImage(light_image=img, size=image_data["size"])
+                img = customtkinter.CTkImage.image_cache.load(TeraTermUI.get_absolute_path(image_data["path"]),
+                                                              image_data["size"])
+                self.loaded_images[image_name] = customtkinter.CTkImage(light_image=img, size=image_data["size"])
             except Exception as err:
                 logging.error(f"Failed to load image {image_name}: {err}")
                 return None
@@ -13541,9 +13125,14 @@ class SmoothFadeInputDialog(customtkinter.CTkInputDialog):
         super().destroy()
 
 
+# The slides around the current one are decoded and resized by the image cache workers ahead of time,
+# the UI thread only polls for them and never waits on image I/O
 class ImageSlideshow(customtkinter.CTkFrame):
     __slots__ = ("slideshow_frame", "image_folder", "interval", "width", "height", "image_files", "_current_image",
-                 "index", "label", "arrow_left", "arrow_right", "after_id", "is_running")
+                 "index", "label", "arrow_left", "arrow_right", "after_id", "is_running", "prefetched", "poll_id")
+
+    PREFETCH_AHEAD = 2
+    POLL_INTERVAL = 25
 
     def __init__(self, parent, image_folder, interval=3, width=300, height=200, *args, **kwargs):
         super().__init__(parent, *args, **kwargs)
@@ -13556,6 +13145,8 @@ class ImageSlideshow(customtkinter.CTkFrame):
         self._current_image = None
         self.after_id = None
         self.is_running = True
+        self.prefetched = {}
+        self.poll_id = None
 
         self._setup_ui()
 
@@ -13594,34 +13185,73 @@ class ImageSlideshow(customtkinter.CTkFrame):
             logging.error(f"Error loading images from {self.image_folder}: {err}")
             self.image_files = []
 
-    def _load_and_resize_image(self, filepath):
-        try:
-            with Image.open(filepath) as img:
-                if img.mode not in ("RGB", "RGBA"):
-                    img = img.convert("RGBA" if img.mode == "P" and "transparency" in img.info else "RGB")
-                resized = img.resize((self.width * 2, self.height * 2), Image.Resampling.LANCZOS)
-                return customtkinter.CTkImage(light_image=resized, size=(self.width, self.height))
-        except Exception as err:
-            logging.error(f"Error loading image {filepath}: {err}")
-            return None
+    # runs on an image cache worker: decodes the slide and also resizes it to the size the label will display
+    @staticmethod
+    def _load_and_resize_image(filepath, size, display_size):
+        image_cache = customtkinter.CTkImage.image_cache
+        resized = image_cache.load(filepath, size)
+        image_cache.resize(resized, display_size)
+        return resized
+
+    def _prefetch(self, index):
+        image_cache = customtkinter.CTkImage.image_cache
+        future = self.prefetched.get(index)
+        if future is None:
+            scaling = self._get_widget_scaling()
+            display_size = (round(self.width * scaling), round(self.height * scaling))
+            filepath = os.path.join(self.image_folder, self.image_files[index])
+            future = image_cache.submit(ImageSlideshow._load_and_resize_image, filepath,
+                                        (self.width * 2, self.height * 2), display_size)
+            self.prefetched[index] = future
+        return future
+
+    def _prefetch_around(self):
+        count = len(self.image_files)
+        wanted = {(self.index + offset) % count for offset in range(-1, self.PREFETCH_AHEAD + 1)}
+        for index in list(self.prefetched):
+            if index not in wanted:
+                self.prefetched.pop(index).cancel()
+        for index in sorted(wanted, key=lambda i: (i - self.index) % count):
+            self._prefetch(index)
 
     def show_image(self):
         if not self.image_files:
             return
 
-        if hasattr(self, "_current_image") and self._current_image is not None:
-            if hasattr(self.label, "_last_image"):
-                del self.label._last_image
-            self._current_image = None
+        if self.poll_id is not None:
+            self.after_cancel(self.poll_id)
+            self.poll_id = None
+        self._prefetch_around()
+        self._display_when_ready(self.index)
+        self._reset_timer()
 
-        filepath = os.path.join(self.image_folder, self.image_files[self.index])
-        new_image = self._load_and_resize_image(filepath)
+    def _display_when_ready(self, index):
+        self.poll_id = None
+        if index != self.index or not self.image_files:
+            return
+        future = self.prefetched.get(index)
+        if future is None:
+            return
+        if not future.done():
+            # keeps the previous slide on screen until the worker hands over the new one
+            self.poll_id = self.after(self.POLL_INTERVAL, self._display_when_ready, index)
+            return
 
-        if new_image is not None:
-            self._current_image = new_image
-            self.label.configure(image=self._current_image)
+        filepath = os.path.join(self.image_folder, self.image_files[index])
+        try:
+            resized = future.result()
+            new_image = customtkinter.CTkImage(light_image=resized, size=(self.width, self.height))
+        except Exception as err:
+            logging.error(f"Error loading image {filepath}: {err}")
+            self.prefetched.pop(index, None)
+            return
 
-        self._reset_timer()
+        if self._current_image is not None:
+            if hasattr(self.label, "_last_image"):
+                del self.label._last_image
+            self._current_image = None
+        self._current_image = new_image
+        self.label.configure(image=self._current_image)
 
     def cycle_images(self):
         if self._current_image:
@@ -13667,6 +13297,12 @@ class ImageSlideshow(customtkinter.CTkFrame):
         if self.after_id is not None:
             self.after_cancel(self.after_id)
             self.after_id = None
+        if self.poll_id is not None:
+            self.after_cancel(self.poll_id)
+            self.poll_id = None
+        for future in self.prefetched.values():
+            future.cancel()
+        self.prefetched.clear()
 
         if hasattr(self, "_current_image") and self._current_image is not None:
             if hasattr(self.label, "_last_image"):
@@ -13685,12 +13321,110 @@ class ImageSlideshow(customtkinter.CTkFrame):
 
 
 # tool that gives us an estimation of the university's server load
+# Last maxlen latencies with their stats kept up to date on every append: Welford mean/variance, min/max through
+# monotonic queues and a log-bucketed histogram (buckets 1% wide) for the median and percentiles
+class LatencyWindow:
+    GAMMA = 1.01
+    LOG_GAMMA = math.log(GAMMA)
+    MIN_VALUE = 0.001
+
+    def __init__(self, maxlen=2500):
+        self.values = deque()
+        self.maxlen = maxlen
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min_queue = deque()
+        self.max_queue = deque()
+        self.buckets = Counter()
+        self.bucket_keys = []
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        return iter(self.values)
+
+    @staticmethod
+    def bucket(value):
+        return math.floor(math.log(max(value, LatencyWindow.MIN_VALUE)) / LatencyWindow.LOG_GAMMA)
+
+    def append(self, value):
+        if len(self.values) == self.maxlen:
+            self.evict()
+        self.values.append(value)
+        delta = value - self.mean
+        self.mean += delta / len(self.values)
+        self.m2 += delta * (value - self.mean)
+        while self.min_queue and self.min_queue[-1] > value:
+            self.min_queue.pop()
+        self.min_queue.append(value)
+        while self.max_queue and self.max_queue[-1] < value:
+            self.max_queue.pop()
+        self.max_queue.append(value)
+        key = LatencyWindow.bucket(value)
+        if not self.buckets[key]:
+            bisect.insort(self.bucket_keys, key)
+        self.buckets[key] += 1
+
+    def extend(self, values):
+        for value in values:
+            self.append(value)
+
+    def evict(self):
+        value = self.values.popleft()
+        count = len(self.values)
+        if count:
+            delta = value - self.mean
+            self.mean -= delta / count
+            self.m2 = max(self.m2 - delta * (value - self.mean), 0.0)
+        else:
+            self.mean = 0.0
+            self.m2 = 0.0
+        if self.min_queue[0] == value:
+            self.min_queue.popleft()
+        if self.max_queue[0] == value:
+            self.max_queue.popleft()
+        key = LatencyWindow.bucket(value)
+        self.buckets[key] -= 1
+        if not self.buckets[key]:
+            del self.buckets[key]
+            self.bucket_keys.pop(bisect.bisect_left(self.bucket_keys, key))
+
+    def minimum(self):
+        return self.min_queue[0] if self.min_queue else None
+
+    def maximum(self):
+        return self.max_queue[0] if self.max_queue else None
+
+    def std_dev(self):
+        return math.sqrt(self.m2 / (len(self.values) - 1)) if len(self.values) > 1 else 0.0
+
+    # Within 1% of the exact value, linearly interpolated between the two closest ranks of the sorted window
+    def percentile(self, percent):
+        if not self.values:
+            return None
+        rank = (len(self.values) - 1) * (percent / 100.0)
+        return (self.value_at(math.floor(rank)) * (math.floor(rank) + 1 - rank) +
+                self.value_at(min(math.floor(rank) + 1, len(self.values) - 1)) * (rank - math.floor(rank)))
+
+    def value_at(self, index):
+        seen = 0
+        for key in self.bucket_keys:
+            seen += self.buckets[key]
+            if seen > index:
+                value = LatencyWindow.GAMMA ** (key + 0.5)
+                return min(max(value, self.min_queue[0]), self.max_queue[0])
+        return self.max_queue[0]
+
+
 class ServerLoadMonitor:
+    MAX_CONCURRENCY = 100
+
     def __init__(self, csv_path=None, host="uprbay.uprb.edu", port=22):
         self.csv_path = csv_path or os.path.join(os.getcwd(), "server_load.csv")
         self.host = host
         self.port = port
-        self.latencies = deque(maxlen=2500)
+        self.latencies = LatencyWindow(maxlen=2500)
         self.latency_history = set()
         self.failures = 0
         self.failure_streak = 0
@@ -13703,52 +13437,56 @@ class ServerLoadMonitor:
         except socket.gaierror:
             self.ip = self.host
 
-    def measure_latency(self, timeout=5):
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                sock.settimeout(timeout)
-                start = time.time()
-                result = sock.connect_ex((self.ip, self.port))
-                end = time.time()
-                if result == 0:
-                    return (end - start) * 1000
-        except (socket.timeout, ConnectionRefusedError, OSError) as error:
-            logging.debug(f"Socket error during latency measurement: {error}")
-        return None
+    async def measure_latency_async(self, semaphore, timeout=5, jitter=0.0):
+        if jitter:
+            await asyncio.sleep(random.uniform(0, jitter))
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                _, writer = await asyncio.wait_for(asyncio.open_connection(self.ip, self.port), timeout)
+            except (asyncio.TimeoutError, OSError) as error:
+                logging.debug(f"Socket error during latency measurement: {error}")
+                return None
+            latency = (time.perf_counter() - start) * 1000
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+            return latency
+
+    # All the connects run on one event loop, at most max_workers at a time and spread over jitter seconds
+    async def probe(self, count, max_workers=None, jitter=0.2, seq_delay=None):
+        semaphore = asyncio.Semaphore(max(1, min(count, max_workers or ServerLoadMonitor.MAX_CONCURRENCY)))
+        if seq_delay is None:
+            tasks = [asyncio.create_task(self.measure_latency_async(semaphore, jitter=jitter)) for _ in range(count)]
+            for task in asyncio.as_completed(tasks):
+                try:
+                    self.record(await task)
+                except Exception as error:
+                    logging.debug(f"Exception in latency sampling task: {error}")
+                    self.record(None)
+        else:
+            for _ in range(count):
+                self.record(await self.measure_latency_async(semaphore))
+                await asyncio.sleep(seq_delay)
 
-    def sample(self, count=30, concurrent=True, force=False, cooldown=25, max_workers=None, seq_delay=0.3):
+    def record(self, latency):
+        if latency is not None:
+            self.latencies.append(latency)
+            self.failure_streak = 0
+        else:
+            self.failures += 1
+            self.failure_streak += 1
+
+    def sample(self, count=30, concurrent=True, force=False, cooldown=25, max_workers=None, seq_delay=0.3,
+               jitter=0.2):
         now = time.time()
         if now - self.last_sample_time < cooldown and not force:
             return
 
         self.last_sample_time = now
-
-        if concurrent:
-            pool_size = min(count, max_workers or 100)
-            with ThreadPoolExecutor(max_workers=pool_size) as executor:
-                futures = [executor.submit(self.measure_latency) for _ in range(count)]
-                for future in as_completed(futures):
-                    try:
-                        latency = future.result()
-                    except Exception as error:
-                        logging.debug(f"Exception in latency sampling thread: {error}")
-                        latency = None
-                    if latency is not None:
-                        self.latencies.append(latency)
-                        self.failure_streak = 0
-                    else:
-                        self.failures += 1
-                        self.failure_streak += 1
-        else:
-            for _ in range(count):
-                latency = self.measure_latency()
-                if latency is not None:
-                    self.latencies.append(latency)
-                    self.failure_streak = 0
-                else:
-                    self.failures += 1
-                    self.failure_streak += 1
-                time.sleep(seq_delay)
+        asyncio.run(self.probe(count, max_workers, jitter, None if concurrent else seq_delay))
 
     def get_stats(self):
         total_attempts = len(self.latencies) + self.failures
@@ -13763,11 +13501,11 @@ class ServerLoadMonitor:
         }
 
         if self.latencies:
-            min_latency = min(self.latencies)
-            max_latency = max(self.latencies)
-            avg_latency = statistics.mean(self.latencies)
-            median_latency = statistics.median(self.latencies)
-            std_dev = statistics.stdev(self.latencies) if len(self.latencies) > 1 else 0.0
+            min_latency = self.latencies.minimum()
+            max_latency = self.latencies.maximum()
+            avg_latency = self.latencies.mean
+            median_latency = self.latencies.percentile(50)
+            std_dev = self.latencies.std_dev()
 
             stats.update({
                 "min": round(min_latency, 2),
@@ -13889,21 +13627,6 @@ class ServerLoadMonitor:
 
         return ("Unknown", "black") if lang == "English" else ("Desconocido", "black")
 
-    @staticmethod
-    def percentile(data, percent):
-        if not data:
-            return None
-
-        data = sorted(data)
-        k = (len(data) - 1) * (percent / 100.0)
-        f = int(k)
-        c = min(f + 1, len(data) - 1)
-        if f == c:
-            return data[int(k)]
-        d0 = data[f] * (c - k)
-        d1 = data[c] * (k - f)
-        return d0 + d1
-
     def is_responsive(self, avg_cutoff=800, max_cutoff=1500, median_cutoff=700, percentile_cutoff=None,
                       max_failure_rate=20, max_failure_streak=5):
         stats = self.get_stats()
@@ -13920,12 +13643,519 @@ class ServerLoadMonitor:
         if stats["failure_streak"] > max_failure_streak:
             return False
         if percentile_cutoff is not None and self.latencies:
-            perc_val = ServerLoadMonitor.percentile(self.latencies, 90)
+            perc_val = self.latencies.percentile(90)
             if perc_val > percentile_cutoff:
                 return False
         return True
 
 
+# Answers the process checks from one shared scan of the process list that is reused for SNAPSHOT_TTL seconds, once a
+# process has been found by name it's pinned by PID and later checks only ask the OS whether that PID is still alive
+class ProcessTracker:
+    SNAPSHOT_TTL = 0.5
+    lock = threading.Lock()
+    snapshot = None
+    snapshot_time = 0.0
+    tracked = {}
+
+    @classmethod
+    def processes(cls):
+        with cls.lock:
+            now = time.monotonic()
+            if cls.snapshot is None or now - cls.snapshot_time > ProcessTracker.SNAPSHOT_TTL:
+                snapshot = []
+                for proc in psutil.process_iter(attrs=["name"]):
+                    name = proc.info.get("name")
+                    if name:
+                        snapshot.append((proc.pid, name.lower()))
+                cls.snapshot = snapshot
+                cls.snapshot_time = now
+            return cls.snapshot
+
+    @classmethod
+    def invalidate(cls):
+        with cls.lock:
+            cls.snapshot = None
+
+    # Substring match on the process name, same as the old scan in checkIfProcessRunning
+    @classmethod
+    def is_running(cls, name):
+        name = name.lower()
+        proc = cls.tracked.get(name)
+        if proc is not None:
+            try:
+                if proc.is_running() and proc.status() != psutil.STATUS_ZOMBIE:
+                    return True
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+            cls.tracked.pop(name, None)
+            # The pinned process just went away, the snapshot may still list it
+            cls.invalidate()
+        for pid, proc_name in cls.processes():
+            if name in proc_name:
+                try:
+                    cls.tracked[name] = psutil.Process(pid)
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+                return True
+        return False
+
+    @classmethod
+    def count(cls, name):
+        name = name.lower()
+        return sum(1 for _, proc_name in cls.processes() if name in proc_name)
+
+    # Exact matches, returned in the order they were asked for
+    @classmethod
+    def running(cls, *names):
+        running_names = {proc_name for _, proc_name in cls.processes()}
+        return [name for name in (name.lower() for name in names) if name in running_names]
+
+
+# Runs the app's periodic jobs from one daemon thread that sleeps until the earliest job is due, a job may start up to
+# its slack seconds late so that jobs falling close together share a single wakeup. Jobs marked on_tk are handed to the
+# Tk loop through one dispatch queue, the rest run on the executor when one is given. The clock can be swapped for a
+# fake one, run_pending(now) then runs whatever is due without the thread
+class Scheduler:
+    class Job:
+        __slots__ = ("func", "due", "interval", "jitter", "slack", "on_tk", "cancelled", "running")
+
+        def __init__(self, func, due, interval, jitter, slack, on_tk):
+            self.func = func
+            self.due = due
+            self.interval = interval
+            self.jitter = jitter
+            self.slack = slack
+            self.on_tk = on_tk
+            self.cancelled = False
+            self.running = False
+
+        def cancel(self):
+            self.cancelled = True
+
+    def __init__(self, tk_root=None, executor=None, clock=time.monotonic):
+        self.tk_root = tk_root
+        self.executor = executor
+        self.clock = clock
+        self.heap = []
+        self.sequence = 0
+        self.condition = threading.Condition()
+        self.dispatch_queue = queue.SimpleQueue()
+        self.dispatch_pending = False
+        self.thread = None
+        self.stopped = False
+
+    def schedule(self, delay, func, interval=None, jitter=0.0, slack=0.0, on_tk=False):
+        job = Scheduler.Job(func, self.clock() + delay, interval, jitter, slack, on_tk)
+        with self.condition:
+            self.push(job)
+            if self.thread is None and not self.stopped:
+                self.thread = threading.Thread(target=self.run, name="Scheduler", daemon=True)
+                self.thread.start()
+            self.condition.notify()
+        return job
+
+    # Caller holds the condition
+    def push(self, job):
+        self.sequence += 1
+        heapq.heappush(self.heap, (job.due, self.sequence, job))
+
+    # The latest moment the thread can sleep until without running a job past its slack
+    def next_wakeup(self):
+        while self.heap and self.heap[0][2].cancelled:
+            heapq.heappop(self.heap)
+        if not self.heap:
+            return None
+        return min(due + job.slack for due, _, job in self.heap if not job.cancelled)
+
+    def run(self):
+        while True:
+            with self.condition:
+                while not self.stopped:
+                    wakeup = self.next_wakeup()
+                    now = self.clock()
+                    if wakeup is not None and wakeup <= now:
+                        break
+                    self.condition.wait(None if wakeup is None else wakeup - now)
+                if self.stopped:
+                    return
+            self.run_pending()
+
+    def run_pending(self, now=None):
+        now = self.clock() if now is None else now
+        due_jobs = []
+        with self.condition:
+            while self.heap and self.heap[0][0] <= now:
+                _, _, job = heapq.heappop(self.heap)
+                if job.cancelled:
+                    continue
+                due_jobs.append(job)
+                if job.interval is not None:
+                    # Next run counts from when this one was due, a late wakeup doesn't push the whole series back
+                    job.due += job.interval + random.uniform(0, job.jitter)
+                    if job.due <= now:
+                        job.due = now + job.interval
+                    self.push(job)
+        for job in due_jobs:
+            if job.on_tk and self.tk_root is not None:
+                self.dispatch(job)
+            elif job.running:
+                logging.debug(f"Skipping {job.func} while its previous run is still going")
+            elif self.executor is not None:
+                job.running = True
+                self.executor.submit(self.call, job)
+            else:
+                job.running = True
+                self.call(job)
+        return len(due_jobs)
+
+    def call(self, job):
+        try:
+            if not job.cancelled:
+                job.func()
+        except Exception as err:
+            logging.error(f"Scheduled job {job.func} failed: {err}")
+        finally:
+            job.running = False
+
+    # Only the first job queued since the last drain asks Tk for a callback, the drain runs everything queued by then
+    def dispatch(self, job):
+        self.dispatch_queue.put(job)
+        with self.condition:
+            if self.dispatch_pending:
+                return
+            self.dispatch_pending = True
+        try:
+            self.tk_root.after(0, self.drain)
+        except (RuntimeError, TclError) as err:
+            logging.warning(f"Could not hand scheduled jobs to Tk: {err}")
+
+    def drain(self):
+        with self.condition:
+            self.dispatch_pending = False
+        while True:
+            try:
+                job = self.dispatch_queue.get_nowait()
+            except queue.Empty:
+                return
+            self.call(job)
+
+    def stop(self):
+        with self.condition:
+            self.stopped = True
+            self.heap.clear()
+            self.condition.notify()
+
+
+# Collects timing spans of the automation flows as (name, category, start, end, thread) tuples, a span with the "flow"
+# category closes a whole action and leaves a per-step summary of it behind, export() writes the spans in Chrome's
+# trace-event format so they can be opened in chrome://tracing or Perfetto
+class AutomationTracer:
+    active = None
+    MAX_EVENTS = 20000
+
+    def __init__(self, path=None):
+        self.path = path
+        self.events = deque(maxlen=AutomationTracer.MAX_EVENTS)
+        self.origin = time.perf_counter()
+        self.last_flow = None
+        self.last_summary = []
+
+    @contextmanager
+    def span(self, name, category="automation"):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.events.append((name, category, start, end, threading.get_ident()))
+            if category == "flow":
+                self.last_summary = self.summarize(start, end)
+                self.last_flow = (name, end - start)
+
+    # Calls and total seconds per step name, nested steps are counted inside their parents as well
+    def summarize(self, start, end):
+        totals = {}
+        for name, category, span_start, span_end, _ in list(self.events):
+            if category != "flow" and span_start >= start and span_end <= end:
+                count, total = totals.get(name, (0, 0.0))
+                totals[name] = (count + 1, total + span_end - span_start)
+        return sorted(((name, count, total) for name, (count, total) in totals.items()),
+                      key=lambda step: step[2], reverse=True)
+
+    def export(self, path=None):
+        path = path or self.path
+        events = list(self.events)
+        if not path or not events:
+            return
+        pid = os.getpid()
+        trace_events = [{"name": name, "cat": category, "ph": "X", "pid": pid, "tid": tid,
+                         "ts": round((start - self.origin) * 1e6, 1), "dur": round((end - start) * 1e6, 1)}
+                        for name, category, start, end, tid in events]
+        threads = {thread.ident: thread.name for thread in threading.enumerate()}
+        trace_events.extend({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+                            for tid, name in threads.items() if tid is not None)
+        try:
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, file)
+        except OSError as err:
+            logging.warning(f"Could not export the automation trace to {path}: {err}")
+
+
+# Writes error records to logs.txt as JSON lines, the calling thread only puts the record on a queue and a listener
+# thread formats the traceback and writes it, the file rolls over to logs.txt.1... once it reaches MAX_BYTES
+class ErrorLogPipeline:
+    MAX_BYTES = 1024 * 1024
+    BACKUP_COUNT = 3
+
+    # The record reaches the listener untouched, the default prepare() would format the traceback on the caller
+    class Handler(QueueHandler):
+        def prepare(self, record):
+            return record
+
+    class Formatter(logging.Formatter):
+        def format(self, record):
+            entry = {
+                "time": datetime.fromtimestamp(record.created).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
+                "level": record.levelname,
+                "mode": getattr(record, "mode", None),
+                "version": getattr(record, "version", None),
+                "screen": getattr(record, "screen", None),
+                "location": getattr(record, "location", None),
+                "thread": record.threadName,
+                "uptime": round(getattr(record, "uptime", 0.0), 3),
+                "message": record.getMessage(),
+            }
+            if record.exc_info and record.exc_info[0] is not None:
+                entry["traceback"] = "".join(traceback.format_exception(*record.exc_info)).strip()
+            return json.dumps(entry, ensure_ascii=False)
+
+    def __init__(self, path):
+        self.path = path
+        self.started = time.monotonic()
+        self.queue = queue.SimpleQueue()
+        self.logger = logging.getLogger("TeraTermUI.errors")
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        self.handler = ErrorLogPipeline.Handler(self.queue)
+        self.logger.addHandler(self.handler)
+        self.listener = None
+        try:
+            file_handler = RotatingFileHandler(path, maxBytes=ErrorLogPipeline.MAX_BYTES,
+                                               backupCount=ErrorLogPipeline.BACKUP_COUNT, encoding="utf-8", delay=True)
+            file_handler.setFormatter(ErrorLogPipeline.Formatter())
+            self.listener = QueueListener(self.queue, file_handler)
+            self.listener.start()
+        except Exception as err:
+            logging.error(f"Could not start the error log at {path}: {err}")
+            self.logger.removeHandler(self.handler)
+
+    # The innermost traceback frame is where the error was raised, without an exception it's the caller of log_error
+    @staticmethod
+    def location(exc_info):
+        tb = exc_info[2] if exc_info else None
+        if tb is not None:
+            while tb.tb_next is not None:
+                tb = tb.tb_next
+            code, lineno = tb.tb_frame.f_code, tb.tb_lineno
+        else:
+            frame = sys._getframe(3)
+            code, lineno = frame.f_code, frame.f_lineno
+        return f"{code.co_filename}:{code.co_name}:{lineno}"
+
+    def error(self, mode, version, screen, exc_info, message=None):
+        if exc_info is not None and exc_info[0] is None:
+            exc_info = None
+        if message is None:
+            message = repr(exc_info[1]) if exc_info else "Error"
+        self.logger.error(message, exc_info=exc_info, extra={
+            "mode": mode, "version": version, "screen": screen, "location": ErrorLogPipeline.location(exc_info),
+            "uptime": time.monotonic() - self.started})
+
+    def stop(self):
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+            self.logger.removeHandler(self.handler)
+
+
+# One SQLite connection per thread, all on the WAL journal with a busy timeout, so readers never wait on a writer and
+# a writer holding the lock makes the others wait for it instead of failing with "database is locked", connections of
+# threads that have finished are closed when the next thread opens one
+class DatabasePool:
+    BUSY_TIMEOUT = 10
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.connections = {}
+        self.closed = False
+        connection = self.connection()
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.OperationalError as err:
+            if "database is locked" in str(err):
+                raise
+            logging.warning(f"Could not switch the database to WAL: {err}")
+
+    # once close_all() ran no connection is handed out again, so nothing is left open after shutdown
+    def connection(self):
+        if self.closed:
+            logging.warning(f"Database connection requested from {threading.current_thread().name} after the pool "
+                            f"was closed")
+            raise sqlite3.ProgrammingError("Cannot operate on a closed database pool")
+        connection = getattr(self.local, "connection", None)
+        if connection is not None:
+            return connection
+        connection = sqlite3.connect(self.path, timeout=DatabasePool.BUSY_TIMEOUT, check_same_thread=False)
+        connection.execute("PRAGMA synchronous=NORMAL")
+        self.local.connection = connection
+        self.local.cursor = connection.cursor()
+        with self.lock:
+            for thread in [thread for thread in self.connections if not thread.is_alive()]:
+                self.connections.pop(thread).close()
+            self.connections[threading.current_thread()] = connection
+        return connection
+
+    def cursor(self):
+        self.connection()
+        return self.local.cursor
+
+    def close_all(self):
+        with self.lock:
+            connections = list(self.connections.values())
+            self.connections.clear()
+            self.closed = True
+        for connection in connections:
+            try:
+                connection.close()
+            except sqlite3.Error as err:
+                logging.warning(f"Failed to close a database connection: {err}")
+
+
+# Snapshot of saved_classes in id order, read once by load_saved_classes and only rewritten by replace() and clear(),
+# so checking an entry against what was saved is an index into rows, changes holds the (row, column) pairs whose
+# entry no longer matches and any number of rows is supported
+class SavedClassesModel:
+    COLUMNS = ("id", "class", "section", "semester", "action", "timestamp")
+    COLUMN_INDEX = {column: index for index, column in enumerate(COLUMNS)}
+
+    def __init__(self, db_pool):
+        self.db_pool = db_pool
+        self.rows = []
+        self.changes = set()
+
+    def load(self):
+        self.rows = self.db_pool.connection().execute(
+            f"SELECT {', '.join(SavedClassesModel.COLUMNS)} FROM saved_classes ORDER BY id").fetchall()
+        self.changes.clear()
+
+    def value(self, index, column):
+        if index >= len(self.rows):
+            return None
+        return self.rows[index][SavedClassesModel.COLUMN_INDEX[column]]
+
+    def mark_changed(self, index, column, changed):
+        if changed:
+            self.changes.add((index, column))
+        else:
+            self.changes.discard((index, column))
+
+    def reset_changes(self):
+        self.changes.clear()
+
+    # rows are (class, section, semester, action), written in one transaction
+    def replace(self, rows):
+        connection = self.db_pool.connection()
+        with connection:
+            connection.execute("DELETE FROM saved_classes")
+            connection.executemany("INSERT INTO saved_classes (class, section, semester, action, timestamp) "
+                                   "VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)", rows)
+        self.load()
+
+    def clear(self):
+        connection = self.db_pool.connection()
+        with connection:
+            connection.execute("DELETE FROM saved_classes")
+        self.rows = []
+        self.changes.clear()
+
+
+# In-memory mirror of the single user_config row, set() only changes the mirror and marks the column dirty, every
+# dirty column is then written in one transaction shortly after the last change (or by flush() on exit) from its own
+# WAL connection, so toggles never wait on the disk and no thread touches the main cursor for settings
+class UserConfigStore:
+    FLUSH_DELAY = 0.5
+
+    def __init__(self, db_path):
+        self.lock = threading.RLock()
+        self.connection = sqlite3.connect(db_path, check_same_thread=False, timeout=10)
+        try:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+        except sqlite3.Error as err:
+            logging.warning(f"Could not switch the database to WAL: {err}")
+        cursor = self.connection.execute("SELECT * FROM user_config ORDER BY id LIMIT 1")
+        self.columns = [column[0] for column in cursor.description]
+        row = cursor.fetchone()
+        self.row_id = row[self.columns.index("id")] if row else None
+        self.values = dict(zip(self.columns, row)) if row else dict.fromkeys(self.columns)
+        self.dirty = set()
+        self.timer = None
+
+    def get(self, column):
+        with self.lock:
+            return self.values.get(column)
+
+    def set(self, column, value):
+        self.update(**{column: value})
+
+    def update(self, **values):
+        with self.lock:
+            for column, value in values.items():
+                if column not in self.values or column == "id":
+                    logging.warning(f"Ignoring unknown user_config column: {column}")
+                    continue
+                if self.values[column] != value or self.row_id is None:
+                    self.values[column] = value
+                    self.dirty.add(column)
+            if self.dirty and self.timer is None:
+                self.timer = threading.Timer(UserConfigStore.FLUSH_DELAY, self.flush)
+                self.timer.daemon = True
+                self.timer.start()
+
+    def flush(self):
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            if not self.dirty:
+                return
+            columns = sorted(self.dirty)
+            params = [self.values[column] for column in columns]
+            try:
+                with self.connection:
+                    if self.row_id is None:
+                        cursor = self.connection.execute(
+                            f"INSERT INTO user_config ({', '.join(columns)}) "
+                            f"VALUES ({', '.join('?' * len(columns))})", params)
+                        self.row_id = cursor.lastrowid
+                    else:
+                        # The statement text only depends on the columns, sqlite3 reuses it from its cache
+                        self.connection.execute(
+                            f"UPDATE user_config SET {', '.join(f'{column} = ?' for column in columns)} "
+                            f"WHERE id = ?", params + [self.row_id])
+                self.dirty.clear()
+            except sqlite3.Error as err:
+                logging.error(f"Failed to save user config: {err}")
+
+    def close(self):
+        self.flush()
+        with self.lock:
+            self.connection.close()
+
+
 # Manages credentials being saved locally
 class SecureDataStore:
     CURRENT_VERSION = "1.1.0"
@@ -14189,8 +14419,9 @@ class SecureDataStore:
 # they have and restore it afterwards, does not cover all cases and it is not clean either but works well and safe
 class ClipboardHandler:
     def __init__(self, max_data_size=100 * 1024 * 1024, retention_time=timedelta(minutes=30),
-                 key_rotation_interval=timedelta(hours=24)):
+                 key_rotation_interval=timedelta(hours=24), scheduler=None):
         # General configuration
+        self.scheduler = scheduler
         self.MAX_DATA_SIZE = max_data_size
         self.RETENTION_TIME = retention_time
         self.KEY_ROTATION_INTERVAL = key_rotation_interval
@@ -14278,6 +14509,16 @@ class ClipboardHandler:
 
     # Starts a background timer that rotates the encryption key periodically
     def _start_key_rotation_timer(self):
+        if self.scheduler is not None:
+            def rotate():
+                with self.key_rotation_lock:
+                    if self._active:
+                        self._rotate_keys()
+
+            interval = self.KEY_ROTATION_INTERVAL.total_seconds()
+            self._key_rotation_timer = self.scheduler.schedule(interval, rotate, interval=interval, slack=60)
+            return
+
         def rotate_periodically():
             with self.key_rotation_lock:
                 if not self._active:
@@ -14605,6 +14846,7 @@ class ClipboardHandler:
         header_bytes = ctypes.string_at(ctypes.byref(bmi), ctypes.sizeof(bmi))
         return header_bytes + bytes(buf)
 
+    @trace_span("clipboard_save", "clipboard")
     def save_clipboard_content(self):
         if not self._active:
             raise RuntimeError("ClipboardHandler is closed")
@@ -14738,6 +14980,7 @@ class ClipboardHandler:
             logging.error(f"Failed to access clipboard: {error}", exc_info=True)
             raise
 
+    @trace_span("clipboard_restore", "clipboard")
     def restore_clipboard_content(self):
         if not self.clipboard_data:
             logging.debug("No clipboard data to restore")
@@ -14871,6 +15114,899 @@ class ClipboardHandler:
             self.cleanup_all_resources()
 
 
+# Typed record for one section of the "LISTA DE SECCIONES" (1CS) screen, everything we sort or render by is
+# parsed once here, so headers are only translated when the table is drawn
+class SectionRecord:
+    __slots__ = ("sec", "m", "cred", "days", "times", "minutes", "av", "av_value", "instructor_lines")
+
+    def __init__(self, sec, m, cred, av, instructor):
+        self.sec = sec
+        self.m = m
+        self.cred = cred
+        self.days = []
+        self.times = []
+        self.minutes = []
+        self.av = av
+        self.av_value = SectionRecord.parse_av(av)
+        self.instructor_lines = SectionRecord.split_instructor(instructor)
+
+    def add_slot(self, day, time_range):
+        self.days.append(day)
+        self.times.append(time_range)
+        self.minutes.append(SectionRecord.parse_time_range(time_range))
+
+    # AV is only meaningful as a count, 998/999 and flags like RSVD are treated as unknown
+    @staticmethod
+    def parse_av(av):
+        try:
+            av_int = int(av)
+        except ValueError:
+            return None
+        if 100 <= av_int <= 999:
+            return None
+        return av_int
+
+    # "0800AM-0920AM" -> (480, 560) in minutes since midnight, None when it is TBA or malformed
+    @staticmethod
+    def parse_time_range(time_range):
+        parts = time_range.split("-")
+        if len(parts) != 2:
+            return None
+        minutes = []
+        for part in parts:
+            if len(part) < 5 or part[-2:] not in ("AM", "PM") or not part[:-2].isdigit():
+                return None
+            hour, minute = int(part[:-4] or "0"), int(part[-4:-2])
+            if not 1 <= hour <= 12 or minute > 59:
+                return None
+            minutes.append((hour % 12 + (12 if part[-2:] == "PM" else 0)) * 60 + minute)
+        return minutes[0], minutes[1]
+
+    @staticmethod
+    def format_time_range(time_range):
+        if time_range == "-":
+            return time_range
+        times_parts = time_range.split("-")
+        if len(times_parts) != 2:
+            return time_range
+        start, end = times_parts
+        start = start.lstrip("0")
+        end = end.lstrip("0")
+        if len(start) > 2:
+            start = start[:-4] + ":" + start[-4:-2] + " " + start[-2:]
+        if len(end) > 2:
+            end = end[:-4] + ":" + end[-4:-2] + " " + end[-2:]
+        return "\n".join([start, end])
+
+    # Multiple instructors are separated by commas, a trailing initial with a period stays on the same line
+    @staticmethod
+    def split_instructor(instructor):
+        instructor_name = instructor.strip()
+        if "," not in instructor_name:
+            return (instructor_name,)
+        parts = [part.strip() for part in instructor_name.split(",") if part.strip()]
+        if not parts:
+            return ("",)
+        if len(parts[-1]) == 1 and len(parts) > 1 and parts[-1].endswith("."):
+            parts[-2] = f"{parts[-2]}, {parts[-1]}"
+            parts.pop()
+        return tuple(parts)
+
+    # Minutes of the first time slot, this is what the table is sorted by
+    @property
+    def time_value(self):
+        if not self.minutes or self.minutes[0] is None:
+            return None
+        return self.minutes[0][0] + self.minutes[0][1]
+
+    # Display rows of the section, one per day/time slot with the details only on the first one
+    def rows(self):
+        rows = []
+        for day, time_range in zip(self.days, self.times):
+            if not rows:
+                rows.append([self.sec, self.m, self.cred, day, SectionRecord.format_time_range(time_range),
+                             self.av, "\n".join(self.instructor_lines)])
+            else:
+                rows.append(["", "", "", day, SectionRecord.format_time_range(time_range), "", ""])
+        return rows
+
+
+# Typed record for one schedule row of the enrolled classes (1CP) screen, extra rows have an empty code
+class EnrolledClassRecord:
+    __slots__ = ("code", "m", "grade", "days", "times", "room")
+
+    def __init__(self, code, m, grade, days, times, room):
+        self.code = code
+        self.m = m
+        self.grade = grade
+        self.days = days
+        self.times = times
+        self.room = room
+
+    # "8:00 AM\n9:20 AM" -> (480, 560) in minutes since midnight, None when it is TBA
+    @property
+    def minutes(self):
+        return SectionRecord.parse_time_range(self.times.replace(":", "").replace(" ", "").replace("\n", "-"))
+
+    def row(self):
+        return [self.code, self.m, self.grade, self.days, self.times, self.room]
+
+
+# Inverted n-gram index over the course catalog for the help window search box, query words are only scored against
+# the tokens that share a bigram with them and every distinct token is scored once per word, not once per course
+class CourseSearchIndex:
+    MAX_GRAM = 2
+    MAX_RESULTS = 200
+    FUZZY_CUTOFF = 0.7
+
+    # normalized holds the already normalized "name code" text of each row when the database has it stored
+    def __init__(self, rows=(), normalized=None):
+        self.rows = rows
+        self.tokens = []
+        self.token_ids = {}
+        self.token_rows = []
+        self.token_chars = []
+        self.grams = defaultdict(set)
+        for row_index, (name, code) in enumerate(rows):
+            if normalized is not None:
+                tokens = re.findall(r"\w+", normalized[row_index])
+            else:
+                tokens = CourseSearchIndex.tokenize(name) + CourseSearchIndex.tokenize(code)
+            for token in set(tokens):
+                self.add_token(token).append(row_index)
+
+    # Full-text index when the migration could create it, otherwise every course is indexed in memory
+    @staticmethod
+    def from_database(connection):
+        try:
+            return FullTextCourseSearchIndex(connection)
+        except sqlite3.OperationalError as err:
+            logging.info(f"Using the in-memory course index: {err}")
+        columns = {column[1] for column in connection.execute("PRAGMA table_info(courses)")}
+        if "name_normalized" not in columns:
+            return CourseSearchIndex(connection.execute("SELECT name, code FROM courses").fetchall())
+        courses = connection.execute("SELECT name, code, name_normalized || ' ' || code_normalized "
+                                     "FROM courses").fetchall()
+        return CourseSearchIndex([(name, code) for name, code, _ in courses], [text or "" for _, _, text in courses])
+
+    def add_token(self, token):
+        token_id = self.token_ids.get(token)
+        if token_id is None:
+            token_id = len(self.tokens)
+            self.token_ids[token] = token_id
+            self.tokens.append(token)
+            self.token_rows.append([])
+            self.token_chars.append(Counter(token))
+            for size in range(1, CourseSearchIndex.MAX_GRAM + 1):
+                for start in range(len(token) - size + 1):
+                    self.grams[token[start:start + size]].add(token_id)
+        return self.token_rows[token_id]
+
+    def rows_with_tokens(self, token_ids):
+        for token_id in token_ids:
+            yield from self.token_rows[token_id]
+
+    def fetch_rows(self, row_indexes):
+        return [self.rows[row_index] for row_index in row_indexes]
+
+    @staticmethod
+    def normalize_string(s):
+        s = unicodedata.normalize("NFD", s)
+        s = s.encode("ascii", "ignore").decode("utf-8")
+        return s.lower()
+
+    @staticmethod
+    def tokenize(s):
+        return re.findall(r"\w+", CourseSearchIndex.normalize_string(s))
+
+    def match_score(self, word, word_chars, token_id):
+        target = self.tokens[token_id]
+        if word == target:
+            return 2.0
+        elif target.startswith(word):
+            return 1.5
+        elif word in target:
+            return 1.2
+        # ratio() can never reach the cutoff when the lengths or the shared characters are too few
+        cutoff_length = CourseSearchIndex.FUZZY_CUTOFF * (len(word) + len(target))
+        if 2 * min(len(word), len(target)) < cutoff_length:
+            return 0.0
+        target_chars = self.token_chars[token_id]
+        if 2 * sum(min(count, target_chars[char]) for char, count in word_chars.items()) < cutoff_length:
+            return 0.0
+        if SequenceMatcher(None, word, target).ratio() >= CourseSearchIndex.FUZZY_CUTOFF:
+            return 1.0
+        return 0.0
+
+    # Tokens sharing at least one n-gram with the word, anything else can't be an exact, prefix or substring match
+    # and bigrams (instead of trigrams) still keep the close fuzzy matches such as "mate" and "arte"
+    def candidate_tokens(self, word):
+        size = min(len(word), CourseSearchIndex.MAX_GRAM)
+        candidates = set()
+        for start in range(len(word) - size + 1):
+            candidates.update(self.grams.get(word[start:start + size], ()))
+        return candidates
+
+    def search(self, search_term, limit=MAX_RESULTS):
+        search_words = CourseSearchIndex.tokenize(search_term)
+        if not search_words:
+            return []
+
+        totals = defaultdict(float)
+        for word in search_words:
+            scored_tokens = defaultdict(list)
+            word_chars = Counter(word)
+            for token_id in self.candidate_tokens(word):
+                score = self.match_score(word, word_chars, token_id)
+                if score > 0:
+                    scored_tokens[score].append(token_id)
+            # Lowest score first so a row keeps the best one any of its tokens got
+            best_scores = {}
+            for score in sorted(scored_tokens):
+                for row_index in self.rows_with_tokens(scored_tokens[score]):
+                    best_scores[row_index] = score
+            for row_index, score in best_scores.items():
+                totals[row_index] += score
+
+        needed = len(search_words)
+        matches = ((-total, row_index) for row_index, total in totals.items() if total >= needed)
+        return self.fetch_rows([row_index for _, row_index in heapq.nsmallest(limit, matches)])
+
+
+# Same scoring as CourseSearchIndex but the courses stay in SQLite, only the distinct tokens are held in memory and
+# the rows containing the matched ones come from the courses_fts table created by migrate_database()
+class FullTextCourseSearchIndex(CourseSearchIndex):
+    MATCH_BATCH = 200
+
+    def __init__(self, connection):
+        super().__init__()
+        self.connection = connection
+        self.connection.execute("CREATE VIRTUAL TABLE IF NOT EXISTS temp.courses_vocab "
+                                "USING fts5vocab(main, courses_fts, row)")
+        for (term,) in self.connection.execute("SELECT term FROM temp.courses_vocab"):
+            self.add_token(term)
+
+    def rows_with_tokens(self, token_ids):
+        query = "SELECT rowid FROM courses_fts WHERE courses_fts MATCH ?"
+        for start in range(0, len(token_ids), FullTextCourseSearchIndex.MATCH_BATCH):
+            batch = token_ids[start:start + FullTextCourseSearchIndex.MATCH_BATCH]
+            match = " OR ".join(f"\"{self.tokens[token_id]}\"" for token_id in batch)
+            for (row_id,) in self.connection.execute(query, (match,)):
+                yield row_id
+
+    def fetch_rows(self, row_ids):
+        if not row_ids:
+            return []
+        placeholders = ", ".join("?" * len(row_ids))
+        courses = {row_id: (name, code) for row_id, name, code in self.connection.execute(
+            f"SELECT id, name, code FROM courses WHERE id IN ({placeholders})", row_ids)}
+        return [courses[row_id] for row_id in row_ids if row_id in courses]
+
+
+# Keeps the time blocks of the sections being checked sorted per day, when a section changes only that one is moved
+# in or out and the overlaps it had or now has are updated, so asking whether a section conflicts is a lookup
+class ScheduleConflictEngine:
+    DAY_LETTERS = {"L": "Monday", "M": "Tuesday", "W": "Wednesday", "J": "Thursday", "V": "Friday",
+                   "S": "Saturday", "D": "Sunday"}
+
+    def __init__(self):
+        self.blocks = defaultdict(list)
+        self.longest_block = defaultdict(int)
+        self.entries = {}
+        self.conflicts = defaultdict(set)
+
+    # (days, "HH:MM", "HH:MM") from generate_schedule() -> ((day, start, end), ...) in minutes since midnight
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def slots_from_schedule(schedule_info):
+        days, start, end = schedule_info
+        if not days or days == "Online" or not start or not end:
+            return ()
+        start_minutes = int(start[:2]) * 60 + int(start[3:5])
+        end_minutes = int(end[:2]) * 60 + int(end[3:5])
+        return tuple((day, start_minutes, end_minutes) for day in days.split(", "))
+
+    # Time blocks of a section from the search results or the enrolled classes, days holds the letters used by the
+    # terminal for each slot and minutes its (start, end) range
+    @staticmethod
+    def slots_from_section(days_per_slot, minutes_per_slot):
+        slots = []
+        for days, minutes in zip(days_per_slot, minutes_per_slot):
+            if minutes is None:
+                continue
+            for letter in days:
+                day = ScheduleConflictEngine.DAY_LETTERS.get(letter)
+                if day is not None:
+                    slots.append((day, minutes[0], minutes[1]))
+        return tuple(slots)
+
+    # Adds or replaces the section tracked under key, does nothing when neither its code nor its blocks changed
+    def update(self, key, code, slots):
+        slots = tuple(slots)
+        if self.entries.get(key) == (code, slots):
+            return False
+        self.remove(key)
+        self.entries[key] = (code, slots)
+        for day, start, end in slots:
+            for other in self.overlapping(day, start, end):
+                if other != key:
+                    self.conflicts[key].add(other)
+                    self.conflicts[other].add(key)
+            bisect.insort(self.blocks[day], (start, end, key), key=lambda block: block[:2])
+            self.longest_block[day] = max(self.longest_block[day], end - start)
+        return True
+
+    def remove(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return False
+        for day, start, end in entry[1]:
+            blocks = self.blocks[day]
+            index = bisect.bisect_left(blocks, (start, end), key=lambda block: block[:2])
+            while blocks[index][2] != key:
+                index += 1
+            del blocks[index]
+        for other in self.conflicts.pop(key, ()):
+            self.conflicts[other].discard(key)
+        return True
+
+    # Keys with a block on day overlapping [start, end), only blocks that start late enough to reach it are visited
+    def overlapping(self, day, start, end):
+        blocks = self.blocks.get(day)
+        if not blocks:
+            return
+        low = bisect.bisect_right(blocks, start - self.longest_block[day], key=lambda block: block[0])
+        high = bisect.bisect_left(blocks, end, key=lambda block: block[0])
+        for block_start, block_end, other in blocks[low:high]:
+            if start < block_end:
+                yield other
+
+    def has_conflict(self, key, kind=None):
+        conflicts = self.conflicts.get(key)
+        if not conflicts:
+            return False
+        return kind is None or any(other[0] == kind for other in conflicts)
+
+    def conflicting_codes(self, key, kind=None):
+        return {self.entries[other][0] for other in self.conflicts.get(key, ()) if kind is None or other[0] == kind}
+
+    def keys(self, kind):
+        return [key for key in self.entries if key[0] == kind]
+
+    def count(self, kind):
+        return max((key[1] + 1 for key in self.entries if key[0] == kind), default=0)
+
+
+# Sort keys of the sections of a search table, packed into one integer per section when the table is created so
+# switching between the sorting options is only a permutation of the already rendered rows, which gets cached too
+class SectionSortIndex:
+    __slots__ = ("sections", "row_blocks", "keys", "orders")
+    UNKNOWN = 1 << 20
+    KEY_SPAN = (UNKNOWN << 1) + 1
+
+    def __init__(self, sections):
+        self.sections = sections
+        self.row_blocks = [section.rows() for section in sections]
+        time_values = [section.time_value for section in sections]
+        av_values = [section.av_value for section in sections]
+        # Unknown values go last on both directions, so they are packed as +inf when ascending and -inf otherwise
+        self.keys = {}
+        for reverse in (False, True):
+            self.keys[("time", reverse)] = [SectionSortIndex.pack(primary, secondary, reverse)
+                                            for primary, secondary in zip(time_values, av_values)]
+            self.keys[("av", reverse)] = [SectionSortIndex.pack(primary, secondary, reverse)
+                                          for primary, secondary in zip(av_values, time_values)]
+        self.orders = {}
+
+    @staticmethod
+    def pack(primary, secondary, reverse):
+        unknown = -SectionSortIndex.UNKNOWN if reverse else SectionSortIndex.UNKNOWN
+        limit = SectionSortIndex.UNKNOWN - 1
+        primary = unknown if primary is None else max(-limit, min(primary, limit))
+        secondary = unknown if secondary is None else max(-limit, min(secondary, limit))
+        return primary * SectionSortIndex.KEY_SPAN + secondary
+
+    # Translates the selected option of the "Sort By" menu into a key of the index, None keeps the original order
+    @staticmethod
+    def option_key(sort_by_option, translation):
+        return {
+            translation["time_asc"]: ("time", False),
+            translation["time_dec"]: ("time", True),
+            translation["av_asc"]: ("av", False),
+            translation["av_dec"]: ("av", True),
+        }.get(sort_by_option)
+
+    def order(self, option_key):
+        if option_key is None:
+            return range(len(self.sections))
+        order = self.orders.get(option_key)
+        if order is None:
+            keys = self.keys[option_key]
+            order = sorted(range(len(keys)), key=keys.__getitem__, reverse=option_key[1])
+            self.orders[option_key] = order
+        return order
+
+    def rows(self, option_key=None):
+        rows = []
+        for index in self.order(option_key):
+            rows.extend(self.row_blocks[index])
+        return rows
+
+
+# Single-pass, line-oriented parser for the screens we copy out of Tera Term, every pattern is compiled once and
+# each screen is consumed as a stream of lines so the cost grows linearly with the amount of sections on it
+class ScreenParser:
+    SESSION_TYPES = ("LEC", "LAB", "INT", "PRA", "SEM")
+    SESSION_RE = re.compile("|".join(SESSION_TYPES))
+    SECTION_RE = re.compile(
+        rf"(\w+)\s+(\w)\s+({'|'.join(SESSION_TYPES)})\s+(\d+\.\d+)\s+(?:\w{{1,2}})?\s+(\w+)\s+([\dAMP\-TBA]+)\s+"
+        rf"([\d\s]+)?\s+.*?\s*([NFUL\s]*.*)"
+    )
+    EXTRA_TIME_RE = re.compile(r"^(\s+)([A-Z]{1,3})\s+([\dAMP\-]+)\s*$")
+    INSTRUCTOR_FLAGS_RE = re.compile(r"\b(N|FULL|RSVD|RSTR|CANC)\b")
+    AV_FLAGS = ("RSVD", "RSTR", "CANC", "999", "998")
+    ENROLLED_RE = re.compile(
+        r"(\b[A-Z])\s+([A-Z]{4}\d{4}[A-Z0-9]{3})\s+([A-Z])?\s+(.+?)\s+([A-Z]{2})\s*([A-GI-NPW]*)\s+"
+        r"([A-Z]{1,5}|TBA)\s+(\d{4}[AP]M-\d{4}[AP]M|TBA)\s*(?:\s+([\dA-Z]*?)\s+([A-Z\d]{3,4}))?"
+        r"(?=\s+\b[A-Z]|\s*$)")
+    ENROLLED_EXTRA_RE = re.compile(r"^[ \t]*([A-Z]{1,5})\s+(\d{4}[AP]M-\d{4}[AP]M|TBA)"
+                                   r"(?:\s+([A-Z\d]{3,4}))?(?!.*CREDITOS|TOTAL)")
+    TOTAL_CREDITS_RE = re.compile(r"CREDITOS TOTAL:\s+(\d+\.\d+)")
+    COURSE_SECTION_RE = re.compile(r"([A-Z]{4})([0-9@]{4})([A-Z0-9]{3})")
+
+    def __init__(self):
+        self.invalid_action = False
+        self.course_found = False
+        self.y_n_found = False
+        self.y_n_value = None
+        self.term_value = None
+        self.total_credits = "0.00"
+
+    # Scans the search screen header banners of a single line, the last occurrence of each one wins
+    def _scan_search_banners(self, line):
+        if "INVALID ACTION" in line:
+            self.invalid_action = True
+        if "COURSE NOT IN COURSE TERM FILE" in line:
+            if line.split("COURSE NOT IN COURSE TERM FILE")[-1].strip():
+                self.course_found = True
+        if "ALL (Y/N):" in line:
+            y_n_value = line.split("ALL (Y/N):")[-1].strip()
+            if y_n_value in ("Y", "N"):
+                self.y_n_found = True
+            if y_n_value == "Y":
+                y_n_value = "on"
+            elif y_n_value == "N":
+                y_n_value = "off"
+            self.y_n_value = y_n_value
+        if "TERM:" in line:
+            self.term_value = line.split("TERM:")[-1].strip()[:3]
+
+    # Yields every section of the "LISTA DE SECCIONES" screen, extra day/time rows are folded into the
+    # section they belong to before it is handed out, so a record is only yielded once it is complete
+    def iter_sections(self, lines):
+        current_section = None
+        for line in lines:
+            self._scan_search_banners(line)
+            if ScreenParser.SESSION_RE.search(line):
+                match = ScreenParser.SECTION_RE.search(line)
+                if match:
+                    if current_section is not None:
+                        yield current_section
+                    instructor = match.group(8).strip()
+                    av_value = next((val for val in ScreenParser.AV_FLAGS if val in instructor),
+                                    match.group(7).strip() if match.group(7) else "0")
+                    current_section = SectionRecord(match.group(1), match.group(2), match.group(4), av_value,
+                                                    ScreenParser.INSTRUCTOR_FLAGS_RE.sub("", instructor).strip())
+                    current_section.add_slot(match.group(5), match.group(6))
+            elif current_section is not None:
+                time_match = ScreenParser.EXTRA_TIME_RE.search(line)
+                if time_match:
+                    current_section.add_slot(time_match.group(2), time_match.group(3))
+        if current_section is not None:
+            yield current_section
+
+    # Yields every schedule row of the enrolled classes screen, followed by the extra rows of each class
+    def iter_enrolled_classes(self, lines):
+        modality = None
+        for line in lines:
+            if "CREDITOS TOTAL:" in line:
+                credits_match = ScreenParser.TOTAL_CREDITS_RE.search(line)
+                if credits_match:
+                    self.total_credits = credits_match.group(1)
+            matched = False
+            for m in ScreenParser.ENROLLED_RE.finditer(line):
+                matched = True
+                modality = m.group(3) or ""
+                code = f"{m.group(2)[:4]}-{m.group(2)[4:8]}-{m.group(2)[8:]}"
+                yield EnrolledClassRecord(code, modality, m.group(6) or "", m.group(7),
+                                          TeraTermUI.parse_time(m.group(8)), m.group(10) or "")
+            if matched or modality is None:
+                continue
+            extra = ScreenParser.ENROLLED_EXTRA_RE.match(line)
+            if extra:
+                yield EnrolledClassRecord("", modality, "", extra.group(1), TeraTermUI.parse_time(extra.group(2)),
+                                          extra.group(3) or "")
+
+    # Yields (error code, formatted course section or None, line) for every enrollment error banner found
+    def iter_error_banners(self, lines, error_codes):
+        for line in lines:
+            codes = [code for code in error_codes if code in line]
+            if not codes:
+                continue
+            match = ScreenParser.COURSE_SECTION_RE.search(line)
+            formatted = None
+            if match:
+                subject, number, section = match.groups()
+                formatted = f"{subject}-{number.replace('@', '0')}-{section}"
+            for code in codes:
+                yield code, formatted, line
+
+
+# Turns screenshots of Tera Term into text, a frame identical to the previous one is answered without OCR, otherwise
+# the screen is split into bands of pixel rows separated by blank ones and only bands never seen before get recognized,
+# the text of every band is cached by the hash of its pixels so a screen that barely changed costs one or two lines
+class ScreenCapturePipeline:
+    CROP_MARGIN = (2, 10, 10, 2)
+    PAGE_CONFIG = r"--oem 3 --psm 6"
+    LINE_CONFIG = r"--oem 3 --psm 7"
+    BAND_PADDING = 4
+    MAX_LINE_OCR = 4
+    MAX_CACHED_LINES = 512
+    POLL_INTERVAL = 0.1
+
+    # ocr is called as ocr(image, config=...) and defaults to pytesseract, recorded frames can be replayed with a fake
+    def __init__(self, ocr=None):
+        self.ocr = ocr
+        self.line_texts = OrderedDict()
+        self.last_digest = None
+        self.last_text = None
+        self.stats = Counter()
+
+    def reset(self):
+        self.line_texts.clear()
+        self.last_digest = None
+        self.last_text = None
+
+    # Crop of the window borders and grayscale, the upscale is left for the parts that actually go through OCR
+    @staticmethod
+    def preprocess(img):
+        left, top, right, bottom = ScreenCapturePipeline.CROP_MARGIN
+        return img.crop((left, top, img.width - right, img.height - bottom)).convert("L")
+
+    # (top, bottom) pixel rows of every run of rows that aren't a single flat color
+    @staticmethod
+    def find_bands(data, width, height):
+        bands = []
+        top = None
+        for y in range(height):
+            row = data[y * width:(y + 1) * width]
+            blank = row.count(row[:1]) == width
+            if not blank and top is None:
+                top = y
+            elif blank and top is not None:
+                bands.append((top, y))
+                top = None
+        if top is not None:
+            bands.append((top, height))
+        return bands
+
+    def recognize(self, img, config):
+        img = img.resize((img.width * 2, img.height * 2), resample=Image.Resampling.LANCZOS)
+        ocr = self.ocr or pytesseract.image_to_string
+        return ocr(img, config=config)
+
+    def read_band(self, gray, top, bottom, line_height):
+        background = gray.getpixel((0, max(top - 1, 0)))
+        padding = ScreenCapturePipeline.BAND_PADDING
+        band = gray.crop((0, top, gray.width, bottom))
+        padded = Image.new("L", (band.width + padding * 2, band.height + padding * 2), background)
+        padded.paste(band, (padding, padding))
+        # Lines drawn right against each other end up in one band, those still need the block layout
+        config = ScreenCapturePipeline.LINE_CONFIG
+        if bottom - top > line_height * 1.5:
+            config = ScreenCapturePipeline.PAGE_CONFIG
+        return self.recognize(padded, config).strip()
+
+    # Bands of the frame and the pixel hash each one is cached under
+    @staticmethod
+    def fingerprint(gray, data):
+        width = gray.width
+        bands = ScreenCapturePipeline.find_bands(data, width, gray.height)
+        keys = [(width, hashlib.blake2b(data[top * width:bottom * width], digest_size=16).digest())
+                for top, bottom in bands]
+        return bands, keys
+
+    # Screen state straight from the row hashes, None when a row was never recognized and read() has to run
+    def classify(self, img):
+        gray = ScreenCapturePipeline.preprocess(img)
+        data = gray.tobytes()
+        if hashlib.blake2b(data, digest_size=16).digest() == self.last_digest:
+            return ScreenState.from_text(self.last_text, from_cache=True)
+        _, keys = ScreenCapturePipeline.fingerprint(gray, data)
+        if not keys or any(key not in self.line_texts for key in keys):
+            return None
+        self.stats["classified"] += 1
+        return ScreenState.from_lines([self.line_texts[key] for key in keys], from_cache=True)
+
+    def read(self, img):
+        gray = ScreenCapturePipeline.preprocess(img)
+        data = gray.tobytes()
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        if digest == self.last_digest:
+            self.stats["unchanged"] += 1
+            return self.last_text
+
+        bands, keys = ScreenCapturePipeline.fingerprint(gray, data)
+        missing = [index for index, key in enumerate(keys) if key not in self.line_texts]
+        if len(missing) <= ScreenCapturePipeline.MAX_LINE_OCR:
+            self.stats["lines"] += len(missing)
+            line_height = statistics.median(bottom - top for top, bottom in bands) if bands else 0
+            for index in missing:
+                top, bottom = bands[index]
+                self.line_texts[keys[index]] = self.read_band(gray, top, bottom, line_height)
+            for key in keys:
+                self.line_texts.move_to_end(key)
+            text = "".join(self.line_texts[key] + "\n" for key in keys)
+        else:
+            self.stats["pages"] += 1
+            text = self.recognize(gray, ScreenCapturePipeline.PAGE_CONFIG)
+            # Only when every band got exactly one line can the page be split back into the cache
+            lines = [line.strip() for line in text.splitlines() if line.strip()]
+            if len(lines) == len(keys):
+                for key, line in zip(keys, lines):
+                    self.line_texts[key] = line
+                    self.line_texts.move_to_end(key)
+        while len(self.line_texts) > ScreenCapturePipeline.MAX_CACHED_LINES:
+            self.line_texts.popitem(last=False)
+
+        self.last_digest = digest
+        self.last_text = text
+        return text
+
+
+# What the terminal is showing, screen is the code of the screen (1CS, 1VE, 4CM, 683, 1PL...) and flags are the
+# FLAG_KEYWORDS keys whose banner is on it. The code is only taken from a screen title or from the start of the header
+# lines, where the terminal echoes the screen that was typed, since the menu lists every code and the numeric ones
+# also show up as section, room or account numbers in the body
+class ScreenState:
+    __slots__ = ("screen", "flags", "from_cache")
+
+    SCREEN_RE = re.compile(r"^\W{0,3}(1CS|1GP|1PL|1S4|1VE|3DD|4CM|4SP|118|409|683|004|SRM)(?=\s|$)")
+    HEADER_LINES = 2
+    SCREEN_TITLES = {
+        "LISTA DE SECCIONES": "1CS",
+        "PANTALLAS MATRICULA": "SRM",
+        "PANTALLAS GENERALES": "SRM",
+        "OPCIONES PARA EL ESTUDIANTE": "SRM",
+    }
+    MENU_KEYWORDS = ("File", "Edit", "Setup", "Control", "Window", "Help")
+    FLAG_KEYWORDS = {
+        "maintenance": ("REGRESE PRONTO",),
+        "invalid_term": ("INVALID TERM SELECTION",),
+        "invalid_action": ("INVALID ACTION",),
+        "term_outdated": ("TERM OUTDATED",),
+        "changes_blocked": ("NO PUEDE REALIZAR CAMBIOS", "NO PUEDE HACER CAMBIOS"),
+        "conflict": ("CONFLICT",),
+        "course_not_found": ("COURSE NOT IN",),
+        "more_sections": ("MORE SECTIONS",),
+        "sign_in": ("SIGN-IN",),
+        "continue": ("return to continue",),
+    }
+
+    def __init__(self, screen, flags, from_cache=False):
+        self.screen = screen
+        self.flags = flags
+        self.from_cache = from_cache
+
+    def has(self, *flags):
+        return any(flag in self.flags for flag in flags)
+
+    def __repr__(self):
+        return f"ScreenState({self.screen!r}, {sorted(self.flags)!r}, from_cache={self.from_cache})"
+
+    # (code the line starts with or None, code of the title on it or None, flags) of a single line, the same lines
+    # come back on every capture of a screen
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def label_line(line):
+        flags = {flag for flag, keywords in ScreenState.FLAG_KEYWORDS.items()
+                 if any(keyword in line for keyword in keywords)}
+        if sum(1 for keyword in ScreenState.MENU_KEYWORDS if keyword in line) >= 3:
+            flags.add("menu_bar")
+        match = ScreenState.SCREEN_RE.match(line)
+        title = next((code for title, code in ScreenState.SCREEN_TITLES.items() if title in line), None)
+        return (match.group(1) if match else None), title, frozenset(flags)
+
+    @staticmethod
+    def from_lines(lines, from_cache=False):
+        header_screen = None
+        title_screen = None
+        header_lines = 0
+        flags = set()
+        for line in lines:
+            line_screen, line_title, line_flags = ScreenState.label_line(line)
+            if line.strip() and "menu_bar" not in line_flags and header_lines < ScreenState.HEADER_LINES:
+                header_lines += 1
+                if header_screen is None:
+                    header_screen = line_screen
+            if title_screen is None:
+                title_screen = line_title
+            flags.update(line_flags)
+        return ScreenState(title_screen or header_screen, frozenset(flags), from_cache)
+
+    @staticmethod
+    def from_text(text, from_cache=False):
+        return ScreenState.from_lines((text or "").splitlines(), from_cache)
+
+
+# Runs tesseract.exe through pytesseract, a new process loads the model on every call
+class TesseractCliBackend:
+    name = "tesseract.exe"
+
+    def recognize(self, img, config):
+        return pytesseract.image_to_string(img, config=config)
+
+    def close(self):
+        pass
+
+
+# Drives the libtesseract DLL that ships next to tesseract.exe, the eng model is loaded once and stays warm
+class TesseractApiBackend:
+    name = "libtesseract"
+    PSM_RE = re.compile(r"--psm (\d+)")
+
+    def __init__(self, tesseract_cmd, language="eng"):
+        folder = Path(tesseract_cmd).parent
+        libraries = sorted(folder.glob("libtesseract*.dll"))
+        if not libraries:
+            raise OSError(f"libtesseract not found in {folder}")
+        self.lib = ctypes.CDLL(str(libraries[-1]))
+        self.lib.TessBaseAPICreate.restype = ctypes.c_void_p
+        self.lib.TessBaseAPIInit3.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p]
+        self.lib.TessBaseAPISetPageSegMode.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        self.lib.TessBaseAPISetImage.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_int,
+                                                 ctypes.c_int, ctypes.c_int]
+        self.lib.TessBaseAPIGetUTF8Text.argtypes = [ctypes.c_void_p]
+        self.lib.TessBaseAPIGetUTF8Text.restype = ctypes.c_void_p
+        self.lib.TessDeleteText.argtypes = [ctypes.c_void_p]
+        self.lib.TessBaseAPIEnd.argtypes = [ctypes.c_void_p]
+        self.lib.TessBaseAPIDelete.argtypes = [ctypes.c_void_p]
+        self.handle = self.lib.TessBaseAPICreate()
+        tessdata = os.environ.get("TESSDATA_PREFIX") or str(folder / "tessdata")
+        if self.lib.TessBaseAPIInit3(self.handle, tessdata.encode(), language.encode()) != 0:
+            self.lib.TessBaseAPIDelete(self.handle)
+            raise OSError(f"libtesseract could not load \"{language}\" from {tessdata}")
+        self.psm = None
+
+    def recognize(self, img, config):
+        match = TesseractApiBackend.PSM_RE.search(config or "")
+        psm = int(match.group(1)) if match else 3
+        if psm != self.psm:
+            self.lib.TessBaseAPISetPageSegMode(self.handle, psm)
+            self.psm = psm
+        img = img.convert("L")
+        self.lib.TessBaseAPISetImage(self.handle, img.tobytes(), img.width, img.height, 1, img.width)
+        text = self.lib.TessBaseAPIGetUTF8Text(self.handle)
+        if not text:
+            return ""
+        try:
+            return ctypes.string_at(text).decode("utf-8", errors="replace")
+        finally:
+            self.lib.TessDeleteText(text)
+
+    def close(self):
+        if self.handle:
+            self.lib.TessBaseAPIEnd(self.handle)
+            self.lib.TessBaseAPIDelete(self.handle)
+            self.handle = None
+            ctypes.windll.kernel32.FreeLibrary(ctypes.c_void_p(self.lib._handle))
+
+
+# Long-lived thread every automation flow sends its OCR requests to, the backend is created on first use and replaced
+# whenever a call fails or hangs, backend_factory can hand out a fake engine to replay recorded screens
+class OcrWorker:
+    REQUEST_TIMEOUT = 30
+    SLOW_CALL = 1.0
+
+    def __init__(self, backend_factory=None, pinned_config=None):
+        self.backend_factory = backend_factory or OcrWorker.default_backend
+        self.pinned_config = pinned_config
+        self.lock = threading.Lock()
+        self.requests = None
+        self.thread = None
+        self.restarts = 0
+        self.latencies = deque(maxlen=200)
+
+    @staticmethod
+    def default_backend():
+        try:
+            return TesseractApiBackend(pytesseract.pytesseract.tesseract_cmd)
+        except (OSError, AttributeError) as err:
+            logging.info(f"Using tesseract.exe for OCR: {err}")
+            return TesseractCliBackend()
+
+    def start(self):
+        with self.lock:
+            if self.thread is not None and self.thread.is_alive():
+                return
+            self.requests = queue.Queue()
+            self.thread = threading.Thread(target=self.run, args=(self.requests,), name="OcrWorker", daemon=True)
+            self.thread.start()
+
+    def run(self, requests):
+        backend = None
+        while True:
+            request = requests.get()
+            if request is None:
+                break
+            img, config, future = request
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                if backend is None:
+                    backend = self.backend_factory()
+                start_time = time.perf_counter()
+                text = backend.recognize(img, config)
+                elapsed = time.perf_counter() - start_time
+                self.latencies.append(elapsed)
+                if elapsed > OcrWorker.SLOW_CALL:
+                    logging.warning(f"Slow OCR call on {backend.name}: {elapsed * 1000:.0f} ms")
+                else:
+                    logging.debug(f"OCR call on {backend.name}: {elapsed * 1000:.0f} ms")
+                future.set_result(text)
+            except Exception as err:
+                logging.error(f"OCR backend failed, restarting it: {err}")
+                self.restarts += 1
+                backend = OcrWorker.close_backend(backend)
+                future.set_exception(err)
+        OcrWorker.close_backend(backend)
+
+    @staticmethod
+    def close_backend(backend):
+        if backend is not None:
+            try:
+                backend.close()
+            except Exception as err:
+                logging.warning(f"Failed to close the OCR backend: {err}")
+        return None
+
+    # Same call signature as pytesseract.image_to_string
+    @trace_span("ocr", "ocr")
+    def recognize(self, img, config=""):
+        self.start()
+        future = Future()
+        requests = self.requests
+        requests.put((img, self.pinned_config or config, future))
+        try:
+            return future.result(timeout=OcrWorker.REQUEST_TIMEOUT)
+        except TimeoutError:
+            # The stuck thread is left behind and the next request starts a fresh worker and backend
+            logging.error(f"OCR call took longer than {OcrWorker.REQUEST_TIMEOUT}s, restarting the worker")
+            with self.lock:
+                if self.requests is requests:
+                    self.thread = None
+                    self.restarts += 1
+            requests.put(None)
+            raise
+
+    # Recognizes a blank image, which also loads the model ahead of the first real request
+    def health_check(self):
+        try:
+            self.recognize(Image.new("L", (64, 32), 255), "--oem 3 --psm 7")
+            return True
+        except Exception as err:
+            logging.warning(f"OCR health check failed: {err}")
+            return False
+
+    def stop(self, timeout=2):
+        with self.lock:
+            thread, requests = self.thread, self.requests
+            self.thread = None
+        if thread is not None and thread.is_alive():
+            requests.put(None)
+            thread.join(timeout)
+
+
 # gets tera term's window dimensions for accurate screenshots for OCR
 def get_window_rect(hwnd):
     class RECT(ctypes.Structure):
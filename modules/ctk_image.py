@@ -1,10 +1,149 @@
 from typing import Tuple, Dict, Callable, List, Any
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+import hashlib
+import io
+import threading
 try:
     from PIL import Image, ImageTk
 except ImportError:
     pass
 
 
+class ImageCache:
+    """
+    Process-wide LRU of decoded and resized images, shared by every CTkImage.
+
+    Entries are keyed by a hash of the image content and the size they were resized to, so the same picture
+    loaded twice, or displayed by two CTkImage objects, is only decoded and resized once. The cache is bounded
+    by the memory of its pixel buffers, evicting the least recently used entries first.
+
+    PIL images can be loaded and resized from any thread (preload() does it on a worker), PhotoImages
+    have to be created on the thread that runs the tkinter mainloop.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, workers: int = 2):
+        self.max_bytes = max_bytes
+        self.workers = workers
+        self._entries: "OrderedDict[tuple, Tuple[Any, int]]" = OrderedDict()
+        self._loading: Dict[tuple, Future] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._executor = None
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def content_key(image: "Image.Image") -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{image.mode}{image.size}".encode())
+        digest.update(image.tobytes())
+        return digest.hexdigest()
+
+    def _get(self, key: tuple):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def _put(self, key: tuple, value, size: int):
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries[key][1]
+            self._entries[key] = (value, size)
+            self._entries.move_to_end(key)
+            self._bytes += size
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def _load_or_join(self, key: tuple, load: Callable[[], "Image.Image"]) -> "Image.Image":
+        # a second caller asking for an image that is being loaded waits for it instead of decoding it again
+        image = self._get(key)
+        if image is not None:
+            return image
+        with self._lock:
+            future = self._loading.get(key)
+            owner = future is None
+            if owner:
+                future = self._loading[key] = Future()
+        if not owner:
+            return future.result()
+        try:
+            image = load()
+            self._put(key, image, image.width * image.height * len(image.getbands()))
+            future.set_result(image)
+            return image
+        except BaseException as err:
+            future.set_exception(err)
+            raise
+        finally:
+            with self._lock:
+                self._loading.pop(key, None)
+
+    def load(self, path: str, size: Tuple[int, int] = None) -> "Image.Image":
+        """ decode an image file, converted to RGB(A) and resized with LANCZOS to size if given """
+        with open(path, "rb") as file:
+            data = file.read()
+        key = ("file", hashlib.blake2b(data, digest_size=16).hexdigest(), tuple(size) if size else None)
+
+        def decode():
+            with Image.open(io.BytesIO(data)) as img:
+                if img.mode not in ("RGB", "RGBA"):
+                    img = img.convert("RGBA" if img.mode == "P" and "transparency" in img.info else "RGB")
+                if size is not None and img.size != tuple(size):
+                    return img.resize(size, Image.Resampling.LANCZOS)
+                img.load()
+                return img.copy()
+
+        return self._load_or_join(key, decode)
+
+    def resize(self, image: "Image.Image", size: Tuple[int, int], content_key: str = None) -> "Image.Image":
+        """ resized copy of image, the original is returned when it already has that size """
+        if image.size == tuple(size):
+            return image
+        key = ("resize", content_key or self.content_key(image), tuple(size))
+        return self._load_or_join(key, lambda: image.resize(size, Image.Resampling.LANCZOS))
+
+    def photo_image(self, image: "Image.Image", size: Tuple[int, int], master: Any = None,
+                    content_key: str = None) -> "ImageTk.PhotoImage":
+        """ PhotoImage of image at size, must be called from the tkinter thread """
+        content_key = content_key or self.content_key(image)
+        key = ("photo", content_key, tuple(size))
+        photo = self._get(key)
+        if photo is None:
+            photo = ImageTk.PhotoImage(self.resize(image, size, content_key), master=master)
+            self._put(key, photo, size[0] * size[1] * 4)
+        return photo
+
+    def submit(self, function: Callable, *args) -> Future:
+        """ runs function(*args) on the cache's worker threads, it must not touch Tk """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="ImageCache")
+        return self._executor.submit(function, *args)
+
+    def preload(self, path: str, size: Tuple[int, int] = None) -> Future:
+        """ load() on a worker thread, the returned future resolves to the PIL image """
+        return self.submit(self.load, path, size)
+
+    def memory_usage(self) -> dict:
+        """ returns how much memory the cached pixel buffers take and how often the cache was hit """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {"entries": len(self._entries), "bytes": self._bytes, "max_bytes": self.max_bytes,
+                    "hits": self.hits, "misses": self.misses, "hit_rate": self.hits / lookups if lookups else 0.0}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
 class CTkImage:
     """
     Class to store one or two PIl.Image.Image objects and display size independent of scaling:
@@ -17,6 +156,7 @@ class CTkImage:
     """
 
     _checked_PIL_import = False
+    image_cache = ImageCache()
 
     def __init__(self,
                  light_image: "Image.Image" = None,
@@ -35,8 +175,11 @@ class CTkImage:
         self._master = master
 
         self._configure_callback_list: List[Callable] = []
+        # only the photo images currently in use are kept here, so they outlive their eviction from image_cache
         self._scaled_light_photo_images: Dict[Tuple[int, int], ImageTk.PhotoImage] = {}
         self._scaled_dark_photo_images: Dict[Tuple[int, int], ImageTk.PhotoImage] = {}
+        self._light_key = None
+        self._dark_key = None
 
     @classmethod
     def _check_pil_import(cls):
@@ -57,10 +200,12 @@ class CTkImage:
         if "light_image" in kwargs:
             self._light_image = kwargs.pop("light_image")
             self._scaled_light_photo_images = {}
+            self._light_key = None
             self._check_images()
         if "dark_image" in kwargs:
             self._dark_image = kwargs.pop("dark_image")
             self._scaled_dark_photo_images = {}
+            self._dark_key = None
             self._check_images()
         if "size" in kwargs:
             self._size = kwargs.pop("size")
@@ -96,19 +241,20 @@ class CTkImage:
         return round(self._size[0] * widget_scaling), round(self._size[1] * widget_scaling)
 
     def _get_scaled_light_photo_image(self, scaled_size: Tuple[int, int]) -> "ImageTk.PhotoImage":
-        if scaled_size in self._scaled_light_photo_images:
-            return self._scaled_light_photo_images[scaled_size]
-        else:
-            self._scaled_light_photo_images[scaled_size] = ImageTk.PhotoImage(self._light_image.resize(scaled_size), master=self._master)
-            return self._scaled_light_photo_images[scaled_size]
+        if scaled_size not in self._scaled_light_photo_images:
+            if self._light_key is None:
+                self._light_key = self.image_cache.content_key(self._light_image)
+            self._scaled_light_photo_images = {scaled_size: self.image_cache.photo_image(
+                self._light_image, scaled_size, master=self._master, content_key=self._light_key)}
+        return self._scaled_light_photo_images[scaled_size]
 
     def _get_scaled_dark_photo_image(self, scaled_size: Tuple[int, int]) -> "ImageTk.PhotoImage":
-        if scaled_size in self._scaled_dark_photo_images:
-            return self._scaled_dark_photo_images[scaled_size]
-        else:
-            self._scaled_dark_photo_images[scaled_size] = ImageTk.PhotoImage(self._dark_image.resize(scaled_size),
-                                                                             master=self._master)
-            return self._scaled_dark_photo_images[scaled_size]
+        if scaled_size not in self._scaled_dark_photo_images:
+            if self._dark_key is None:
+                self._dark_key = self.image_cache.content_key(self._dark_image)
+            self._scaled_dark_photo_images = {scaled_size: self.image_cache.photo_image(
+                self._dark_image, scaled_size, master=self._master, content_key=self._dark_key)}
+        return self._scaled_dark_photo_images[scaled_size]
 
     def create_scaled_photo_image(self, widget_scaling: float, appearance_mode: str) -> "ImageTk.PhotoImage":
         scaled_size = self._get_scaled_size(widget_scaling)
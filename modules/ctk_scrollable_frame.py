@@ -48,15 +48,16 @@ class CTkScrollableFrame(tkinter.Frame, CTkAppearanceModeBaseClass, CTkScalingBa
                                       border_width=border_width, bg_color=bg_color, fg_color=fg_color, border_color=border_color)
         self._parent_canvas = tkinter.Canvas(master=self._parent_frame, highlightthickness=0)
         self._set_scroll_increments()
+        self._scroll_listeners = []
 
         if self._orientation == "horizontal":
             self._scrollbar = CTkScrollbar(master=self._parent_frame, orientation="horizontal", command=self._parent_canvas.xview,
                                            fg_color=scrollbar_fg_color, button_color=scrollbar_button_color, button_hover_color=scrollbar_button_hover_color)
-            self._parent_canvas.configure(xscrollcommand=self._scrollbar.set)
+            self._parent_canvas.configure(xscrollcommand=self._on_scroll)
         elif self._orientation == "vertical":
             self._scrollbar = CTkScrollbar(master=self._parent_frame, orientation="vertical", command=self._parent_canvas.yview,
                                            fg_color=scrollbar_fg_color, button_color=scrollbar_button_color, button_hover_color=scrollbar_button_hover_color)
-            self._parent_canvas.configure(yscrollcommand=self._scrollbar.set)
+            self._parent_canvas.configure(yscrollcommand=self._on_scroll)
 
         self._label_text = label_text
         self._label = CTkLabel(self._parent_frame, text=label_text, anchor=label_anchor, font=label_font,
@@ -282,6 +283,25 @@ class CTkScrollableFrame(tkinter.Frame, CTkAppearanceModeBaseClass, CTkScalingBa
         elif relative_position_bottom > 0:
             self.after(0, self._parent_canvas.yview_scroll(int(relative_position_bottom + scroll_margin), "units"))
 
+    def _on_scroll(self, first, last):
+        self._scrollbar.set(first, last)
+        for callback in self._scroll_listeners:
+            callback()
+
+    def add_scroll_listener(self, callback):
+        """ callback gets called without arguments every time the visible area of the frame changes """
+        if callback not in self._scroll_listeners:
+            self._scroll_listeners.append(callback)
+
+    def remove_scroll_listener(self, callback):
+        if callback in self._scroll_listeners:
+            self._scroll_listeners.remove(callback)
+
+    def visible_bounds(self, widget):
+        """ returns the (top, bottom) span of a child widget, in its own coordinates, that is scrolled into view """
+        top = self._parent_canvas.winfo_rooty() - widget.winfo_rooty()
+        return top, top + self._parent_canvas.winfo_height()
+
     def _set_shift_state(self, state: bool) -> None:
         self._shift_pressed = state
 
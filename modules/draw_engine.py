@@ -2,12 +2,55 @@ from __future__ import annotations
 import sys
 import math
 import tkinter
+from collections import OrderedDict
 from typing import Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..core_rendering import CTkCanvas
 
 
+class ShapeCache:
+    """
+    Process-wide LRU cache of computed shape geometry, shared by every DrawEngine.
+    Widgets of the same size draw the same coordinates, so a window full of identical buttons, or a resize storm
+    that keeps passing through the same sizes, only computes each shape once while the memory stays bounded.
+    """
+
+    __slots__ = ("_entries", "maxsize", "hits", "misses")
+
+    def __init__(self, maxsize: int = 256):
+        self._entries = OrderedDict()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        """ returns the size and hit rate of the cache """
+        lookups = self.hits + self.misses
+        return {"size": len(self._entries), "maxsize": self.maxsize, "hits": self.hits, "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0}
+
+
 class DrawEngine:
     """
     This is the core of the CustomTkinter library where all the drawing on the tkinter.Canvas happens.
@@ -26,14 +69,18 @@ class DrawEngine:
     """
 
     preferred_drawing_method: str = None  # 'polygon_shapes', 'font_shapes', 'circle_shapes'
-    __slots__ = ("_canvas", "_items", "_shape_cache", "_round_width_to_even_numbers", "_round_height_to_even_numbers",
+    shape_cache = ShapeCache()
+    _font_shape_tags = {"border_oval": ("border_corner_part", "border_parts"),
+                        "border_rectangle": ("border_rectangle_part", "border_parts"),
+                        "inner_oval": ("inner_corner_part", "inner_parts"),
+                        "inner_rectangle": ("inner_rectangle_part", "inner_parts")}
+    __slots__ = ("_canvas", "_items", "_round_width_to_even_numbers", "_round_height_to_even_numbers",
                  "_last_rounded_rect_settings", "_last_background_corners", "_last_dropdown_arrow",
                  "_last_progress_bar_settings", "_last_slider_settings", "_last_scrollbar_settings")
 
     def __init__(self, canvas: CTkCanvas):
         self._canvas = canvas
         self._items = {}
-        self._shape_cache = {}
         self._round_width_to_even_numbers: bool = True
         self._round_height_to_even_numbers: bool = True
         self._last_rounded_rect_settings = None
@@ -63,7 +110,6 @@ class DrawEngine:
     def _on_destroy(self, event):
         if event.widget == self._canvas:
             self._items.clear()
-            self._shape_cache.clear()
             self._last_rounded_rect_settings = None
             self._last_background_corners = None
             self._last_dropdown_arrow = None
@@ -217,19 +263,47 @@ class DrawEngine:
                                                     border_width: int, inner_corner_radius: int,
                                                     exclude_parts: tuple = ()) -> bool:
         # Round values to 2 decimal places to prevent cache misses due to floating point imprecision
-        cache_key = (round(width, 2), round(height, 2), corner_radius, border_width, inner_corner_radius)
-
-        # Check cache first
-        if cache_key in self._shape_cache:
-            cached_data = self._shape_cache[cache_key]
-            # Update all positions from cache
-            for item_id, coords in cached_data['coords'].items():
-                if item_id in self._items:
-                    self._canvas.coords(self._items[item_id], *coords)
-            return False
+        cache_key = (round(width, 2), round(height, 2), corner_radius, border_width, inner_corner_radius,
+                     tuple(exclude_parts))
+
+        # The geometry only depends on the shape parameters, so it is shared by every engine
+        parts = self.shape_cache.get(cache_key)
+        if parts is None:
+            parts = self.__rounded_rect_with_border_font_shapes_geometry(width, height, corner_radius, border_width,
+                                                                          inner_corner_radius, exclude_parts)
+            self.shape_cache.put(cache_key, parts)
 
         requires_recoloring = False
-        current_positions = {}
+        for name, coords in parts:
+            item = self._items.get(name)
+            if coords is None:
+                if item is not None:
+                    self._canvas.itemconfig(item, state='hidden')
+            elif item is None:
+                tags = self._font_shape_tags[name[:name.index("_", name.index("_") + 1)]]
+                if "oval" in name:
+                    self._items[name] = self._canvas.create_aa_circle(
+                        *coords, tags=tags, anchor="center", angle=180 if name.endswith("_b") else 0)
+                else:
+                    self._items[name] = self._canvas.create_rectangle(*coords, tags=tags, width=0)
+                requires_recoloring = True
+            else:
+                self._canvas.itemconfig(item, state='normal')
+                self._canvas.coords(item, *coords)
+
+        if requires_recoloring:
+            self._canvas.tag_lower("inner_parts")
+            self._canvas.tag_lower("border_parts")
+            self._canvas.tag_lower("background_parts")
+
+        return requires_recoloring
+
+    @staticmethod
+    def __rounded_rect_with_border_font_shapes_geometry(width: int, height: int, corner_radius: int,
+                                                        border_width: int, inner_corner_radius: int,
+                                                        exclude_parts: tuple = ()) -> tuple:
+        """ returns the (name, coords) of every font shape part, coords is None for a part that has to be hidden """
+        parts = []
 
         # Border parts
         if border_width > 0:
@@ -244,37 +318,12 @@ class DrawEngine:
 
                 for i, pos in enumerate(corner_positions, 1):
                     if f"border_oval_{i}_a" not in exclude_parts:
-                        if f"border_oval_{i}_a" not in self._items:
-                            self._items[f"border_oval_{i}_a"] = self._canvas.create_aa_circle(
-                                *pos, corner_radius, tags=("border_corner_part", "border_parts"),
-                                anchor="center")
-                            self._items[f"border_oval_{i}_b"] = self._canvas.create_aa_circle(
-                                *pos, corner_radius, tags=("border_corner_part", "border_parts"),
-                                anchor="center", angle=180)
-                            requires_recoloring = True
-                        else:
-                            self._canvas.itemconfig(self._items[f"border_oval_{i}_a"], state='normal')
-                            self._canvas.itemconfig(self._items[f"border_oval_{i}_b"], state='normal')
-                            self._canvas.coords(self._items[f"border_oval_{i}_a"], *pos, corner_radius)
-                            self._canvas.coords(self._items[f"border_oval_{i}_b"], *pos, corner_radius)
-
-                        current_positions[f"border_oval_{i}_a"] = (*pos, corner_radius)
-                        current_positions[f"border_oval_{i}_b"] = (*pos, corner_radius)
+                        parts.append((f"border_oval_{i}_a", (*pos, corner_radius)))
+                        parts.append((f"border_oval_{i}_b", (*pos, corner_radius)))
 
             # Border rectangle parts
-            for i in range(1, 3):
-                if f"border_rectangle_{i}" not in self._items:
-                    self._items[f"border_rectangle_{i}"] = self._canvas.create_rectangle(
-                        0, 0, 0, 0, tags=("border_rectangle_part", "border_parts"), width=0)
-                    requires_recoloring = True
-                else:
-                    self._canvas.itemconfig(self._items[f"border_rectangle_{i}"], state='normal')
-
-            # Set border rectangle positions
-            self._canvas.coords(self._items["border_rectangle_1"], 0, corner_radius, width, height - corner_radius)
-            self._canvas.coords(self._items["border_rectangle_2"], corner_radius, 0, width - corner_radius, height)
-            current_positions["border_rectangle_1"] = (0, corner_radius, width, height - corner_radius)
-            current_positions["border_rectangle_2"] = (corner_radius, 0, width - corner_radius, height)
+            parts.append(("border_rectangle_1", (0, corner_radius, width, height - corner_radius)))
+            parts.append(("border_rectangle_2", (corner_radius, 0, width - corner_radius, height)))
 
         # Inner parts
         if inner_corner_radius > 0:
@@ -287,61 +336,21 @@ class DrawEngine:
 
             for i, pos in enumerate(corner_positions, 1):
                 if f"inner_oval_{i}_a" not in exclude_parts:
-                    if f"inner_oval_{i}_a" not in self._items:
-                        self._items[f"inner_oval_{i}_a"] = self._canvas.create_aa_circle(
-                            *pos, inner_corner_radius, tags=("inner_corner_part", "inner_parts"),
-                            anchor="center")
-                        self._items[f"inner_oval_{i}_b"] = self._canvas.create_aa_circle(
-                            *pos, inner_corner_radius, tags=("inner_corner_part", "inner_parts"),
-                            anchor="center", angle=180)
-                        requires_recoloring = True
-                    else:
-                        self._canvas.itemconfig(self._items[f"inner_oval_{i}_a"], state='normal')
-                        self._canvas.itemconfig(self._items[f"inner_oval_{i}_b"], state='normal')
-                        self._canvas.coords(self._items[f"inner_oval_{i}_a"], *pos, inner_corner_radius)
-                        self._canvas.coords(self._items[f"inner_oval_{i}_b"], *pos, inner_corner_radius)
-
-                    current_positions[f"inner_oval_{i}_a"] = (*pos, inner_corner_radius)
-                    current_positions[f"inner_oval_{i}_b"] = (*pos, inner_corner_radius)
+                    parts.append((f"inner_oval_{i}_a", (*pos, inner_corner_radius)))
+                    parts.append((f"inner_oval_{i}_b", (*pos, inner_corner_radius)))
 
         # Inner rectangle parts
-        for i in range(1, 3):
-            if f"inner_rectangle_{i}" not in self._items:
-                self._items[f"inner_rectangle_{i}"] = self._canvas.create_rectangle(
-                    0, 0, 0, 0, tags=("inner_rectangle_part", "inner_parts"), width=0)
-                requires_recoloring = True
-            else:
-                self._canvas.itemconfig(self._items[f"inner_rectangle_{i}"], state='normal')
-
-        self._canvas.coords(self._items["inner_rectangle_1"],
-                            border_width + inner_corner_radius, border_width,
-                            width - border_width - inner_corner_radius, height - border_width)
-        current_positions["inner_rectangle_1"] = (border_width + inner_corner_radius, border_width,
-                                                  width - border_width - inner_corner_radius, height - border_width)
+        parts.append(("inner_rectangle_1", (border_width + inner_corner_radius, border_width,
+                                            width - border_width - inner_corner_radius, height - border_width)))
 
         needs_inner_rectangle_2 = inner_corner_radius * 2 < height - (border_width * 2)
         if needs_inner_rectangle_2:
-            self._canvas.coords(self._items["inner_rectangle_2"],
-                                border_width, border_width + inner_corner_radius,
-                                width - border_width, height - inner_corner_radius - border_width)
-            current_positions["inner_rectangle_2"] = (border_width, border_width + inner_corner_radius,
-                                                      width - border_width, height - inner_corner_radius - border_width)
-        elif "inner_rectangle_2" in self._items:
-            self._canvas.itemconfig(self._items["inner_rectangle_2"], state='hidden')
-
-        if requires_recoloring:
-            self._canvas.tag_lower("inner_parts")
-            self._canvas.tag_lower("border_parts")
-            self._canvas.tag_lower("background_parts")
-
-        # Cache the positions
-        self._shape_cache[cache_key] = {'coords': current_positions}
-
-        # Maintain cache size limit
-        if len(self._shape_cache) > 100:
-            del self._shape_cache[next(iter(self._shape_cache))]
+            parts.append(("inner_rectangle_2", (border_width, border_width + inner_corner_radius,
+                                                width - border_width, height - inner_corner_radius - border_width)))
+        else:
+            parts.append(("inner_rectangle_2", None))
 
-        return requires_recoloring
+        return tuple(parts)
 
     def __draw_rounded_rect_with_border_circle_shapes(self, width: int, height: int, corner_radius: int,
                                                       border_width: int, inner_corner_radius: int) -> bool:
@@ -1,9 +1,7 @@
 import argparse
-import ctypes
 import hashlib
 import json
 import logging
-import mmap
 import os
 import psutil
 import re
@@ -19,12 +17,17 @@ import urllib.error
 import urllib.parse
 import urllib.request
 import zipfile
+from concurrent.futures import as_completed, ThreadPoolExecutor
 from filelock import FileLock, Timeout
 from tkinter import messagebox, ttk
 
 MAX_RETRIES = 5
 RETRY_DELAY = 0.2
 CHUNK_SIZE = 131072
+DOWNLOAD_SEGMENTS = 4
+MIN_SEGMENT_SIZE = 1024 * 1024
+MANIFEST_SAVE_INTERVAL = 1.0
+SYNC_WORKERS = min(8, (os.cpu_count() or 1) + 4)
 UI_UPDATE_DELAY = 1000
 
 temp_dir = os.path.join(tempfile.gettempdir(), "TeraTermUI")
@@ -155,6 +158,11 @@ class UpdateGUI:
             cleanup_success = True
             error_messages = []
             try:
+                # delta_update rolls back the files it already replaced as soon as it sees the cancel flag, and a
+                # backup still being written has to stop before its folder can be discarded
+                while self.current_stage in ["patching", "backing_up"]:
+                    time.sleep(0.1)
+
                 if self.current_stage == "downloading":
                     if self.downloaded_file and os.path.exists(self.downloaded_file):
                         try:
@@ -184,7 +192,7 @@ class UpdateGUI:
                                             logging.warning(f"Failed to remove directory {dir}: {e}")
 
                             logging.info("Restoring from backup")
-                            shutil.copytree(self.backup_folder, self.app_directory, dirs_exist_ok=True)
+                            sync_tree(self.backup_folder, self.app_directory, link=True)
                             logging.info(f"Restored from backup: {self.backup_folder}")
                         except Exception as e:
                             error_msg = f"Failed to restore from backup: {e}"
@@ -453,14 +461,19 @@ def start_update(gui, args):
                 gui.set_failure_state()
                 return
 
-            gui.update_progress(10, "Starting download...")
-            downloaded_file = download_update(gui, args.mode, checksum_info)
+            update_success = None
+            if args.mode == "Portable" and checksum_info["portable"].get("manifest"):
+                update_success = delta_update(gui, args.version, checksum_info["portable"], args.app_directory)
 
-            if downloaded_file:
-                gui.downloaded_file = downloaded_file
-                update_success = install_extract_update(gui, args.mode, args.version,
-                                                        downloaded_file, args.app_directory)
+            if update_success is None:
+                gui.update_progress(10, "Starting download...")
+                downloaded_file = download_update(gui, args.mode, checksum_info)
+                if downloaded_file:
+                    gui.downloaded_file = downloaded_file
+                    update_success = install_extract_update(gui, args.mode, args.version,
+                                                            downloaded_file, args.app_directory)
 
+            if update_success is not None:
                 if args.mode == "Portable":
                     if not update_success:
                         if gui.cancel_requested:
@@ -501,38 +514,6 @@ def start_update(gui, args):
     update_thread = threading.Thread(target=update_task, daemon=True)
     update_thread.start()
 
-def verify_checksum(file_path, expected_checksum):
-    logging.info(f"Verifying checksum for file: {file_path}")
-
-    if not os.path.exists(file_path):
-        logging.error(f"File not found: {file_path}")
-        return False
-
-    try:
-        sha256_hash = hashlib.sha256()
-        total_size = os.path.getsize(file_path)
-        processed_size = 0
-
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
-                sha256_hash.update(chunk)
-                processed_size += len(chunk)
-                progress = (processed_size / total_size) * 100
-                if progress % 10 == 0:
-                    logging.info(f"Checksum verification progress: {progress:.1f}%")
-
-        calculated_checksum = sha256_hash.hexdigest()
-        if calculated_checksum == expected_checksum:
-            logging.info("Checksum verification passed")
-            return True
-        else:
-            logging.error(
-                f"Checksum verification failed. Expected: {expected_checksum}, Calculated: {calculated_checksum}")
-            return False
-    except Exception as e:
-        logging.error(f"Checksum verification failed with error: {e}")
-        return False
-
 def fetch_checksums_and_urls(version):
     logging.info(f"Fetching checksums and URLs for version: {version}")
     repo_api_url = f"https://api.github.com/repos/Hanuwa/TeraTermUI/releases/tags/v{version}"
@@ -563,7 +544,7 @@ def fetch_checksums_and_urls(version):
                 return None
 
             result = {
-                "portable": {"checksum": None, "url": None},
+                "portable": {"checksum": None, "url": None, "manifest": None},
                 "installer": {"checksum": None, "url": None}
             }
 
@@ -588,6 +569,9 @@ def fetch_checksums_and_urls(version):
                 if asset_name == f"TeraTermUI_x64-v{version}.zip":
                     result["portable"]["url"] = asset.get("browser_download_url")
                     logging.info(f"Found portable download URL: {result['portable']['url']}")
+                elif asset_name == f"TeraTermUI_x64-v{version}-manifest.json":
+                    result["portable"]["manifest"] = asset.get("browser_download_url")
+                    logging.info(f"Found portable file manifest URL: {result['portable']['manifest']}")
                 elif asset_name == f"TeraTermUI_x64_Installer-v{version}.exe":
                     result["installer"]["url"] = asset.get("browser_download_url")
                     logging.info(f"Found installer download URL: {result['installer']['url']}")
@@ -612,6 +596,215 @@ def fetch_checksums_and_urls(version):
         logging.error(f"Unexpected error fetching release info: {e}")
         return None
 
+def hash_file(path):
+    sha256_hash = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            sha256_hash.update(chunk)
+    return sha256_hash.hexdigest()
+
+# The release's file manifest maps every path inside the portable zip (relative, "/" separated) to its SHA-256
+def fetch_update_manifest(url):
+    headers = {"User-Agent": "TeraTermUI-Updater"}
+    request = urllib.request.Request(url, headers=headers)
+    with urllib.request.urlopen(request, timeout=30) as response:
+        manifest = json.loads(response.read().decode())
+    files = manifest.get("files")
+    if not isinstance(files, dict) or not files:
+        raise ValueError("Manifest has no file list")
+    for rel_path in files:
+        if os.path.isabs(rel_path) or ".." in rel_path.split("/"):
+            raise ValueError(f"Unsafe path in manifest: {rel_path}")
+    return {rel_path: checksum.lower() for rel_path, checksum in files.items()}
+
+def plan_delta_update(app_directory, files):
+    changed = []
+    for rel_path, checksum in files.items():
+        local_path = os.path.join(app_directory, *rel_path.split("/"))
+        if not os.path.isfile(local_path) or hash_file(local_path) != checksum:
+            changed.append(rel_path)
+    return changed
+
+# Just enough of the file API for zipfile, every read that misses the current block fetches it with a Range request
+# so the release zip can be listed and single members pulled out of it without downloading the rest
+class RemoteFile:
+    READ_AHEAD = 1024 * 1024
+
+    def __init__(self, url, size):
+        self.url = url
+        self.size = size
+        self.position = 0
+        self.block_start = 0
+        self.block = b""
+        self.transferred = 0
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self.position
+
+    def seek(self, offset, whence=0):
+        if whence == 0:
+            self.position = offset
+        elif whence == 1:
+            self.position += offset
+        else:
+            self.position = self.size + offset
+        return self.position
+
+    def read(self, n=-1):
+        if n is None or n < 0:
+            n = self.size - self.position
+        n = min(n, self.size - self.position)
+        if n <= 0:
+            return b""
+        offset = self.position - self.block_start
+        if offset < 0 or offset + n > len(self.block):
+            self.fetch(self.position, max(n, RemoteFile.READ_AHEAD))
+            offset = 0
+        data = self.block[offset:offset + n]
+        self.position += len(data)
+        return data
+
+    def fetch(self, start, length):
+        end = min(start + length, self.size) - 1
+        headers = {"User-Agent": "TeraTermUI-Updater", "Range": f"bytes={start}-{end}"}
+        request = urllib.request.Request(self.url, headers=headers)
+        for attempt in range(1, MAX_RETRIES + 1):
+            try:
+                with urllib.request.urlopen(request, timeout=30) as response:
+                    if response.status != 206:
+                        raise ValueError(f"Server ignored the range request (status {response.status})")
+                    block = response.read()
+                if len(block) != end - start + 1:
+                    raise ValueError(f"Expected {end - start + 1} bytes at offset {start}, got {len(block)}")
+                break
+            except (urllib.error.URLError, OSError, ValueError) as e:
+                if attempt == MAX_RETRIES:
+                    raise
+                logging.warning(f"Range request failed (attempt {attempt} of {MAX_RETRIES}): {e}")
+                time.sleep(RETRY_DELAY * attempt)
+        self.block_start = start
+        self.block = block
+        self.transferred += len(block)
+
+    def close(self):
+        self.block = b""
+
+# Only the files whose hash differs from the release manifest are pulled out of the release zip and replaced, the
+# replaced files are backed up first. Returns None whenever the full package has to be used instead
+def delta_update(gui, version, release_info, app_directory):
+    gui.current_stage = "downloading"
+    gui.update_progress(10, "Checking which files changed...")
+    try:
+        files = fetch_update_manifest(release_info["manifest"])
+        changed = plan_delta_update(app_directory, files)
+    except Exception as e:
+        logging.warning(f"Delta update unavailable, using the full package: {e}")
+        return None
+    logging.info(f"Delta update: {len(changed)} of {len(files)} files changed")
+
+    download_dir = os.path.join(tempfile.gettempdir(), "TeraTermUI_Updater")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    gui.temp_extract_folder = os.path.join(download_dir, f"TeraTermUI_{version}_Delta_{timestamp}")
+    backup_folder = os.path.join(tempfile.gettempdir(), f"TeraTermUI_Backup_{timestamp}")
+    gui.temp_folders.update({download_dir, gui.temp_extract_folder, backup_folder})
+    gui.backup_folder = backup_folder
+
+    try:
+        os.makedirs(gui.temp_extract_folder, exist_ok=True)
+        final_url, total_length, ranged = probe_download(release_info["url"])
+        if not ranged or total_length is None:
+            logging.warning("Server does not support range requests, using the full package")
+            return None
+
+        remote = RemoteFile(final_url, total_length)
+        with zipfile.ZipFile(remote, "r") as zip_ref:
+            members = {info.filename: info for info in zip_ref.infolist()}
+            strip_prefix = "TeraTermUI/" if next(iter(members), "").startswith("TeraTermUI/") else ""
+            for index, rel_path in enumerate(changed):
+                if gui.cancel_requested:
+                    logging.info("Update cancelled during delta download")
+                    return False
+                while gui.pause_requested and not gui.cancel_requested:
+                    time.sleep(0.1)
+
+                info = members.get(strip_prefix + rel_path)
+                if info is None:
+                    raise ValueError(f"{rel_path} is missing from the release package")
+                temp_path = os.path.join(gui.temp_extract_folder, *rel_path.split("/"))
+                os.makedirs(os.path.dirname(temp_path), exist_ok=True)
+                sha256_hash = hashlib.sha256()
+                with zip_ref.open(info) as source, open(temp_path, "wb") as target:
+                    for chunk in iter(lambda: source.read(CHUNK_SIZE), b""):
+                        sha256_hash.update(chunk)
+                        target.write(chunk)
+                if sha256_hash.hexdigest() != files[rel_path]:
+                    raise ValueError(f"Checksum mismatch for {rel_path}")
+
+                progress = ((index + 1) / len(changed)) * 100
+                gui.update_progress(10 + progress * 0.6, f"Downloading changed files: {int(progress)}%")
+
+        logging.info(f"Delta download complete: {remote.transferred / 1024 / 1024:.2f} MB transferred "
+                     f"instead of {total_length / 1024 / 1024:.2f} MB")
+    except Exception as e:
+        if gui.cancel_requested:
+            return False
+        logging.warning(f"Delta update failed, using the full package: {e}")
+        return None
+
+    if "database.db" in changed:
+        current_db_path = os.path.join(app_directory, "database.db")
+        new_db_path = os.path.join(gui.temp_extract_folder, "database.db")
+        if os.path.exists(current_db_path):
+            current_ver = get_db_version(current_db_path)
+            new_ver = get_db_version(new_db_path)
+            if current_ver == new_ver:
+                logging.info(f"database.db version unchanged ({current_ver}). Skipping database update")
+                changed.remove("database.db")
+            else:
+                logging.info(f"database.db version changed: {current_ver} → {new_ver}. Updating")
+
+    gui.current_stage = "patching"
+    gui.update_progress(75, "Updating files...")
+    created_files = []
+    try:
+        for index, rel_path in enumerate(changed):
+            if gui.cancel_requested:
+                raise InterruptedError("Update cancelled during file copying")
+            while gui.pause_requested and not gui.cancel_requested:
+                time.sleep(0.1)
+
+            dest_file = os.path.join(app_directory, *rel_path.split("/"))
+            if os.path.exists(dest_file):
+                place_file(dest_file, os.path.join(backup_folder, *rel_path.split("/")), link=True)
+            else:
+                created_files.append(dest_file)
+            place_file(os.path.join(gui.temp_extract_folder, *rel_path.split("/")), dest_file)
+
+            progress = ((index + 1) / len(changed)) * 100
+            gui.update_progress(75 + progress * 0.2, f"Updating files: {int(progress)}%")
+
+        logging.info(f"Delta update complete. Files updated: {len(changed)}")
+    except Exception as e:
+        logging.error(f"Error during delta update: {e}")
+        try:
+            restore_delta_backup(app_directory, backup_folder, created_files)
+        except Exception as rollback_error:
+            logging.error(f"Rollback failed: {rollback_error}")
+        gui.current_stage = "rolled_back"
+        return False
+
+    gui.update_progress(95, "Finalizing update...")
+    gui.current_stage = "completed"
+    if not cleanup_update_files(gui):
+        logging.warning("Cleanup completed with some warnings")
+        gui.update_progress(100, "Update completed with warnings")
+    else:
+        gui.update_progress(100, "Update completed successfully!")
+    return True
+
 def get_db_version(path):
     try:
         conn = sqlite3.connect(path)
@@ -624,20 +817,54 @@ def get_db_version(path):
         logging.warning(f"Failed to read database version from {path}: {e}")
         return None
 
-def is_network_drive(path):
-    if os.name != "nt":
-        return False
+def file_digest(path):
+    digest = hashlib.blake2b(digest_size=32)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+# BLAKE2 digests of installed files keyed by path, an entry is only trusted while the file keeps the size and mtime
+# it had when it was hashed, so an unchanged install is compared without being read again
+class DigestCache:
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.entries = {}
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                self.entries = json.load(file)
+        except (OSError, ValueError):
+            pass
 
-    path = os.path.abspath(path)
-    drive = os.path.splitdrive(path)[0] + "\\"
-    DRIVE_REMOTE = 4
-    try:
-        drive_type = ctypes.windll.kernel32.GetDriveTypeW(ctypes.c_wchar_p(drive))
-        return drive_type == DRIVE_REMOTE
-    except Exception as e:
-        logging.warning(f"Failed to check drive type for {drive}: {e}")
-        return False
+    def digest(self, path):
+        key = os.path.abspath(path)
+        stat = os.stat(path)
+        with self.lock:
+            entry = self.entries.get(key)
+        if entry and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+            return entry[2]
+        digest = file_digest(path)
+        self.record(path, digest)
+        return digest
+
+    def record(self, path, digest):
+        stat = os.stat(path)
+        with self.lock:
+            self.entries[os.path.abspath(path)] = [stat.st_size, stat.st_mtime_ns, digest]
+
+    def save(self):
+        with self.lock:
+            entries = dict(self.entries)
+        try:
+            with open(self.path, "w", encoding="utf-8") as file:
+                json.dump(entries, file)
+        except OSError as e:
+            logging.warning(f"Failed to save file digest cache: {e}")
+
+DIGEST_CACHE = DigestCache(os.path.join(temp_dir, "file_digests.json"))
 
+# path1 is read once in chunks, path2 is the installed copy and usually comes out of the digest cache
 def files_are_identical(path1, path2):
     try:
         if not os.path.exists(path1) or not os.path.exists(path2):
@@ -648,36 +875,74 @@ def files_are_identical(path1, path2):
         if size1 != size2 or size1 == 0:
             return False
 
-        if is_network_drive(path1) or is_network_drive(path2):
-            logging.info(f"Skipping mmap due to network location: {path1} or {path2}")
-            return fallback_chunked_compare(path1, path2)
-
-        with open(path1, "rb") as f1, open(path2, "rb") as f2:
-            try:
-                with mmap.mmap(f1.fileno(), 0, access=mmap.ACCESS_READ) as m1, \
-                     mmap.mmap(f2.fileno(), 0, access=mmap.ACCESS_READ) as m2:
-                    return m1[:] == m2[:]
-            except ValueError as ve:
-                logging.warning(f"mmap comparison failed (ValueError): {ve}")
-                return False
+        return file_digest(path1) == DIGEST_CACHE.digest(path2)
     except Exception as e:
-        logging.warning(f"Comparison failed with mmap: {e}")
+        logging.warning(f"File comparison failed: {e}")
         return False
 
-def fallback_chunked_compare(p1, p2, chunk_size=262144):
+# A hard link when asked for and the volume allows it, otherwise a copy that's renamed over the destination, the old
+# file is never written through, so a hard-linked backup of it stays intact
+def place_file(src, dst, link=False):
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    if link:
+        try:
+            if os.path.lexists(dst):
+                os.remove(dst)
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+    temp_dst = f"{dst}.{threading.get_ident()}.tmp"
     try:
-        with open(p1, "rb") as f1, open(p2, "rb") as f2:
-            while True:
-                b1 = f1.read(chunk_size)
-                b2 = f2.read(chunk_size)
-                if b1 != b2:
-                    return False
-                if not b1:  
-                    break
+        shutil.copy2(src, temp_dst)
+        os.replace(temp_dst, dst)
+    finally:
+        if os.path.exists(temp_dst):
+            os.remove(temp_dst)
+
+# Mirrors every file below src_dir into dst_dir on SYNC_WORKERS threads, with compare set files that already match are
+# skipped, skip(rel_path) leaves a file out. When a gui is given the pause/cancel buttons are honored and progress is
+# reported in bytes between progress_start and progress_end. Returns (files placed, files skipped)
+def sync_tree(src_dir, dst_dir, gui=None, progress_start=0, progress_end=0, label=None, link=False, compare=False,
+              skip=None):
+    jobs = []
+    for root, _, files in os.walk(src_dir):
+        for file in files:
+            src_file = os.path.join(root, file)
+            rel_path = os.path.relpath(src_file, src_dir)
+            if skip is not None and skip(rel_path):
+                continue
+            jobs.append((src_file, os.path.join(dst_dir, rel_path), os.path.getsize(src_file)))
+    total_bytes = sum(size for _, _, size in jobs)
+
+    def sync_file(src_file, dest_file):
+        if gui is not None:
+            while gui.pause_requested and not gui.cancel_requested:
+                time.sleep(0.1)
+            if gui.cancel_requested:
+                return None
+        if compare and os.path.exists(dest_file) and files_are_identical(src_file, dest_file):
+            return False
+        place_file(src_file, dest_file, link)
         return True
-    except Exception as e:
-        logging.warning(f"Chunked comparison failed: {e}")
-        return False
+
+    placed = skipped = done_bytes = 0
+    with ThreadPoolExecutor(max_workers=SYNC_WORKERS) as executor:
+        futures = {executor.submit(sync_file, src_file, dest_file): size for src_file, dest_file, size in jobs}
+        for future in as_completed(futures):
+            result = future.result()
+            if result:
+                placed += 1
+            elif result is False:
+                skipped += 1
+            done_bytes += futures[future]
+            if gui is not None and label and total_bytes:
+                progress = done_bytes / total_bytes
+                gui.update_progress(progress_start + progress * (progress_end - progress_start),
+                                    f"{label}: {done_bytes / 1024 / 1024:.1f} of {total_bytes / 1024 / 1024:.1f} MB")
+    if compare:
+        DIGEST_CACHE.save()
+    return placed, skipped
 
 def download_update(gui, mode, checksum_info):
     gui.current_stage = "downloading"
@@ -704,93 +969,49 @@ def download_update(gui, mode, checksum_info):
 
     retries = MAX_RETRIES
     for attempt in range(1, retries + 1):
+        download = None
         try:
-            headers = {"User-Agent": "TeraTermUI-Updater"}
-            request = urllib.request.Request(download_url, headers=headers)
-
-            with urllib.request.urlopen(request, timeout=30) as response:
-                total_length = response.getheader("content-length")
-                if total_length is None:
-                    gui.update_progress(0, "Unable to determine file size")
-                    logging.error("Content-Length header missing")
-                    return None
-
-                total_length = int(total_length)
-                required_space = total_length * 2
-
-                if not has_enough_disk_space(required_space, temp_folder):
-                    gui.update_progress(0, "Insufficient disk space for download")
-                    logging.error(f"Insufficient disk space. Required: {required_space / 1024 / 1024:.2f}MB")
-                    return None
-
-                with open(file_path, "wb") as file:
-                    downloaded = 0
-                    last_update_time = time.time()
-                    downloaded_since_last_update = 0
-                    last_progress_update = 0
-
-                    while not gui.cancel_requested:
-                        if gui.pause_requested:
-                            time.sleep(0.1)
-                            last_update_time = time.time()
-                            continue
-
-                        chunk = response.read(CHUNK_SIZE)
-                        if not chunk:
-                            break
-
-                        file.write(chunk)
-                        downloaded += len(chunk)
-                        downloaded_since_last_update += len(chunk)
-
-                        current_time = time.time()
-                        time_delta = current_time - last_update_time
-
-                        if time_delta >= 0.1:
-                            current_percentage = (downloaded / total_length) * 100
-
-                            if abs(current_percentage - last_progress_update) >= 1:
-                                speed = downloaded_since_last_update / time_delta
-                                speed_text = f"{speed / 1024 / 1024:.1f} MB/s"
-                                remaining_bytes = total_length - downloaded
-
-                                if speed > 0:
-                                    remaining_seconds = remaining_bytes / speed
-                                    if remaining_seconds < 60:
-                                        time_text = f"{remaining_seconds:.0f}s remaining"
-                                    else:
-                                        time_text = f"{remaining_seconds / 60:.1f}m remaining"
-                                else:
-                                    time_text = "calculating..."
-
-                                progress_text = (f"Downloading Update: {int(current_percentage)}% "
-                                                 f"({speed_text}, {time_text})")
-                                gui.update_progress(10 + current_percentage * 0.4, progress_text)
+            final_url, total_length, ranged = probe_download(download_url)
+            if total_length is None:
+                gui.update_progress(0, "Unable to determine file size")
+                logging.error("Content-Length header missing")
+                return None
 
-                                last_progress_update = current_percentage
-                                last_update_time = current_time
-                                downloaded_since_last_update = 0
+            required_space = total_length * 2
+            if not has_enough_disk_space(required_space, temp_folder):
+                gui.update_progress(0, "Insufficient disk space for download")
+                logging.error(f"Insufficient disk space. Required: {required_space / 1024 / 1024:.2f}MB")
+                return None
 
-                                if int(current_percentage) % 10 == 0:
-                                    logging.info(f"Download progress: {int(current_percentage)}% ({speed_text})")
+            download = RangedDownload(final_url, file_path, total_length, expected_checksum, ranged)
+            if download.downloaded():
+                logging.info(f"Resuming download at {download.downloaded()} of {total_length} bytes")
+            download.run(gui)
 
-                if gui.cancel_requested:
-                    if os.path.exists(file_path):
-                        os.remove(file_path)
-                    logging.info("Download cancelled by user")
-                    return None
+            if gui.cancel_requested:
+                download.discard()
+                logging.info("Download cancelled by user")
+                return None
 
-                if downloaded != total_length:
-                    raise ValueError(f"Download incomplete. Expected {total_length} bytes, got {downloaded} bytes")
+            if download.error is not None:
+                raise download.error
 
-                logging.info(f"Download completed: {file_path}")
+            if download.downloaded() != total_length:
+                raise ValueError(f"Download incomplete. Expected {total_length} bytes, "
+                                 f"got {download.downloaded()} bytes")
 
-                gui.update_progress(50, "Verifying download...")
-                if not verify_checksum(file_path, expected_checksum):
-                    raise ValueError("Checksum verification failed")
+            gui.update_progress(50, "Verifying download...")
+            calculated_checksum = download.checksum()
+            if calculated_checksum != expected_checksum:
+                download.discard()
+                logging.error(f"Checksum verification failed. Expected: {expected_checksum}, "
+                              f"Calculated: {calculated_checksum}")
+                raise ValueError("Checksum verification failed")
 
-                gui.update_progress(50, "Download completed and verified!")
-                return file_path
+            download.finish()
+            logging.info(f"Download completed and verified: {file_path}")
+            gui.update_progress(50, "Download completed and verified!")
+            return file_path
 
         except urllib.error.HTTPError as e:
             logging.error(f"HTTP error on attempt {attempt}: {e.code} - {e.reason}")
@@ -801,6 +1022,9 @@ def download_update(gui, mode, checksum_info):
         except Exception as e:
             logging.error(f"Download attempt {attempt} failed: {str(e)}")
             gui.update_progress(0, f"Error: {str(e)}")
+        finally:
+            if download is not None:
+                download.close()
 
         if attempt < retries:
             logging.info(f"Retrying download (attempt {attempt + 1} of {retries})")
@@ -808,14 +1032,241 @@ def download_update(gui, mode, checksum_info):
         else:
             logging.error("All retry attempts failed")
 
-    if os.path.exists(file_path):
+    # The .part file and its manifest are left behind on purpose so the next run resumes where this one stopped
+    return None
+
+# Asks for the first byte only, a 206 answer means the server honors Range requests and tells the full size
+def probe_download(url):
+    headers = {"User-Agent": "TeraTermUI-Updater", "Range": "bytes=0-0"}
+    request = urllib.request.Request(url, headers=headers)
+    with urllib.request.urlopen(request, timeout=30) as response:
+        final_url = response.geturl()
+        content_range = response.getheader("content-range")
+        if response.status == 206 and content_range:
+            match = re.match(r"bytes\s+\d+-\d+/(\d+)", content_range)
+            if match:
+                return final_url, int(match.group(1)), True
+        total_length = response.getheader("content-length")
+        return final_url, int(total_length) if total_length is not None else None, False
+
+# Downloads a file into <file>.part over DOWNLOAD_SEGMENTS parallel Range requests, <file>.part.json records how far
+# every segment got so an interrupted update picks up from there, the SHA-256 follows the contiguous downloaded prefix
+# while the segments are still running so it's ready as soon as the last byte lands
+class RangedDownload:
+    def __init__(self, url, file_path, total_length, checksum, ranged):
+        self.url = url
+        self.file_path = file_path
+        self.part_path = file_path + ".part"
+        self.manifest_path = self.part_path + ".json"
+        self.total_length = total_length
+        self.expected_checksum = checksum
+        self.ranged = ranged
+        self.lock = threading.Lock()
+        self.sha256 = hashlib.sha256()
+        self.hashed = 0
+        self.error = None
+        self.segments = self.load_manifest()
+        if self.segments is None:
+            self.segments = self.split()
+            with open(self.part_path, "wb") as file:
+                file.truncate(total_length)
+            self.save_manifest()
+        # Unbuffered, a read-ahead buffer would hold on to bytes the segments haven't written yet
+        self.hash_file = open(self.part_path, "rb", buffering=0)
+
+    def split(self):
+        count = DOWNLOAD_SEGMENTS if self.ranged and self.total_length >= MIN_SEGMENT_SIZE * 2 else 1
+        count = min(count, max(1, self.total_length // MIN_SEGMENT_SIZE))
+        bounds = [self.total_length * i // count for i in range(count + 1)]
+        return [[bounds[i], bounds[i + 1], 0] for i in range(count)]
+
+    # A manifest is only trusted for the same file, size and checksum, and only when the server can serve ranges
+    def load_manifest(self):
+        if not self.ranged or not os.path.exists(self.manifest_path) or not os.path.exists(self.part_path):
+            return None
         try:
-            os.remove(file_path)
-            logging.info(f"Removed incomplete downloaded file: {file_path}")
-        except Exception as cleanup_error:
-            logging.error(f"Failed to remove incomplete file: {cleanup_error}")
+            with open(self.manifest_path, "r", encoding="utf-8") as file:
+                manifest = json.load(file)
+            if (manifest.get("size") != self.total_length or manifest.get("checksum") != self.expected_checksum
+                    or os.path.getsize(self.part_path) != self.total_length):
+                return None
+            segments = [[int(start), int(end), int(done)] for start, end, done in manifest["segments"]]
+            if segments[0][0] != 0 or segments[-1][1] != self.total_length:
+                return None
+            return segments
+        except (OSError, ValueError, KeyError, TypeError, IndexError) as e:
+            logging.warning(f"Ignoring unreadable download manifest: {e}")
+            return None
+
+    def save_manifest(self):
+        with self.lock:
+            manifest = {"size": self.total_length, "checksum": self.expected_checksum,
+                        "segments": [list(segment) for segment in self.segments]}
+        temp_manifest = self.manifest_path + ".tmp"
+        try:
+            with open(temp_manifest, "w", encoding="utf-8") as file:
+                json.dump(manifest, file)
+            os.replace(temp_manifest, self.manifest_path)
+        except OSError as e:
+            logging.warning(f"Failed to save download manifest: {e}")
+
+    def downloaded(self):
+        with self.lock:
+            return sum(done for _, _, done in self.segments)
+
+    # First byte no segment has written yet, everything before it is on disk
+    def contiguous(self):
+        with self.lock:
+            for start, end, done in self.segments:
+                if start + done < end:
+                    return start + done
+        return self.total_length
+
+    def advance_hash(self):
+        target = self.contiguous()
+        if target <= self.hashed:
+            return
+        self.hash_file.seek(self.hashed)
+        while self.hashed < target:
+            chunk = self.hash_file.read(min(CHUNK_SIZE, target - self.hashed))
+            if not chunk:
+                break
+            self.sha256.update(chunk)
+            self.hashed += len(chunk)
+
+    def checksum(self):
+        self.advance_hash()
+        return self.sha256.hexdigest()
+
+    def fetch_segment(self, index, gui):
+        attempt = 0
+        with open(self.part_path, "r+b") as file:
+            while not gui.cancel_requested:
+                with self.lock:
+                    start, end, done = self.segments[index]
+                if start + done >= end:
+                    return
+                headers = {"User-Agent": "TeraTermUI-Updater"}
+                if self.ranged:
+                    headers["Range"] = f"bytes={start + done}-{end - 1}"
+                try:
+                    request = urllib.request.Request(self.url, headers=headers)
+                    with urllib.request.urlopen(request, timeout=30) as response:
+                        if self.ranged and response.status != 206:
+                            raise ValueError(f"Server ignored the range request (status {response.status})")
+                        file.seek(start + done)
+                        while not gui.cancel_requested:
+                            if gui.pause_requested:
+                                time.sleep(0.1)
+                                continue
+                            chunk = response.read(min(CHUNK_SIZE, end - start - done))
+                            if not chunk:
+                                break
+                            file.write(chunk)
+                            # Bytes are only counted as done once the hashing handle can read them back
+                            file.flush()
+                            done += len(chunk)
+                            with self.lock:
+                                self.segments[index][2] = done
+                            if start + done >= end:
+                                break
+                    if start + done < end and not gui.cancel_requested:
+                        raise ValueError(f"Connection closed at byte {start + done} of segment {index}")
+                except Exception as e:
+                    attempt += 1
+                    if attempt >= MAX_RETRIES:
+                        self.error = e
+                        return
+                    logging.warning(f"Segment {index} failed (attempt {attempt} of {MAX_RETRIES}): {e}")
+                    if not self.ranged:
+                        self.restart()
+                    time.sleep(RETRY_DELAY * attempt)
+
+    # Without Range support a broken connection means starting the single segment and the checksum over
+    def restart(self):
+        with self.lock:
+            self.segments[0][2] = 0
+            self.sha256 = hashlib.sha256()
+            self.hashed = 0
+
+    def run(self, gui):
+        workers = [threading.Thread(target=self.fetch_segment, args=(index, gui), daemon=True)
+                   for index, (start, end, done) in enumerate(self.segments) if start + done < end]
+        for worker in workers:
+            worker.start()
+
+        last_update_time = time.time()
+        last_manifest_time = last_update_time
+        downloaded_at_last_update = self.downloaded()
+        last_progress_update = 0
+        while any(worker.is_alive() for worker in workers):
+            time.sleep(0.1)
+            if self.ranged:
+                self.advance_hash()
+            if gui.pause_requested:
+                last_update_time = time.time()
+                downloaded_at_last_update = self.downloaded()
+                continue
 
-    return None
+            current_time = time.time()
+            if current_time - last_manifest_time >= MANIFEST_SAVE_INTERVAL:
+                self.save_manifest()
+                last_manifest_time = current_time
+
+            downloaded = self.downloaded()
+            time_delta = current_time - last_update_time
+            current_percentage = (downloaded / self.total_length) * 100
+            if abs(current_percentage - last_progress_update) >= 1:
+                speed = (downloaded - downloaded_at_last_update) / time_delta
+                speed_text = f"{speed / 1024 / 1024:.1f} MB/s"
+                remaining_bytes = self.total_length - downloaded
+
+                if speed > 0:
+                    remaining_seconds = remaining_bytes / speed
+                    if remaining_seconds < 60:
+                        time_text = f"{remaining_seconds:.0f}s remaining"
+                    else:
+                        time_text = f"{remaining_seconds / 60:.1f}m remaining"
+                else:
+                    time_text = "calculating..."
+
+                progress_text = (f"Downloading Update: {int(current_percentage)}% "
+                                 f"({speed_text}, {time_text})")
+                gui.update_progress(10 + current_percentage * 0.4, progress_text)
+
+                last_progress_update = current_percentage
+                last_update_time = current_time
+                downloaded_at_last_update = downloaded
+
+                if int(current_percentage) % 10 == 0:
+                    logging.info(f"Download progress: {int(current_percentage)}% ({speed_text})")
+
+        for worker in workers:
+            worker.join()
+        self.save_manifest()
+
+    # Moves the verified .part file into place and drops the manifest
+    def finish(self):
+        self.close()
+        os.replace(self.part_path, self.file_path)
+        self.remove(self.manifest_path)
+
+    def discard(self):
+        self.close()
+        self.remove(self.part_path)
+        self.remove(self.manifest_path)
+
+    def close(self):
+        if not self.hash_file.closed:
+            self.hash_file.close()
+
+    @staticmethod
+    def remove(path):
+        if os.path.exists(path):
+            try:
+                os.remove(path)
+            except OSError as e:
+                logging.error(f"Failed to remove {path}: {e}")
 
 def install_extract_update(gui, mode, version, downloaded_file, app_directory):
     if gui.cancel_requested:
@@ -871,7 +1322,7 @@ def install_extract_update(gui, mode, version, downloaded_file, app_directory):
 
                             extracted_size += file.file_size
                             progress = (extracted_size / total_size) * 100
-                            gui.update_progress(50 + progress * 0.25, f"Extracting files: {int(progress)}%")
+                            gui.update_progress(50 + progress * 0.2, f"Extracting files: {int(progress)}%")
 
                     nested_dir = os.path.join(gui.temp_extract_folder, "TeraTermUI")
                     if os.path.exists(nested_dir) and not os.listdir(nested_dir):
@@ -911,48 +1362,32 @@ def install_extract_update(gui, mode, version, downloaded_file, app_directory):
                 logging.error("Insufficient disk space for backup")
                 return False
 
+            # The application files are untouched until the backup is complete, so cancelling before then only
+            # discards the (possibly partial) backup folder instead of restoring from it
+            gui.current_stage = "backing_up"
             try:
-                shutil.copytree(app_directory, backup_folder)
+                os.makedirs(backup_folder, exist_ok=True)
+                sync_tree(app_directory, backup_folder, gui, 70, 75, "Backing up files", link=True)
                 logging.info(f"Backup created: {backup_folder}")
             except Exception as e:
                 logging.error(f"Backup creation failed: {e}")
+                gui.current_stage = "backup_failed"
                 return False
 
+            if gui.cancel_requested:
+                logging.info("Update cancelled during backup")
+                gui.current_stage = "backup_cancelled"
+                return False
             gui.current_stage = "updating"
             gui.update_progress(75, "Updating files...")
 
             try:
-                total_files = sum(len(files) for _, _, files in os.walk(gui.temp_extract_folder))
-                processed_files = 0
-                updated_files = 0
-                skipped_files = 0
-
-                for root, _, files in os.walk(gui.temp_extract_folder):
-                    for file in files:
-                        if gui.cancel_requested:
-                            logging.info("Update cancelled during file copying")
-                            return False
-                        while gui.pause_requested and not gui.cancel_requested:
-                            time.sleep(0.1)
-
-                        if not should_update_db and file == "database.db":
-                            continue
-
-                        src_file = os.path.join(root, file)
-                        rel_path = os.path.relpath(src_file, gui.temp_extract_folder)
-                        dest_file = os.path.join(app_directory, rel_path)
-
-                        os.makedirs(os.path.dirname(dest_file), exist_ok=True)
-
-                        if os.path.exists(dest_file) and files_are_identical(src_file, dest_file):
-                            skipped_files += 1
-                        else:
-                            shutil.copy2(src_file, dest_file)
-                            updated_files += 1
-
-                        processed_files += 1
-                        progress = (processed_files / total_files) * 100
-                        gui.update_progress(75 + progress * 0.2, f"Updating files: {int(progress)}%")
+                updated_files, skipped_files = sync_tree(
+                    gui.temp_extract_folder, app_directory, gui, 75, 95, "Updating files", compare=True,
+                    skip=lambda rel_path: not should_update_db and os.path.basename(rel_path) == "database.db")
+                if gui.cancel_requested:
+                    logging.info("Update cancelled during file copying")
+                    return False
 
                 logging.info(f"Update complete. Files updated: {updated_files}, skipped (unchanged): {skipped_files}")
 
@@ -1159,13 +1594,29 @@ def restore_from_backup(app_directory, backup_folder):
                 except Exception as e:
                     logging.error(f"Failed to remove {entry.path}: {e}")
 
-        shutil.copytree(backup_folder, app_directory, dirs_exist_ok=True)
+        sync_tree(backup_folder, app_directory, link=True)
         logging.info(f"Successfully restored from backup: {backup_folder}")
 
     except Exception as e:
         logging.error(f"Failed to restore from backup: {e}")
         raise
 
+# A delta backup only holds the files that were replaced, so those are copied back and the files the update added
+# are removed, the rest of the app directory is left alone
+def restore_delta_backup(app_directory, backup_folder, created_files):
+    try:
+        for created_file in created_files:
+            if os.path.exists(created_file):
+                os.remove(created_file)
+
+        if backup_folder and os.path.exists(backup_folder):
+            sync_tree(backup_folder, app_directory, link=True)
+        logging.info(f"Successfully restored from delta backup: {backup_folder}")
+
+    except Exception as e:
+        logging.error(f"Failed to restore from delta backup: {e}")
+        raise
+
 def check_update_success(app_directory, version):
     logging.info(f"Performing update verification for version {version}")
     required_files = ["TeraTermUI.exe", "VERSION.txt"]